@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark compile latency with and without precompiled format files.
+
+Requires pdflatex on the PATH. Run from the latex-service directory:
+
+    python3 benchmarks/bench_format_files.py --runs 20
+"""
+
+import sys
+import time
+import argparse
+import statistics
+import tempfile
+from pathlib import Path
+
+SERVICE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SERVICE_DIR / 'src'))
+
+from format_cache import FormatCache  # noqa: E402
+from latex_compiler import LaTeXCompiler  # noqa: E402
+
+SAMPLE_CONTENT = {
+    'personalInfo': {
+        'name': 'John Doe',
+        'email': 'john.doe@example.com',
+        'phone': '(555) 123-4567',
+        'location': 'San Francisco, CA'
+    },
+    'summary': 'Experienced software engineer with 5+ years in full-stack development',
+    'experience': [
+        {
+            'title': 'Senior Software Engineer',
+            'company': 'Tech Corp',
+            'duration': '2021 - Present',
+            'bullets': [
+                'Led development of microservices architecture',
+                'Improved system performance by 40%'
+            ]
+        }
+    ],
+    'education': [
+        {'degree': 'B.S. Computer Science', 'school': 'University of California', 'year': '2019'}
+    ],
+    'skills': ['Python', 'JavaScript', 'React', 'Node.js', 'Docker'],
+    'certifications': []
+}
+
+
+def time_compiles(compiler: LaTeXCompiler, template: dict, runs: int) -> list:
+    """Compile the sample resume repeatedly and return latencies in milliseconds."""
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        compiler.compile_resume(template=template, content=SAMPLE_CONTENT)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def summarize(label: str, latencies: list):
+    """Print summary statistics for a set of latencies."""
+    print(f"{label:<16} mean {statistics.mean(latencies):8.1f} ms   "
+          f"median {statistics.median(latencies):8.1f} ms   "
+          f"min {min(latencies):8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--template', default='ats-friendly-single-column')
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    template_dir = SERVICE_DIR / 'templates' / args.template
+    latex_source = (template_dir / 'template.tex').read_text(encoding='utf-8')
+
+    with tempfile.TemporaryDirectory() as format_dir:
+        format_info = FormatCache(format_dir).ensure_format(args.template, latex_source)
+        if not format_info:
+            print(f"Template {args.template} cannot use a precompiled format")
+            return 1
+
+        compiler = LaTeXCompiler()
+        plain_template = {'id': args.template, 'latex_source': latex_source, 'format': None}
+        format_template = dict(plain_template, format=format_info)
+
+        # Warm up the TeX file caches before measuring
+        time_compiles(compiler, plain_template, 1)
+        time_compiles(compiler, format_template, 1)
+
+        plain = time_compiles(compiler, plain_template, args.runs)
+        with_format = time_compiles(compiler, format_template, args.runs)
+
+    summarize('full preamble', plain)
+    summarize('precompiled fmt', with_format)
+    saved = statistics.median(plain) - statistics.median(with_format)
+    print(f"median saving    {saved:8.1f} ms per compile")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
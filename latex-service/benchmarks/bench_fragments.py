@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark LaTeX source generation with and without the fragment cache.
+
+Times _generate_latex_source on synthetic resumes uncached, with the
+fragment cache warm and unchanged, and after a one-bullet edit, the case
+the cache exists for. Run from the latex-service directory:
+
+    python3 benchmarks/bench_fragments.py
+
+No document is compiled, so the pdflatex stub in benchmarks/fake-texlive
+is always put first on the PATH.
+"""
+
+import os
+import sys
+import random
+import tempfile
+import timeit
+from itertools import count
+from pathlib import Path
+
+from bench_pipeline import SIZES, make_resume
+
+SERVICE_DIR = Path(__file__).resolve().parent.parent
+FAKE_TEXLIVE_DIR = Path(__file__).resolve().parent / 'fake-texlive'
+sys.path.insert(0, str(SERVICE_DIR / 'src'))
+
+
+def bench(label: str, fn, number: int):
+    """Time a callable and print microseconds per call."""
+    seconds = min(timeit.repeat(fn, number=number, repeat=5))
+    print(f"{label:<40} {seconds / number * 1e6:10.2f} us/call")
+
+
+def main():
+    os.environ['PATH'] = f"{FAKE_TEXLIVE_DIR}{os.pathsep}{os.environ['PATH']}"
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.environ.setdefault('LATEX_SCRATCH_DIR', str(Path(work_dir) / 'scratch'))
+        os.environ.setdefault('LATEX_INSTALL_MARKER', str(Path(work_dir) / 'latex-installation.json'))
+
+        from fragment_cache import FragmentCache
+        from latex_compiler import LaTeXCompiler
+        from template_renderer import CompiledTemplate
+
+        template_file = SERVICE_DIR / 'templates' / 'ats-friendly-single-column' / 'template.tex'
+        template = {'renderer': CompiledTemplate(template_file.read_text(encoding='utf-8'))}
+
+        uncached = LaTeXCompiler()
+        cached = LaTeXCompiler(fragment_cache=FragmentCache(), scratch_space=uncached.scratch_space)
+
+        rng = random.Random(1234)
+        for label, experiences, bullets, skills in SIZES:
+            if label not in ('s', 'xl'):
+                continue
+
+            content = make_resume(rng, experiences, bullets, skills)
+            edits = count()
+
+            def edit_one_bullet():
+                # A new bullet text on every call, so the edited item always misses
+                content['experience'][0]['bullets'][0] = f"Edited bullet {next(edits)}"
+                cached._generate_latex_source(template, content, {})
+
+            number = 2000 if label == 's' else 100
+            print(f"{label}: {experiences} experiences x {bullets} bullets, {skills} skills")
+            bench('  uncached', lambda: uncached._generate_latex_source(template, content, {}), number)
+            bench('  fragment cache, unchanged', lambda: cached._generate_latex_source(template, content, {}),
+                  number)
+            bench('  fragment cache, one-bullet edit', edit_one_bullet, number)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
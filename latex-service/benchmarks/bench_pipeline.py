@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Benchmark the compile pipeline on synthetic resumes of increasing size.
+
+Measures p50/p99 latency and throughput of request validation, LaTeX
+escaping, LaTeX source generation and the end-to-end compile, and prints
+the results as JSON so runs can be compared. Run from the latex-service
+directory:
+
+    python3 benchmarks/bench_pipeline.py --fake-pdflatex --output results.json
+
+--fake-pdflatex puts the stub in benchmarks/fake-texlive first on the PATH,
+so the Python-side stages can be measured without TeX Live; the
+end-to-end numbers then exclude typesetting.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import statistics
+from pathlib import Path
+
+SERVICE_DIR = Path(__file__).resolve().parent.parent
+FAKE_TEXLIVE_DIR = Path(__file__).resolve().parent / 'fake-texlive'
+sys.path.insert(0, str(SERVICE_DIR / 'src'))
+
+# (label, experiences, bullets per experience, skills)
+SIZES = [
+    ('xs', 1, 3, 10),
+    ('s', 5, 5, 40),
+    ('m', 10, 10, 100),
+    ('l', 25, 15, 250),
+    ('xl', 50, 20, 500)
+]
+
+WORDS = [
+    'led', 'migration', 'of', 'the', 'billing', 'platform', 'to', 'Kubernetes', 'cut',
+    'p99', 'latency', 'by', '40%', '&', 'saved', '$1.2M', 'across', '3', 'regions',
+    'team_of_8', 'C#', 'R&D', 'designed', 'event-driven', 'pipelines', 'for', '~10k',
+    'requests/s', 'mentored', 'engineers', 'on', '{{NAME}}', 'code', 'review'
+]
+SKILLS = [
+    'Python', 'Go', 'C++', 'C#', 'Node.js', 'TypeScript', 'React', 'SQL', 'PostgreSQL',
+    'Redis', 'Kafka', 'AWS', 'GCP', 'Docker', 'Kubernetes', 'Terraform', 'CI/CD', 'R&D'
+]
+
+
+def make_resume(rng: random.Random, experiences: int, bullets: int, skills: int) -> dict:
+    """Generate a synthetic resume with LaTeX special characters in its text."""
+    def sentence(length):
+        return ' '.join(rng.choice(WORDS) for _ in range(length))
+
+    return {
+        'personalInfo': {
+            'name': 'Jordan Example',
+            'email': 'jordan@example.com',
+            'phone': '(555) 123-4567',
+            'location': 'San Francisco, CA'
+        },
+        'summary': sentence(60),
+        'experience': [
+            {
+                'title': f"Senior Engineer {index}",
+                'company': f"Company {index} & Sons",
+                'duration': f"{2000 + index % 20} - {2001 + index % 20}",
+                'bullets': [sentence(rng.randint(12, 30)) for _ in range(bullets)]
+            }
+            for index in range(experiences)
+        ],
+        'education': [
+            {'degree': 'B.S. Computer Science', 'school': 'State University', 'year': '2012'}
+        ],
+        'skills': [f"{rng.choice(SKILLS)} {index}" for index in range(skills)],
+        'certifications': [
+            {'name': 'AWS Solutions Architect', 'issuer': 'Amazon', 'date': '2021'},
+            'Kubernetes Administrator (CKA)'
+        ]
+    }
+
+
+def resume_strings(content: dict) -> list:
+    """Collect every string in a resume, as sanitize_latex_content sees them."""
+    if isinstance(content, str):
+        return [content]
+    if isinstance(content, dict):
+        return [s for value in content.values() for s in resume_strings(value)]
+    if isinstance(content, list):
+        return [s for value in content for s in resume_strings(value)]
+    return []
+
+
+def measure(fn, iterations: int, warmup: int = 2) -> dict:
+    """Run a callable repeatedly and summarize its latency and throughput."""
+    for _ in range(warmup):
+        fn()
+
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - start) * 1000)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'iterations': iterations,
+        'p50Ms': round(statistics.median(latencies), 4),
+        'p99Ms': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))], 4),
+        'meanMs': round(statistics.mean(latencies), 4),
+        'throughputPerSec': round(iterations / elapsed, 2) if elapsed else None
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--template', default='ats-friendly-single-column')
+    parser.add_argument('--engine', default=None,
+                        help="TeX engine to compile with (default: the template's engine)")
+    parser.add_argument('--iterations', type=int, default=50,
+                        help='timed runs of each in-process stage')
+    parser.add_argument('--compile-iterations', type=int, default=10,
+                        help='timed runs of the end-to-end compile')
+    parser.add_argument('--sizes', default=','.join(label for label, *_ in SIZES),
+                        help='comma-separated size labels to run')
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--fake-pdflatex', action='store_true',
+                        help='use the pdflatex stub instead of TeX Live')
+    parser.add_argument('--output', help='write JSON results to this file instead of stdout')
+    args = parser.parse_args()
+
+    if args.fake_pdflatex:
+        os.environ['PATH'] = f"{FAKE_TEXLIVE_DIR}{os.pathsep}{os.environ['PATH']}"
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        # Keep benchmark scratch files and formats out of the service's directories
+        os.environ.setdefault('LATEX_SCRATCH_DIR', str(Path(work_dir) / 'scratch'))
+        os.environ.setdefault('LATEX_FORMAT_DIR', str(Path(work_dir) / 'formats'))
+        os.environ.setdefault('COMPILE_WORKERS', '1')
+        logging_level = os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+        import logging
+        logging.basicConfig(level=getattr(logging, logging_level))
+
+        from format_cache import FormatCache
+        from latex_compiler import LaTeXCompiler
+        from tex_engines import get_engine
+        from template_renderer import CompiledTemplate
+        from utils.validation import validate_compile_request, sanitize_latex_content
+
+        template_dir = SERVICE_DIR / 'templates' / args.template
+        latex_source = (template_dir / 'template.tex').read_text(encoding='utf-8')
+        metadata = json.loads((template_dir / 'metadata.json').read_text(encoding='utf-8'))
+        engine = get_engine(args.engine or metadata.get('engine'))
+        template = {
+            'id': args.template,
+            'latex_source': latex_source,
+            'renderer': CompiledTemplate(latex_source),
+            'engine': engine.name,
+            'format': FormatCache().ensure_format(args.template, latex_source)
+            if engine.supports_formats else None
+        }
+
+        # No result or fragment cache: every run does the full work
+        compiler = LaTeXCompiler()
+
+        wanted = set(args.sizes.split(','))
+        rng = random.Random(args.seed)
+        results = []
+        for label, experiences, bullets, skills in SIZES:
+            if label not in wanted:
+                continue
+
+            content = make_resume(rng, experiences, bullets, skills)
+            request_data = {'templateId': args.template, 'content': content}
+            strings = resume_strings(content)
+
+            stages = {
+                'validate_compile_request': (
+                    lambda: validate_compile_request(request_data), args.iterations),
+                'sanitize_latex_content': (
+                    lambda: [sanitize_latex_content(s) for s in strings], args.iterations),
+                '_generate_latex_source': (
+                    lambda: compiler._generate_latex_source(template, content, {}),
+                    args.iterations),
+                'compile_end_to_end': (
+                    lambda: compiler.compile_resume(template, content, {}, check_cache=False),
+                    args.compile_iterations)
+            }
+
+            for stage, (fn, iterations) in stages.items():
+                results.append({
+                    'size': label,
+                    'experiences': experiences,
+                    'bulletsPerExperience': bullets,
+                    'skills': skills,
+                    'strings': len(strings),
+                    'stage': stage,
+                    **measure(fn, iterations)
+                })
+                print(f"{label:<3} {stage:<26} p50 {results[-1]['p50Ms']:10.3f} ms  "
+                      f"p99 {results[-1]['p99Ms']:10.3f} ms", file=sys.stderr)
+
+    report = {
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpuCount': os.cpu_count(),
+            'pdflatex': 'stub' if args.fake_pdflatex else 'texlive',
+            'stubDelayMs': float(os.getenv('FAKE_PDFLATEX_DELAY_MS', '0')) if args.fake_pdflatex else None
+        },
+        'config': {
+            'template': args.template,
+            'engine': engine.name,
+            'iterations': args.iterations,
+            'compileIterations': args.compile_iterations,
+            'seed': args.seed
+        },
+        'results': results
+    }
+
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload + '\n', encoding='utf-8')
+    else:
+        print(payload)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
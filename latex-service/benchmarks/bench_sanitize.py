@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for LaTeX escaping.
+
+Compares sanitize_latex_content against the previous chained str.replace
+implementation, which re-escaped the sequences it inserted. Run from the latex-service directory:
+
+    python3 benchmarks/bench_sanitize.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+SERVICE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SERVICE_DIR / 'src'))
+
+from utils.validation import sanitize_content_tree, sanitize_latex_content  # noqa: E402
+
+
+def legacy_sanitize_latex_content(content: str) -> str:
+    """The previous implementation: one str.replace pass per special character."""
+    special_chars = {
+        '&': r'\&',
+        '%': r'\%',
+        '$': r'\$',
+        '#': r'\#',
+        '^': r'\textasciicircum{}',
+        '_': r'\_',
+        '{': r'\{',
+        '}': r'\}',
+        '~': r'\textasciitilde{}',
+        '\\': r'\textbackslash{}'
+    }
+
+    result = content
+    for char, escaped in special_chars.items():
+        result = result.replace(char, escaped)
+
+    return result
+
+
+SKILLS = ['Python', 'C#', 'C++', 'Node.js', 'R&D', 'SQL', 'AWS', 'Docker', 'CI/CD', 'TypeScript'] * 30
+BULLET = 'Improved p99 latency by 40% & cut infra costs by $1.2M across 3 regions (team_of_8)'
+PARAGRAPH = ' '.join([BULLET] * 20)
+PLAIN_PARAGRAPH = ' '.join(['Led the migration of twelve services to a shared platform'] * 20)
+CONTENT = {
+    'personalInfo': {'name': 'Jordan Example', 'email': 'jordan_example@example.com'},
+    'summary': PARAGRAPH,
+    'experience': [
+        {'title': 'Senior Engineer', 'company': 'Tech & Co', 'duration': '2019 - 2024',
+         'bullets': [BULLET] * 10}
+    ] * 10,
+    'skills': SKILLS
+}
+
+
+def bench(label: str, fn, number: int):
+    """Time a callable and print microseconds per call."""
+    seconds = min(timeit.repeat(fn, number=number, repeat=5))
+    print(f"{label:<40} {seconds / number * 1e6:10.2f} us/call")
+
+
+def main():
+    bench('skills list, legacy', lambda: [legacy_sanitize_latex_content(s) for s in SKILLS], 200)
+    bench('skills list, current + memo', lambda: [sanitize_latex_content(s) for s in SKILLS], 200)
+    bench('bullet, legacy', lambda: legacy_sanitize_latex_content(BULLET), 20000)
+    bench('bullet, current', lambda: sanitize_latex_content(BULLET), 20000)
+    bench('paragraph, legacy', lambda: legacy_sanitize_latex_content(PARAGRAPH), 5000)
+    bench('paragraph, current', lambda: sanitize_latex_content(PARAGRAPH), 5000)
+    bench('plain paragraph, legacy', lambda: legacy_sanitize_latex_content(PLAIN_PARAGRAPH), 5000)
+    bench('plain paragraph, current', lambda: sanitize_latex_content(PLAIN_PARAGRAPH), 5000)
+    bench('content tree, sanitize_content_tree', lambda: sanitize_content_tree(CONTENT), 200)
+
+    print()
+    print(f"legacy output of '&':      {legacy_sanitize_latex_content('&')}")
+    print(f"current output of '&':     {sanitize_latex_content('&')}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""
+Admission control for synchronous compiles.
+
+This module caps the number of compiles a request thread may have in
+flight, bounds how long a request waits for a slot, and estimates a
+Retry-After from recent compile latency so saturated instances shed load
+instead of queueing work that clients will have abandoned.
+"""
+
+import os
+import math
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional
+
+from utils.error_handling import CompileQueueFullError
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest sample in the latency moving average
+LATENCY_EWMA_ALPHA = 0.2
+
+# Bounds on the Retry-After returned to rejected clients, in seconds
+MIN_RETRY_AFTER = 1
+MAX_RETRY_AFTER = 120
+
+
+class AdmissionController:
+    """Limits in-flight compiles and rejects requests that would wait too long."""
+
+    def __init__(self, max_in_flight: Optional[int] = None, max_queue_wait: Optional[float] = None):
+        if max_in_flight is None:
+            max_in_flight = int(os.getenv(
+                'COMPILE_MAX_IN_FLIGHT', os.getenv('COMPILE_WORKERS', os.cpu_count() or 1)
+            ))
+        if max_queue_wait is None:
+            max_queue_wait = float(os.getenv('COMPILE_MAX_QUEUE_WAIT_SECONDS', 10))
+
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_queue_wait = max(0.0, max_queue_wait)
+
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiting = 0
+        self._rejected = 0
+        self._latency_ewma: Optional[float] = None
+
+    @contextmanager
+    def admit(self) -> Iterator[float]:
+        """
+        Hold an in-flight slot for the duration of a compile.
+
+        Waits up to max_queue_wait seconds for a slot, yields the seconds
+        spent waiting, and records how long the admitted block took in the
+        latency average.
+
+        Raises:
+            CompileQueueFullError: If no slot frees up in time; its
+                retry_after holds the suggested Retry-After in seconds
+        """
+        with self._lock:
+            self._waiting += 1
+        wait_started = time.perf_counter()
+        try:
+            admitted = self._slots.acquire(timeout=self.max_queue_wait)
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+        if not admitted:
+            with self._lock:
+                self._rejected += 1
+            raise CompileQueueFullError(
+                f"Compile capacity saturated; waited {self.max_queue_wait:g}s for a slot",
+                retry_after=self.retry_after()
+            )
+
+        with self._lock:
+            self._in_flight += 1
+        started = time.perf_counter()
+        try:
+            yield started - wait_started
+        finally:
+            self.record_latency(time.perf_counter() - started)
+            with self._lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+    def record_latency(self, seconds: float):
+        """Fold a compile duration into the moving average."""
+        with self._lock:
+            if self._latency_ewma is None:
+                self._latency_ewma = seconds
+            else:
+                self._latency_ewma += LATENCY_EWMA_ALPHA * (seconds - self._latency_ewma)
+
+    def retry_after(self) -> int:
+        """
+        Estimate when a slot is likely to be free.
+
+        Returns:
+            Seconds for the time the current backlog takes to drain at the
+            recent average compile latency, clamped to a sane range
+        """
+        with self._lock:
+            latency = self._latency_ewma if self._latency_ewma is not None else 1.0
+            backlog = self._in_flight + self._waiting
+        estimate = math.ceil(latency * max(1, backlog) / self.max_in_flight)
+        return min(MAX_RETRY_AFTER, max(MIN_RETRY_AFTER, estimate))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return in-flight, waiting and rejection counts.
+
+        'saturation' is the demand for compile slots relative to the limit;
+        at 1.0 or above a new request would have to wait.
+        """
+        with self._lock:
+            demand = self._in_flight + self._waiting
+            return {
+                'inFlight': self._in_flight,
+                'maxInFlight': self.max_in_flight,
+                'waiting': self._waiting,
+                'maxQueueWaitSeconds': self.max_queue_wait,
+                'rejected': self._rejected,
+                'latencyEwmaSeconds': round(self._latency_ewma, 3)
+                if self._latency_ewma is not None else None,
+                'saturation': round(demand / self.max_in_flight, 3),
+                'saturated': demand >= self.max_in_flight
+            }
@@ -6,17 +6,55 @@ A Flask-based microservice for generating PDF resumes from LaTeX templates.
 Designed to run on Google Cloud Run with Firebase integration.
 """
 
+import time
+
+# Measured before the other imports so startup time includes them
+_startup_started = time.perf_counter()
+
 import os
+import io
+import re
+import base64
 import logging
 import json
-from flask import Flask, request, jsonify
+from typing import Optional
+from contextlib import ExitStack
+from concurrent.futures import FIRST_COMPLETED, CancelledError, wait
+from flask import Flask, Response, request, jsonify, send_file
 from werkzeug.exceptions import BadRequest, InternalServerError
-from google.cloud import logging as cloud_logging
 
-from latex_compiler import LaTeXCompiler
+from admission_control import AdmissionController
+from format_cache import FormatCache
+from fragment_cache import FragmentCache
+from compile_executor import CompileExecutor
+from compile_jobs import CompileJobStore
+from compile_sessions import CompileCancellation, CompileSessions
+from latex_compiler import LaTeXCompiler, OUTPUT_BASE64, OUTPUT_FILE, PREVIEW_DEFAULT_DPI
+from metrics import (
+    COMPILES_QUEUED, COMPILES_REJECTED, COMPILES_SUPERSEDED, FAILURE_VALIDATION, FIRST_SUCCESS_SECONDS,
+    STARTUP_SECONDS, record_failure, render_metrics
+)
+from response_compression import compress_response
+from result_cache import CompileResultCache
+from scratch_space import ScratchSpace
+from template_catalog import CatalogResponse, TemplateCatalog
 from template_manager import TemplateManager
-from utils.validation import validate_compile_request
-from utils.error_handling import handle_error
+from template_previews import TemplatePreviewCache
+from utils.validation import (
+    validate_compile_request, validate_batch_request, validate_batch_variant
+)
+from utils.error_handling import (
+    handle_error, CompileQueueFullError, CompileSupersededError, LaTeXCompilationError,
+    RasterizationError, TemplateNotFoundError
+)
+from utils.timing import PhaseTimer
+
+# Endpoints whose first successful response is recorded as a cold start metric
+STARTUP_TRACKED_ENDPOINTS = ('/health', '/compile')
+
+# Browser and CDN cache lifetime for template catalog responses; clients
+# revalidate with If-None-Match afterwards
+CATALOG_MAX_AGE = int(os.getenv('TEMPLATE_CATALOG_MAX_AGE', 60))
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -24,7 +62,9 @@ app = Flask(__name__)
 # Configure logging
 try:
     if os.getenv('GOOGLE_CLOUD_PROJECT') and os.getenv('GOOGLE_APPLICATION_CREDENTIALS'):
-        # Use Google Cloud Logging in production
+        # Use Google Cloud Logging in production; imported only here because
+        # the client library takes a large share of cold start time
+        from google.cloud import logging as cloud_logging
         cloud_logging_client = cloud_logging.Client()
         cloud_logging_client.setup_logging()
     else:
@@ -39,8 +79,50 @@ except Exception:
 logger = logging.getLogger(__name__)
 
 # Initialize services
-template_manager = TemplateManager()
-latex_compiler = LaTeXCompiler()
+template_manager = TemplateManager(format_cache=FormatCache())
+result_cache = CompileResultCache()
+fragment_cache = FragmentCache()
+compile_executor = CompileExecutor()
+admission = AdmissionController()
+scratch_space = ScratchSpace(slots=compile_executor.max_workers)
+scratch_space.start_sweeper()
+latex_compiler = LaTeXCompiler(
+    result_cache=result_cache,
+    fragment_cache=fragment_cache,
+    scratch_space=scratch_space
+)
+compile_jobs = CompileJobStore()
+compile_sessions = CompileSessions()
+template_previews = TemplatePreviewCache(template_manager, latex_compiler)
+template_catalog = TemplateCatalog(template_manager, preview_available=template_previews.available)
+COMPILES_QUEUED.set_function(lambda: compile_executor.stats()['queued'])
+template_manager.add_invalidation_listener(result_cache.invalidate_template)
+
+# Cold start measurements: module initialization, then the first successful
+# response of each endpoint that gates traffic on a new instance
+startup_seconds = time.perf_counter() - _startup_started
+first_success_seconds = {}
+STARTUP_SECONDS.set(startup_seconds)
+logger.info(f"Service initialized in {startup_seconds * 1000:.1f}ms")
+
+
+@app.after_request
+def record_first_success(response):
+    """Record time from startup to the first successful /health and /compile."""
+    endpoint = request.path
+    if endpoint in STARTUP_TRACKED_ENDPOINTS and endpoint not in first_success_seconds \
+            and response.status_code < 400:
+        elapsed = time.perf_counter() - _startup_started
+        first_success_seconds.setdefault(endpoint, elapsed)
+        FIRST_SUCCESS_SECONDS.labels(endpoint).set(elapsed)
+        logger.info(f"First successful {endpoint} {elapsed * 1000:.1f}ms after startup")
+    return response
+
+
+@app.after_request
+def compress(response):
+    """Compress JSON and text responses for clients that accept gzip or brotli."""
+    return compress_response(response, request.accept_encodings, request.if_none_match)
 
 
 @app.route('/health', methods=['GET'])
@@ -49,19 +131,60 @@ def health_check():
     return jsonify({
         'status': 'healthy',
         'service': 'latex-resume-service',
-        'version': '1.0.0'
+        'version': '1.0.0',
+        'compileQueue': compile_executor.stats(),
+        'compileSessions': compile_sessions.stats(),
+        'scratch': scratch_space.usage(),
+        'startup': {
+            'initSeconds': round(startup_seconds, 4),
+            'firstSuccessSeconds': {
+                endpoint: round(seconds, 4) for endpoint, seconds in first_success_seconds.items()
+            }
+        }
     }), 200
 
 
+@app.route('/ready', methods=['GET'])
+def readiness_check():
+    """Readiness endpoint reporting whether the instance can take another compile now."""
+    admission_stats = admission.stats()
+    queue_stats = compile_executor.stats()
+    saturated = admission_stats['saturated'] or \
+        queue_stats['queued'] >= queue_stats['maxQueue'] > 0
+
+    response = jsonify({
+        'status': 'saturated' if saturated else 'ready',
+        'admission': admission_stats,
+        'compileQueue': queue_stats
+    })
+    if saturated:
+        response.headers['Retry-After'] = str(admission.retry_after())
+        return response, 503
+    return response, 200
+
+
+def _catalog_response(catalog_response: CatalogResponse):
+    """
+    Serve a prebuilt catalog body, answering revalidations with 304.
+
+    Args:
+        catalog_response: Prebuilt body and strong ETag
+
+    Returns:
+        Flask response
+    """
+    response = Response(catalog_response.body, mimetype='application/json')
+    response.set_etag(catalog_response.etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = CATALOG_MAX_AGE
+    return response.make_conditional(request)
+
+
 @app.route('/templates', methods=['GET'])
 def get_templates():
     """Get list of available templates."""
     try:
-        templates = template_manager.list_templates()
-        return jsonify({
-            'success': True,
-            'templates': templates
-        }), 200
+        return _catalog_response(template_catalog.listing())
     except Exception as e:
         logger.error(f"Error listing templates: {str(e)}")
         return handle_error(e, "Failed to list templates")
@@ -71,68 +194,382 @@ def get_templates():
 def get_template_info(template_id):
     """Get detailed information about a specific template."""
     try:
-        template_info = template_manager.get_template_info(template_id)
-        if not template_info:
+        template_details = template_catalog.details(template_id)
+        if template_details is None:
             return jsonify({
                 'success': False,
                 'error': f'Template {template_id} not found'
             }), 404
 
-        return jsonify({
-            'success': True,
-            'template': template_info
-        }), 200
+        return _catalog_response(template_details)
     except Exception as e:
         logger.error(f"Error getting template info: {str(e)}")
         return handle_error(e, "Failed to get template information")
 
 
+@app.route('/templates/<template_id>/preview', methods=['GET'])
+def get_template_preview(template_id):
+    """Get a template's preview image, rendering it from sample content on first use."""
+    try:
+        preview_path = template_previews.find(template_id)
+        if preview_path is None:
+            # Fail before taking a compile slot when there is nothing to render with
+            if not template_previews.available(template_id):
+                raise RasterizationError("Ghostscript (gs) is not installed")
+            # Rendering compiles a sample resume, so it shares the compile
+            # workers and is admitted and shed like /compile
+            with admission.admit():
+                preview_path = compile_executor.submit(template_previews.render, template_id).result()
+
+        # Sent as a file so the WSGI server can use sendfile; the ETag comes
+        # from the file's name, size and mtime
+        return send_file(
+            preview_path,
+            mimetype='image/png',
+            conditional=True,
+            etag=True,
+            max_age=CATALOG_MAX_AGE
+        )
+
+    except TemplateNotFoundError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 404
+    except CompileQueueFullError as e:
+        return _overloaded_response(e)
+    except RasterizationError as e:
+        logger.warning(f"Preview unavailable for template {template_id}: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': f'Preview not available for template {template_id}'
+        }), 404
+    except Exception as e:
+        logger.error(f"Error getting template preview: {str(e)}")
+        return handle_error(e, "Failed to get template preview")
+
+
+@app.route('/cache/stats', methods=['GET'])
+def get_cache_stats():
+    """Get PDF result and LaTeX fragment cache hit/miss statistics."""
+    return jsonify({
+        'success': True,
+        'pdfCache': result_cache.stats(),
+        'fragmentCache': fragment_cache.stats()
+    }), 200
+
+
+@app.route('/metrics', methods=['GET'])
+def get_metrics():
+    """Expose compile pipeline metrics for Prometheus scraping."""
+    payload, content_type = render_metrics()
+    return Response(payload, content_type=content_type)
+
+
+def _validation_error_response():
+    """
+    Validate the JSON body of a compile request.
+
+    Returns:
+        Error response tuple, or None if the request is valid
+    """
+    if not request.is_json:
+        raise BadRequest("Request must be JSON")
+
+    validation_errors = validate_compile_request(request.get_json())
+    if validation_errors:
+        record_failure(FAILURE_VALIDATION)
+        return jsonify({
+            'success': False,
+            'error': 'Validation failed',
+            'details': validation_errors
+        }), 400
+
+    return None
+
+
+def _overloaded_response(error: CompileQueueFullError):
+    """
+    Build a 429 response telling the client when to retry.
+
+    Args:
+        error: Rejection from the admission controller or the compile queue
+
+    Returns:
+        Response tuple with a Retry-After header
+    """
+    retry_after = error.retry_after or admission.retry_after()
+    logger.warning(f"Rejected compile: {str(error)}; retry after {retry_after}s")
+    COMPILES_REJECTED.inc()
+
+    response = jsonify({
+        'success': False,
+        'error': str(error),
+        'retryAfter': retry_after
+    })
+    response.headers['Retry-After'] = str(retry_after)
+    return response, 429
+
+
+def _wants_pdf() -> bool:
+    """Check whether the client asked for a binary PDF instead of JSON."""
+    best = request.accept_mimetypes.best_match(['application/json', 'application/pdf'])
+    return best == 'application/pdf'
+
+
+def _pdf_response(result):
+    """
+    Build a binary PDF response with the compile metadata in headers.
+
+    Args:
+        result: Compile result with 'pdf_path', 'pdf_bytes' or 'pdf_base64'
+
+    Returns:
+        Flask response streaming the PDF
+    """
+    if 'pdf_path' in result:
+        # Unlink right away; the open handle keeps the data readable while
+        # send_file streams it (sendfile under gunicorn) without loading it
+        # into memory
+        pdf_file = open(result['pdf_path'], 'rb')
+        result['pdf_path'].unlink(missing_ok=True)
+        response = send_file(pdf_file, mimetype='application/pdf',
+                             download_name='resume.pdf', etag=False)
+        response.content_length = os.fstat(pdf_file.fileno()).st_size
+    else:
+        pdf_bytes = result.get('pdf_bytes')
+        if pdf_bytes is None:
+            pdf_bytes = base64.b64decode(result['pdf_base64'])
+        response = send_file(io.BytesIO(pdf_bytes), mimetype='application/pdf',
+                             download_name='resume.pdf', etag=False)
+
+    _set_metadata_headers(response, result['metadata'])
+    return response
+
+
+def _set_metadata_headers(response, metadata):
+    """
+    Copy scalar compile metadata into X-Resume-* response headers.
+
+    Nested metadata stays in the JSON form of the response only, since
+    headers count against proxy limits: warnings are reduced to counts, and
+    timings are already sent in Server-Timing.
+    """
+    warnings = metadata.get('warnings') or {}
+    fields = {key: value for key, value in metadata.items() if isinstance(value, (str, int, float))}
+    fields.update(
+        overfullBoxes=warnings.get('overfullBoxes'),
+        underfullBoxes=warnings.get('underfullBoxes'),
+        missingFonts=len(warnings['missingFonts']) if 'missingFonts' in warnings else None
+    )
+
+    for key, value in fields.items():
+        if value is None:
+            continue
+        header = 'X-Resume-' + re.sub(r'(?<!^)(?=[A-Z])', '-', key[0].upper() + key[1:])
+        response.headers[header] = value if isinstance(value, str) else json.dumps(value)
+
+
+def _compile_on_workers(
+    compile_fn,
+    timer: PhaseTimer,
+    cancellation: Optional[CompileCancellation] = None,
+    **kwargs
+):
+    """
+    Run an uncached compile on the worker pool under admission control.
+
+    Args:
+        compile_fn: LaTeXCompiler method taking check_cache, timer and cancellation
+        timer: Timer of the current request
+        cancellation: Cancellation of the request's session, if it has one
+        **kwargs: Arguments for compile_fn
+
+    Returns:
+        Compile result with queue wait and timings in its metadata
+
+    Raises:
+        CompileQueueFullError: If the instance is saturated, or the compile
+            was dropped from the queue without being superseded
+        CompileSupersededError: If a newer request for the session cancelled it
+    """
+    # Shed load rather than queue work the client will give up on
+    with admission.admit() as admission_wait:
+        timer.record('admission_wait', admission_wait)
+        if cancellation is not None:
+            cancellation.raise_if_cancelled()
+        future = compile_executor.submit(
+            compile_fn, check_cache=False, timer=timer, cancellation=cancellation, **kwargs
+        )
+        if cancellation is not None:
+            cancellation.attach_future(future)
+        try:
+            result = future.result()
+        except CancelledError:
+            # Dropped from the queue before a worker picked it up: superseded
+            # by a newer request for the session, or by an executor shutdown
+            if cancellation is not None:
+                cancellation.raise_if_cancelled()
+            raise CompileQueueFullError("Compile was dropped from the queue before it started")
+    result['metadata']['queueWaitTime'] = f"{future.queue_wait:.3f}s"
+    timer.record('queue_wait', future.queue_wait)
+    result['metadata']['timings'] = timer.as_milliseconds()
+    return result
+
+
+def _submit_admitted(compile_fn, **kwargs):
+    """
+    Submit a compile to the worker pool holding an admission slot until it finishes.
+
+    For callers that keep several compiles in flight; the slot is released
+    by the worker as soon as the compile completes.
+
+    Args:
+        compile_fn: Function to run on a worker
+        **kwargs: Arguments for compile_fn
+
+    Returns:
+        Future of the compile
+
+    Raises:
+        CompileQueueFullError: If admission control or the compile queue rejects it
+    """
+    slot = ExitStack()
+    slot.enter_context(admission.admit())
+    try:
+        future = compile_executor.submit(compile_fn, **kwargs)
+    except BaseException:
+        slot.close()
+        raise
+    future.add_done_callback(lambda _: slot.close())
+    return future
+
+
+def _preview_response(
+    template,
+    content,
+    customizations,
+    preview,
+    timer: PhaseTimer,
+    cancellation: Optional[CompileCancellation] = None
+):
+    """
+    Render a resume to PNG previews.
+
+    Clients that accept image/png get page 1 as an image with the compile
+    metadata in headers; others get every requested page base64 encoded in
+    JSON.
+
+    Returns:
+        Flask response
+    """
+    wants_png = request.accept_mimetypes.best_match(
+        ['application/json', 'image/png']
+    ) == 'image/png'
+    dpi = preview.get('dpi', PREVIEW_DEFAULT_DPI)
+    all_pages = preview.get('pages') == 'all' and not wants_png
+
+    result = latex_compiler.get_cached_preview(
+        template, content, customizations, dpi, all_pages, timer
+    )
+    if result is None:
+        result = _compile_on_workers(
+            latex_compiler.compile_preview, timer,
+            template=template,
+            content=content,
+            customizations=customizations,
+            cancellation=cancellation,
+            dpi=dpi,
+            all_pages=all_pages
+        )
+
+    if wants_png:
+        response = Response(result['images'][0], mimetype='image/png')
+        _set_metadata_headers(response, result['metadata'])
+        return response
+
+    return jsonify({
+        'success': True,
+        'previews': [
+            {'page': number, 'pngBase64': base64.b64encode(image).decode('ascii')}
+            for number, image in enumerate(result['images'], start=1)
+        ],
+        'metadata': result['metadata']
+    })
+
+
 @app.route('/compile', methods=['POST'])
 def compile_resume():
     """Compile LaTeX resume from template and content."""
+    timer = PhaseTimer()
+    cancellation = None
     try:
         # Validate request
-        if not request.is_json:
-            raise BadRequest("Request must be JSON")
+        with timer.phase('validation'):
+            error_response = _validation_error_response()
+        if error_response:
+            return error_response
 
         data = request.get_json()
-        validation_errors = validate_compile_request(data)
-        if validation_errors:
-            return jsonify({
-                'success': False,
-                'error': 'Validation failed',
-                'details': validation_errors
-            }), 400
 
         # Extract parameters
         template_id = data['templateId']
         content = data['content']
         customizations = data.get('customizations', {})
 
+        # A newer request for the same session cancels this one's compile
+        if 'sessionKey' in data:
+            cancellation = compile_sessions.start(data['sessionKey'])
+
         logger.info(f"Compiling resume with template: {template_id}")
 
         # Load template
-        template = template_manager.load_template(template_id)
+        with timer.phase('template_load'):
+            template = template_manager.load_template(template_id)
         if not template:
             return jsonify({
                 'success': False,
                 'error': f'Template {template_id} not found'
             }), 404
 
-        # Compile LaTeX document
-        result = latex_compiler.compile_resume(
-            template=template,
-            content=content,
-            customizations=customizations
+        # Stream binary PDFs to clients that ask for them; JSON stays the default
+        wants_pdf = _wants_pdf()
+        output_format = OUTPUT_FILE if wants_pdf else OUTPUT_BASE64
+
+        # Live editing previews return PNG images instead of the PDF
+        if 'preview' in data:
+            response = _preview_response(
+                template, content, customizations, data['preview'], timer, cancellation
+            )
+            response.headers['Server-Timing'] = timer.server_timing()
+            return response, 200
+
+        # Compile LaTeX document on the worker pool unless it is already cached
+        result = latex_compiler.get_cached_result(
+            template, content, customizations, output_format, timer
         )
+        if result is None:
+            result = _compile_on_workers(
+                latex_compiler.compile_resume, timer,
+                cancellation=cancellation,
+                template=template,
+                content=content,
+                customizations=customizations,
+                output_format=output_format
+            )
 
         logger.info(f"Resume compiled successfully: {result.get('metadata', {})}")
 
-        return jsonify({
-            'success': True,
-            'pdfBase64': result['pdf_base64'],
-            'metadata': result['metadata']
-        }), 200
+        if wants_pdf:
+            response = _pdf_response(result)
+        else:
+            response = jsonify({
+                'success': True,
+                'pdfBase64': result['pdf_base64'],
+                'metadata': result['metadata']
+            })
+        response.headers['Server-Timing'] = timer.server_timing()
+        return response, 200
 
     except BadRequest as e:
         logger.warning(f"Bad request: {str(e)}")
@@ -140,9 +577,262 @@ def compile_resume():
             'success': False,
             'error': str(e)
         }), 400
+    except CompileQueueFullError as e:
+        return _overloaded_response(e)
+    except CompileSupersededError as e:
+        logger.info(str(e))
+        COMPILES_SUPERSEDED.inc()
+        return jsonify({
+            'success': False,
+            'status': 'superseded',
+            'error': str(e)
+        }), 409
+    except RasterizationError as e:
+        logger.error(f"Error rendering resume preview: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': 'Preview rendering is not available'
+        }), 503
     except Exception as e:
         logger.error(f"Error compiling resume: {str(e)}")
         return handle_error(e, "Failed to compile resume")
+    finally:
+        if cancellation is not None:
+            compile_sessions.finish(cancellation)
+
+
+@app.route('/compile/batch', methods=['POST'])
+def compile_batch():
+    """Compile many content variants against one template in parallel."""
+    try:
+        if not request.is_json:
+            raise BadRequest("Request must be JSON")
+
+        data = request.get_json()
+        validation_errors = validate_batch_request(data)
+        if validation_errors:
+            record_failure(FAILURE_VALIDATION)
+            return jsonify({
+                'success': False,
+                'error': 'Validation failed',
+                'details': validation_errors
+            }), 400
+
+        start_time = time.time()
+        template_id = data['templateId']
+        shared_customizations = data.get('customizations', {})
+
+        logger.info(f"Compiling batch of {len(data['variants'])} resumes with template: {template_id}")
+
+        # Load the template once for every variant
+        template = template_manager.load_template(template_id)
+
+        results = []
+        to_compile = []
+        for index, variant in enumerate(data['variants']):
+            item = {'index': index}
+            if isinstance(variant, dict) and 'id' in variant:
+                item['id'] = variant['id']
+            results.append(item)
+
+            variant_errors = validate_batch_variant(variant)
+            if variant_errors:
+                record_failure(FAILURE_VALIDATION)
+                item.update(success=False, error='Validation failed', details=variant_errors)
+                continue
+
+            content = variant['content']
+            customizations = {**shared_customizations, **variant.get('customizations', {})}
+
+            cached = latex_compiler.get_cached_result(template, content, customizations)
+            if cached is not None:
+                item.update(success=True, pdfBase64=cached['pdf_base64'], metadata=cached['metadata'])
+                continue
+
+            to_compile.append((index, content, customizations))
+
+        # Submit in waves of at most one compile per worker, each under
+        # admission control like /compile, so a batch neither fails on its
+        # own back-pressure nor fills the workers behind admission's back.
+        # A rejection while none of the batch's compiles is left to wait
+        # for means other traffic saturates the instance, and the rest of
+        # the batch is shed with it.
+        futures = {}
+        in_flight = set()
+        rejection = None
+        for index, content, customizations in to_compile:
+            while rejection is None:
+                if len(in_flight) < compile_executor.max_workers:
+                    try:
+                        future = _submit_admitted(
+                            latex_compiler.compile_resume,
+                            template=template,
+                            content=content,
+                            customizations=customizations,
+                            check_cache=False
+                        )
+                    except CompileQueueFullError as e:
+                        if not in_flight:
+                            rejection = e
+                            break
+                    else:
+                        futures[index] = future
+                        in_flight.add(future)
+                        break
+                _, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+
+            if rejection is not None:
+                results[index].update(success=False, error=str(rejection))
+
+        # Collect results; a failed variant does not affect the others
+        for index, future in futures.items():
+            item = results[index]
+            try:
+                result = future.result()
+                result['metadata']['queueWaitTime'] = f"{future.queue_wait:.3f}s"
+                item.update(success=True, pdfBase64=result['pdf_base64'], metadata=result['metadata'])
+            except LaTeXCompilationError as e:
+                logger.warning(f"Batch variant {index} failed: {str(e)}")
+                item.update(success=False, error='LaTeX compilation failed', details=e.error_details)
+            except Exception as e:
+                logger.error(f"Batch variant {index} failed: {str(e)}")
+                item.update(success=False, error='An internal error occurred')
+
+        total_time = time.time() - start_time
+        succeeded = sum(1 for item in results if item['success'])
+
+        logger.info(f"Batch compiled {succeeded}/{len(results)} resumes in {total_time:.2f}s")
+
+        return jsonify({
+            'success': succeeded == len(results),
+            'templateId': template_id,
+            'results': results,
+            'summary': {
+                'total': len(results),
+                'succeeded': succeeded,
+                'failed': len(results) - succeeded,
+                'totalTime': f"{total_time:.2f}s"
+            }
+        }), 200
+
+    except BadRequest as e:
+        logger.warning(f"Bad request: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except TemplateNotFoundError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 404
+    except Exception as e:
+        logger.error(f"Error compiling batch: {str(e)}")
+        return handle_error(e, "Failed to compile batch")
+
+
+@app.route('/compile/jobs', methods=['POST'])
+def submit_compile_job():
+    """Queue a resume compile and return a job ID to poll."""
+    try:
+        error_response = _validation_error_response()
+        if error_response:
+            return error_response
+
+        data = request.get_json()
+        template_id = data['templateId']
+        content = data['content']
+        customizations = data.get('customizations', {})
+
+        template = template_manager.load_template(template_id)
+
+        cached = latex_compiler.get_cached_result(template, content, customizations)
+        if cached is not None:
+            job = compile_jobs.add_result(template_id, cached)
+        else:
+            job = compile_jobs.submit(
+                compile_executor,
+                template_id,
+                latex_compiler.compile_resume,
+                template=template,
+                content=content,
+                customizations=customizations,
+                check_cache=False
+            )
+
+        logger.info(f"Queued compile job {job['jobId']} with template: {template_id}")
+
+        return jsonify({
+            'success': True,
+            'job': job
+        }), 202
+
+    except BadRequest as e:
+        logger.warning(f"Bad request: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except TemplateNotFoundError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 404
+    except CompileQueueFullError as e:
+        return _overloaded_response(e)
+    except Exception as e:
+        logger.error(f"Error submitting compile job: {str(e)}")
+        return handle_error(e, "Failed to submit compile job")
+
+
+@app.route('/compile/jobs/<job_id>', methods=['GET'])
+def get_compile_job(job_id):
+    """Get the status and timing of a compile job."""
+    job = compile_jobs.get(job_id)
+    if not job:
+        return jsonify({
+            'success': False,
+            'error': f'Compile job {job_id} not found'
+        }), 404
+
+    return jsonify({
+        'success': True,
+        'job': job
+    }), 200
+
+
+@app.route('/compile/jobs/<job_id>/pdf', methods=['GET'])
+def get_compile_job_pdf(job_id):
+    """Get the compiled PDF of a finished compile job."""
+    job = compile_jobs.get(job_id)
+    if not job:
+        return jsonify({
+            'success': False,
+            'error': f'Compile job {job_id} not found'
+        }), 404
+
+    if job['status'] == 'failed':
+        return jsonify({
+            'success': False,
+            'job': job
+        }), 422
+
+    result = compile_jobs.get_result(job_id)
+    if result is None:
+        # Still queued or running; the client should keep polling
+        return jsonify({
+            'success': False,
+            'job': job
+        }), 409
+
+    if _wants_pdf():
+        return _pdf_response(result)
+
+    return jsonify({
+        'success': True,
+        'pdfBase64': result['pdf_base64'],
+        'metadata': result['metadata']
+    }), 200
 
 
 @app.errorhandler(404)
@@ -0,0 +1,105 @@
+"""
+Bounded LaTeX compile executor.
+
+This module runs compile jobs on a fixed-size worker pool with a bounded
+wait queue so bursts of traffic cannot oversubscribe the container's CPUs.
+"""
+
+import os
+import time
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Callable, Optional
+
+from utils.error_handling import CompileQueueFullError
+
+logger = logging.getLogger(__name__)
+
+
+class CompileExecutor:
+    """Runs compile jobs on a bounded pool of worker threads."""
+
+    def __init__(self, max_workers: Optional[int] = None, max_queue: Optional[int] = None):
+        if max_workers is None:
+            max_workers = int(os.getenv('COMPILE_WORKERS', os.cpu_count() or 1))
+        if max_queue is None:
+            max_queue = int(os.getenv('COMPILE_QUEUE_SIZE', max_workers * 4))
+
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix='latex-compile'
+        )
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queue)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+
+        logger.info(f"Compile executor started with {self.max_workers} workers "
+                    f"and a queue of {self.max_queue}")
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Queue a compile job.
+
+        Args:
+            fn: Callable to run on a worker
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future for the job; its queue_wait attribute holds the seconds
+            the job spent waiting for a worker once it has started
+
+        Raises:
+            CompileQueueFullError: If all workers are busy and the queue is full
+        """
+        if not self._slots.acquire(blocking=False):
+            raise CompileQueueFullError("Compile queue is full")
+
+        submitted_at = time.perf_counter()
+        with self._lock:
+            self._pending += 1
+
+        future = Future()
+        future.queue_wait = None
+
+        def run():
+            with self._lock:
+                self._pending -= 1
+            if not future.set_running_or_notify_cancel():
+                return
+
+            future.queue_wait = time.perf_counter() - submitted_at
+            with self._lock:
+                self._running += 1
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+            finally:
+                with self._lock:
+                    self._running -= 1
+
+        future.add_done_callback(lambda _: self._slots.release())
+        self._executor.submit(run)
+        return future
+
+    def stats(self) -> Dict[str, Any]:
+        """Return worker and queue occupancy."""
+        with self._lock:
+            return {
+                'workers': self.max_workers,
+                'maxQueue': self.max_queue,
+                'running': self._running,
+                'queued': self._pending
+            }
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting work and optionally wait for running jobs."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
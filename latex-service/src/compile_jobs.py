@@ -0,0 +1,247 @@
+"""
+Asynchronous compile job tracking.
+
+This module lets clients submit a compile, return immediately with a job
+ID, and poll for the result. Finished results are kept for a limited time
+and within a memory budget.
+"""
+
+import os
+import time
+import uuid
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Any, Callable, Optional
+
+from compile_executor import CompileExecutor
+from utils.error_handling import LaTeXCompilationError
+
+logger = logging.getLogger(__name__)
+
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_SUCCEEDED = 'succeeded'
+STATUS_FAILED = 'failed'
+
+
+class CompileJobStore:
+    """Tracks asynchronous compile jobs and retains their results."""
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_bytes: Optional[int] = None):
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv('COMPILE_JOB_TTL_SECONDS', 600))
+        if max_bytes is None:
+            max_bytes = int(os.getenv('COMPILE_JOB_MAX_BYTES', 128 * 1024 * 1024))
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._result_bytes = 0
+
+    def submit(self, executor: CompileExecutor, template_id: str, fn: Callable, **kwargs) -> Dict[str, Any]:
+        """
+        Create a job and queue it on the compile executor.
+
+        Args:
+            executor: Executor to run the job on
+            template_id: Template the job compiles
+            fn: Compile callable returning a dict with 'pdf_base64' and 'metadata'
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Public view of the new job
+
+        Raises:
+            CompileQueueFullError: If the executor cannot accept the job
+        """
+        job = self._new_job(template_id)
+
+        def run():
+            self._update(job['id'], status=STATUS_RUNNING, started_at=time.time())
+            return fn(**kwargs)
+
+        try:
+            future = executor.submit(run)
+        except Exception:
+            with self._lock:
+                self._jobs.pop(job['id'], None)
+            raise
+
+        future.add_done_callback(lambda f: self._finish(job['id'], f))
+        return self.get(job['id'])
+
+    def add_result(self, template_id: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Record an already-available result, such as a cache hit, as a finished job.
+
+        Args:
+            template_id: Template the result was compiled from
+            result: Dict with 'pdf_base64' and 'metadata'
+
+        Returns:
+            Public view of the new job
+        """
+        job = self._new_job(template_id)
+        now = time.time()
+        self._update(job['id'], started_at=now)
+        self._store_result(job['id'], result, now)
+        return self.get(job['id'])
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the status and timing of a job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Job status dictionary, or None if unknown or expired
+        """
+        self._prune()
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            return _public_view(job)
+
+    def get_result(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the compiled result of a successful job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Dict with 'pdf_base64' and 'metadata', or None if not available
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job['status'] != STATUS_SUCCEEDED:
+                return None
+            return job['result']
+
+    def _new_job(self, template_id: str) -> Dict[str, Any]:
+        """Register a new queued job."""
+        self._prune()
+        job = {
+            'id': uuid.uuid4().hex,
+            'template_id': template_id,
+            'status': STATUS_QUEUED,
+            'submitted_at': time.time(),
+            'started_at': None,
+            'finished_at': None,
+            'result': None,
+            'result_bytes': 0,
+            'error': None,
+            'error_details': None
+        }
+        with self._lock:
+            self._jobs[job['id']] = job
+        return job
+
+    def _update(self, job_id: str, **fields):
+        """Update fields of a tracked job."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.update(fields)
+
+    def _finish(self, job_id: str, future):
+        """Record the outcome of a finished executor future."""
+        finished_at = time.time()
+        exception = future.exception()
+        if exception is None:
+            self._store_result(job_id, future.result(), finished_at)
+            return
+
+        logger.error(f"Compile job {job_id} failed: {str(exception)}")
+
+        # Only LaTeX errors are safe and useful to show to the client
+        if isinstance(exception, LaTeXCompilationError):
+            error, error_details = 'LaTeX compilation failed', exception.error_details
+        else:
+            error, error_details = 'An internal error occurred', None
+
+        self._update(
+            job_id,
+            status=STATUS_FAILED,
+            finished_at=finished_at,
+            error=error,
+            error_details=error_details
+        )
+
+    def _store_result(self, job_id: str, result: Dict[str, Any], finished_at: float):
+        """Attach a compiled result to a job and enforce the memory cap."""
+        size = len(result.get('pdf_base64') or '')
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.update(
+                status=STATUS_SUCCEEDED,
+                finished_at=finished_at,
+                result=result,
+                result_bytes=size
+            )
+            self._result_bytes += size
+            self._evict_over_budget()
+
+    def _prune(self):
+        """Drop finished jobs whose results have outlived the TTL."""
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job['finished_at'] is not None and job['finished_at'] < cutoff
+            ]
+            for job_id in expired:
+                self._result_bytes -= self._jobs.pop(job_id)['result_bytes']
+
+    def _evict_over_budget(self):
+        """Drop the oldest finished jobs until results fit the memory cap. Lock must be held."""
+        if self._result_bytes <= self.max_bytes:
+            return
+        for job_id in list(self._jobs):
+            if self._result_bytes <= self.max_bytes:
+                break
+            job = self._jobs[job_id]
+            if job['finished_at'] is not None:
+                self._result_bytes -= job['result_bytes']
+                del self._jobs[job_id]
+                logger.info(f"Evicted compile job {job_id} to stay within memory cap")
+
+
+def _public_view(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the client-facing status of a job."""
+    submitted_at = job['submitted_at']
+    started_at = job['started_at']
+    finished_at = job['finished_at']
+
+    view = {
+        'jobId': job['id'],
+        'templateId': job['template_id'],
+        'status': job['status'],
+        'timing': {
+            'submittedAt': _isoformat(submitted_at),
+            'startedAt': _isoformat(started_at),
+            'finishedAt': _isoformat(finished_at),
+            'queueWaitSeconds': round(started_at - submitted_at, 3) if started_at else None,
+            'runSeconds': round(finished_at - started_at, 3)
+            if started_at and finished_at else None
+        }
+    }
+    if job['status'] == STATUS_FAILED:
+        view['error'] = job['error']
+        if job['error_details']:
+            view['details'] = job['error_details']
+    return view
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    """Format an epoch timestamp as ISO 8601 UTC."""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
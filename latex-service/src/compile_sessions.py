@@ -0,0 +1,119 @@
+"""
+Superseded compile cancellation.
+
+This module tracks the newest compile request per client session key. When
+a newer request for a key arrives, the older one is cancelled: its queued
+job is dropped, and a pdflatex process it already started is killed, so
+rapid edits in a live preview do not each compile to completion.
+"""
+
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any, Optional
+
+from utils.error_handling import CompileSupersededError
+
+logger = logging.getLogger(__name__)
+
+
+class CompileCancellation:
+    """Cancellation state of one compile request."""
+
+    def __init__(self, session_key: str):
+        self.session_key = session_key
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._future: Optional[Future] = None
+        self._process = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self):
+        """Cancel the queued job and kill the running pdflatex process, if any."""
+        with self._lock:
+            self._cancelled = True
+            future, process = self._future, self._process
+
+        if future is not None:
+            future.cancel()
+        if process is not None and process.poll() is None:
+            process.kill()
+
+    def raise_if_cancelled(self):
+        """
+        Raises:
+            CompileSupersededError: If a newer request replaced this one
+        """
+        if self._cancelled:
+            raise CompileSupersededError(
+                f"Compile superseded by a newer request for session {self.session_key}"
+            )
+
+    def attach_future(self, future: Future):
+        """Register the queued job so it can be dropped before it starts."""
+        with self._lock:
+            self._future = future
+            cancelled = self._cancelled
+        if cancelled:
+            future.cancel()
+
+    def attach_process(self, process):
+        """Register a running pdflatex process so it can be killed."""
+        with self._lock:
+            self._process = process
+            cancelled = self._cancelled
+        if cancelled:
+            process.kill()
+
+    def detach_process(self):
+        """Forget the pdflatex process once it has exited."""
+        with self._lock:
+            self._process = None
+
+
+class CompileSessions:
+    """Keeps the newest compile request per session and cancels older ones."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active: Dict[str, CompileCancellation] = {}
+        self._cancelled = 0
+
+    def start(self, session_key: str) -> CompileCancellation:
+        """
+        Register a new compile for a session, cancelling the previous one.
+
+        Args:
+            session_key: Client-chosen key identifying the edited document
+
+        Returns:
+            Cancellation to pass down to the compile
+        """
+        cancellation = CompileCancellation(session_key)
+        with self._lock:
+            previous = self._active.get(session_key)
+            self._active[session_key] = cancellation
+            if previous is not None:
+                self._cancelled += 1
+
+        if previous is not None:
+            previous.cancel()
+            logger.info(f"Cancelled superseded compile for session {session_key}")
+        return cancellation
+
+    def finish(self, cancellation: CompileCancellation):
+        """Stop tracking a compile once its request has completed."""
+        with self._lock:
+            if self._active.get(cancellation.session_key) is cancellation:
+                del self._active[cancellation.session_key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return active session and cancellation counts."""
+        with self._lock:
+            return {
+                'activeSessions': len(self._active),
+                'cancelled': self._cancelled
+            }
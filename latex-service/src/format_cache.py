@@ -0,0 +1,148 @@
+"""
+Precompiled LaTeX format management.
+
+This module dumps a pdflatex format file for each template's preamble so
+compiles can start from the preloaded format instead of re-reading the
+document class, packages and macro definitions on every request.
+"""
+
+import os
+import hashlib
+import logging
+import subprocess
+import tempfile
+import threading
+from typing import Dict, Any, Optional, Tuple
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+BEGIN_DOCUMENT = '\\begin{document}'
+
+
+class FormatCache:
+    """Builds and locates per-template pdflatex format files."""
+
+    def __init__(self, format_dir: Optional[str] = None):
+        self.format_dir = Path(format_dir or os.getenv('LATEX_FORMAT_DIR', '/tmp/latex-formats'))
+        self.format_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def split_preamble(latex_source: str) -> Tuple[str, str]:
+        """
+        Split LaTeX source into its preamble and document body.
+
+        Args:
+            latex_source: Complete LaTeX source
+
+        Returns:
+            Tuple of (preamble, body); body starts at \\begin{document}
+        """
+        index = latex_source.find(BEGIN_DOCUMENT)
+        if index == -1:
+            return latex_source, ''
+        return latex_source[:index], latex_source[index:]
+
+    @staticmethod
+    def preamble_hash(preamble: str) -> str:
+        """Return a stable digest of a preamble."""
+        return hashlib.sha256(preamble.encode('utf-8')).hexdigest()[:16]
+
+    def ensure_format(self, template_id: str, latex_source: str) -> Optional[Dict[str, Any]]:
+        """
+        Make sure a current format file exists for a template's preamble.
+
+        Args:
+            template_id: Template identifier
+            latex_source: Loaded template LaTeX source
+
+        Returns:
+            Format information with 'name', 'directory' and 'preamble_hash',
+            or None if the template cannot use a precompiled format
+        """
+        preamble, body = self.split_preamble(latex_source)
+        if not body:
+            return None
+
+        # Placeholders in the preamble change per request, so there is no
+        # single preamble to dump.
+        if '{{' in preamble:
+            logger.info(f"Template {template_id} preamble has placeholders; skipping format")
+            return None
+
+        digest = self.preamble_hash(preamble)
+        name = f"{template_id}__{digest}"
+        format_info = {
+            'name': name,
+            'directory': str(self.format_dir),
+            'preamble_hash': digest
+        }
+
+        with self._lock:
+            if (self.format_dir / f"{name}.fmt").exists():
+                return format_info
+
+            try:
+                self._dump_format(name, preamble)
+            except Exception as e:
+                logger.warning(f"Could not build format for template {template_id}: {str(e)}")
+                return None
+
+            self._remove_stale_formats(template_id, name)
+
+        logger.info(f"Built format file for template: {template_id}")
+        return format_info
+
+    def invalidate_template(self, template_id: Optional[str] = None):
+        """
+        Delete format files for a template, or for all templates.
+
+        Args:
+            template_id: Template identifier, or None to remove every format
+        """
+        with self._lock:
+            pattern = f"{template_id}__*.fmt" if template_id else '*.fmt'
+            for fmt_file in self.format_dir.glob(pattern):
+                fmt_file.unlink(missing_ok=True)
+
+    def _dump_format(self, name: str, preamble: str):
+        """Run pdflatex in INI mode to dump a preamble into a format file."""
+        with tempfile.TemporaryDirectory(dir=self.format_dir) as temp_dir:
+            temp_path = Path(temp_dir)
+            preamble_file = temp_path / 'preamble.tex'
+            preamble_file.write_text(preamble + '\n\\dump\n', encoding='utf-8')
+
+            result = subprocess.run(
+                ['pdflatex', '-ini', '-interaction=nonstopmode',
+                 f"-jobname={name}", '-output-directory', str(temp_path),
+                 '&pdflatex', str(preamble_file)],
+                capture_output=True,
+                text=True,
+                errors='replace',
+                cwd=temp_path,
+                timeout=120
+            )
+
+            built_file = temp_path / f"{name}.fmt"
+            if result.returncode != 0 or not built_file.exists():
+                raise RuntimeError(f"pdflatex -ini failed:\n{result.stdout[-2000:]}")
+
+            # Rename into place so concurrent compiles never see a partial file
+            built_file.replace(self.format_dir / f"{name}.fmt")
+
+    def _remove_stale_formats(self, template_id: str, current_name: str):
+        """Remove formats dumped from older versions of a template's preamble."""
+        for fmt_file in self.format_dir.glob(f"{template_id}__*.fmt"):
+            if fmt_file.stem != current_name:
+                fmt_file.unlink(missing_ok=True)
+
+
+if __name__ == '__main__':
+    # Build formats for every template, e.g. during the Docker image build
+    from template_manager import TemplateManager
+
+    logging.basicConfig(level=logging.INFO)
+    manager = TemplateManager(format_cache=FormatCache())
+    for template_info in manager.list_templates():
+        manager.load_template(template_info['id'])
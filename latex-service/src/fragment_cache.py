@@ -0,0 +1,149 @@
+"""
+LaTeX fragment cache.
+
+This module caches the generated LaTeX for individual resume items and
+whole sections, keyed by their data, so re-rendering a resume after a
+small edit only regenerates what changed.
+"""
+
+import os
+import logging
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Dict, Any, Callable, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def fragment_key(data: Any) -> Hashable:
+    """
+    Freeze fragment data into a hashable cache key.
+
+    Strings, which make up most of a resume, are used as they are, so their
+    hashes are computed once per string object. Containers and other
+    scalars are tagged with their type so that data which compares equal
+    in Python but renders differently, such as 1 and 1.0 or a dict and a
+    list of pairs, never shares a key. Dict keys keep their order: an item
+    sent with reordered keys only misses.
+    """
+    if type(data) is str:
+        return data
+    if isinstance(data, dict):
+        return (dict,) + tuple((key, fragment_key(value)) for key, value in data.items())
+    if isinstance(data, (list, tuple)):
+        return (list,) + tuple(fragment_key(value) for value in data)
+    return (type(data), data)
+
+
+class FragmentCache:
+    """LRU cache of generated LaTeX fragments with per-kind hit counters."""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        if max_entries is None:
+            max_entries = int(os.getenv('FRAGMENT_CACHE_MAX_ENTRIES', 4096))
+        self.max_entries = max_entries
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = defaultdict(int)
+        self._misses = defaultdict(int)
+
+    def get_or_render(self, kind: str, data: Any, render: Callable[[Any], str]) -> str:
+        """
+        Return the cached fragment for data, rendering and storing it on a miss.
+
+        Args:
+            kind: Fragment kind, e.g. 'experience' or 'skills_section'
+            data: Item or section data the fragment is generated from
+            render: Function generating the fragment from data
+
+        Returns:
+            Generated LaTeX fragment
+        """
+        return self._get_or_render(kind, fragment_key(data), lambda: render(data))
+
+    def get_or_render_section(
+        self,
+        kind: str,
+        item_kind: str,
+        items: List[Any],
+        render_item: Callable[[Any], str],
+        join: Callable[[List[str]], str]
+    ) -> str:
+        """
+        Return the cached fragment for a section of items.
+
+        Each item is frozen into its key once; the section is keyed by the
+        item keys, so a section miss looks its items up without freezing them
+        again and only the edited items are rendered.
+
+        Args:
+            kind: Section fragment kind, e.g. 'experience_section'
+            item_kind: Fragment kind of the items, e.g. 'experience'
+            items: Section items
+            render_item: Function generating the fragment for one item
+            join: Function joining the item fragments into the section
+
+        Returns:
+            Generated LaTeX fragment for the section
+        """
+        item_keys = tuple(fragment_key(item) for item in items)
+
+        def render_section() -> str:
+            return join([
+                self._get_or_render(item_kind, item_key, lambda item=item: render_item(item))
+                for item, item_key in zip(items, item_keys)
+            ])
+
+        return self._get_or_render(kind, item_keys, render_section)
+
+    def _get_or_render(self, kind: str, data_key: Hashable, render: Callable[[], str]) -> str:
+        """Look a fragment up by kind and data key, rendering and storing it on a miss."""
+        key = (kind, data_key)
+
+        with self._lock:
+            # Looked up by membership so empty fragments are cached too
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits[kind] += 1
+                return self._entries[key]
+            self._misses[kind] += 1
+
+        fragment = render()
+
+        with self._lock:
+            self._entries[key] = fragment
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return fragment
+
+    def clear(self):
+        """Drop every cached fragment."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return fragment hit/miss counters overall and per kind."""
+        with self._lock:
+            kinds = sorted(set(self._hits) | set(self._misses))
+            by_kind = {}
+            for kind in kinds:
+                lookups = self._hits[kind] + self._misses[kind]
+                by_kind[kind] = {
+                    'hits': self._hits[kind],
+                    'misses': self._misses[kind],
+                    'hitRate': self._hits[kind] / lookups if lookups else 0.0
+                }
+
+            hits = sum(self._hits.values())
+            lookups = hits + sum(self._misses.values())
+            return {
+                'hits': hits,
+                'misses': lookups - hits,
+                'hitRate': hits / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'maxEntries': self.max_entries,
+                'kinds': by_kind
+            }
@@ -5,50 +5,203 @@ This module handles the compilation of LaTeX documents into PDF format.
 """
 
 import os
-import tempfile
+import json
+import shutil
 import subprocess
 import base64
+import hashlib
 import logging
 import time
-from typing import Dict, Any, Optional
+import uuid
+import threading
+import tempfile
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
-from utils.error_handling import LaTeXCompilationError
-from utils.validation import sanitize_latex_content
+from compile_sessions import CompileCancellation
+
+from format_cache import FormatCache
+from metrics import (
+    COMPILE_PHASE_SECONDS, COMPILE_SECONDS, COMPILES_IN_FLIGHT, ENCODE_SECONDS,
+    ENGINE_COMPILE_SECONDS, FAILURE_LATEX, PDF_PAGES, PDF_SIZE_BYTES, RASTERIZE_SECONDS,
+    SOURCE_GENERATION_SECONDS, record_failure
+)
+from fragment_cache import FragmentCache
+from pdf_metadata import LogMetadataExtractor, read_pdf_page_count
+from pdf_raster import rasterize_pdf
+from result_cache import CompileResultCache
+from scratch_space import ScratchSpace
+from template_renderer import CompiledTemplate
+from tex_engines import DEFAULT_OUTPUT_PROFILE, TexEngine, get_engine
+from utils.error_handling import (
+    CompileSupersededError, LaTeXCompilationError, LaTeXErrorCollector
+)
+from utils.timing import PhaseTimer
+from utils.validation import sanitize_content_tree, sanitize_latex_content
 
 logger = logging.getLogger(__name__)
 
+# Result shapes returned by compile_resume
+OUTPUT_BASE64 = 'base64'
+OUTPUT_FILE = 'file'
+
+# Raster preview resolution when a request does not set one
+PREVIEW_DEFAULT_DPI = int(os.getenv('COMPILE_PREVIEW_DPI', 72))
+
+# Wall-clock limit for a single TeX engine pass
+PDFLATEX_TIMEOUT_SECONDS = 60
+
+# Written at image build time once pdflatex has been verified
+LATEX_INSTALL_MARKER = os.getenv('LATEX_INSTALL_MARKER', '/tmp/latex-installation.json')
+
+# Files pdflatex writes on one pass and reads back on the next
+AUXILIARY_SUFFIXES = ('.aux', '.out', '.toc')
+
+
+def read_installation_marker() -> Optional[Dict[str, Any]]:
+    """Read the LaTeX installation marker, or None if there is none."""
+    try:
+        return json.loads(Path(LATEX_INSTALL_MARKER).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+
+def verify_latex_installation() -> Dict[str, Any]:
+    """
+    Run pdflatex to check it works and record the result in the marker file.
+
+    Returns:
+        Marker data with the pdflatex path and version
+
+    Raises:
+        RuntimeError: If pdflatex is missing or not working
+    """
+    try:
+        result = subprocess.run(
+            ['pdflatex', '--version'],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        if result.returncode != 0:
+            raise RuntimeError("pdflatex is not working properly")
+    except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+        raise RuntimeError(f"LaTeX not properly installed: {str(e)}")
+
+    marker = {
+        'pdflatex': shutil.which('pdflatex'),
+        'version': result.stdout.splitlines()[0] if result.stdout else None
+    }
+    try:
+        Path(LATEX_INSTALL_MARKER).write_text(json.dumps(marker), encoding='utf-8')
+    except OSError as e:
+        # A read-only filesystem only means the check runs again next start
+        logger.debug(f"Could not write LaTeX installation marker: {str(e)}")
+
+    logger.info("LaTeX installation verified")
+    return marker
+
+
+def _preview_variant(dpi: int, all_pages: bool) -> str:
+    """Name the preview settings images are cached under."""
+    return f"{dpi}:{'all' if all_pages else 'first'}"
+
 
 class LaTeXCompiler:
     """Handles LaTeX document compilation."""
 
-    def __init__(self):
-        self.work_dir = Path(os.getenv('LATEX_WORK_DIR', '/tmp/latex-work'))
-        self.work_dir.mkdir(exist_ok=True)
+    def __init__(
+        self,
+        result_cache: Optional[CompileResultCache] = None,
+        fragment_cache: Optional[FragmentCache] = None,
+        scratch_space: Optional[ScratchSpace] = None
+    ):
+        self.scratch_space = scratch_space or ScratchSpace()
+        self.work_dir = self.scratch_space.root
+        self.outbox_dir = self.work_dir / 'outbox'
+        self.outbox_dir.mkdir(exist_ok=True)
+        self.result_cache = result_cache
+        self.fragment_cache = fragment_cache
+        self.max_passes = max(1, int(os.getenv('LATEX_MAX_PASSES', 3)))
 
         # Verify LaTeX installation
         self._verify_latex_installation()
 
     def _verify_latex_installation(self):
-        """Verify that LaTeX is properly installed."""
-        try:
-            result = subprocess.run(
-                ['pdflatex', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode != 0:
-                raise RuntimeError("pdflatex is not working properly")
-            logger.info("LaTeX installation verified")
-        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-            raise RuntimeError(f"LaTeX not properly installed: {str(e)}")
+        """
+        Verify that LaTeX is properly installed.
+
+        Running pdflatex costs tens of milliseconds on every cold start, so
+        it is only run when the installation marker written at image build
+        time is missing or names a different pdflatex than the one on PATH.
+        """
+        pdflatex = shutil.which('pdflatex')
+        if pdflatex is None:
+            raise RuntimeError("LaTeX not properly installed: pdflatex not found on PATH")
+
+        marker = read_installation_marker()
+        if marker and marker.get('pdflatex') == pdflatex:
+            logger.info(f"LaTeX installation verified at build time: {marker.get('version')}")
+            return
+
+        verify_latex_installation()
+
+    def get_cached_result(
+        self,
+        template: Dict[str, Any],
+        content: Dict[str, Any],
+        customizations: Dict[str, Any] = None,
+        output_format: str = OUTPUT_BASE64,
+        timer: Optional[PhaseTimer] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a previously compiled resume without compiling.
+
+        Args:
+            template: Template configuration and LaTeX source
+            content: Resume content data
+            customizations: Optional customization settings
+            output_format: OUTPUT_BASE64 to return 'pdf_base64', or
+                OUTPUT_FILE to return the raw 'pdf_bytes'
+            timer: Optional timer to record phases of this request in
+
+        Returns:
+            Dictionary with compiled PDF and metadata, or None on a cache miss
+        """
+        if self.result_cache is None:
+            return None
+
+        timer = timer or PhaseTimer()
+        with timer.phase('cache_lookup'):
+            cache_key = self.result_cache.make_key(template, content, customizations)
+            cached = self.result_cache.get(cache_key)
+        if cached is None:
+            return None
+
+        metadata = cached['metadata']
+        metadata['cached'] = True
+        logger.info(f"Served resume from cache for template: {template.get('id')}")
+        if output_format == OUTPUT_FILE:
+            metadata['timings'] = timer.as_milliseconds()
+            return {'pdf_bytes': cached['pdf_bytes'], 'metadata': metadata}
+
+        with timer.phase('encode'):
+            pdf_base64 = self._encode_pdf_to_base64(cached['pdf_bytes'])
+        metadata['timings'] = timer.as_milliseconds()
+        return {
+            'pdf_base64': pdf_base64,
+            'metadata': metadata
+        }
 
     def compile_resume(
         self,
         template: Dict[str, Any],
         content: Dict[str, Any],
-        customizations: Dict[str, Any] = None
+        customizations: Dict[str, Any] = None,
+        check_cache: bool = True,
+        output_format: str = OUTPUT_BASE64,
+        timer: Optional[PhaseTimer] = None,
+        cancellation: Optional[CompileCancellation] = None
     ) -> Dict[str, Any]:
         """
         Compile a resume from template and content.
@@ -57,54 +210,240 @@ class LaTeXCompiler:
             template: Template configuration and LaTeX source
             content: Resume content data
             customizations: Optional customization settings
+            check_cache: Whether to look in the result cache before compiling;
+                callers that already checked with get_cached_result pass False
+            output_format: OUTPUT_BASE64 to return 'pdf_base64', or OUTPUT_FILE
+                to return 'pdf_path', a file in the outbox the caller must
+                delete once sent (cache hits return 'pdf_bytes' instead)
+            timer: Optional timer to record phases of this request in; the
+                phases are returned in metadata['timings']
+            cancellation: Optional cancellation that kills pdflatex when a
+                newer request for the same session supersedes this one
 
         Returns:
             Dictionary with compiled PDF and metadata
+
+        Raises:
+            CompileSupersededError: If the compile was cancelled
         """
         start_time = time.time()
+        timer = timer or PhaseTimer()
+
+        # Serve identical requests from the result cache
+        if check_cache:
+            cached = self.get_cached_result(
+                template, content, customizations, output_format, timer
+            )
+            if cached is not None:
+                return cached
 
-        # Create temporary working directory
-        with tempfile.TemporaryDirectory(dir=self.work_dir) as temp_dir:
-            temp_path = Path(temp_dir)
+        # Borrow a reusable working directory
+        with COMPILES_IN_FLIGHT.track_inprogress(), self.scratch_space.acquire() as temp_path:
 
             try:
                 # Generate LaTeX source from template and content
-                latex_source = self._generate_latex_source(
-                    template, content, customizations
-                )
+                with SOURCE_GENERATION_SECONDS.time(), timer.phase('source_generation'):
+                    latex_source = self._generate_latex_source(
+                        template, content, customizations
+                    )
 
-                # Write LaTeX source to file
+                # Write LaTeX source to file and compile it to PDF
                 tex_file = temp_path / 'resume.tex'
-                tex_file.write_text(latex_source, encoding='utf-8')
-
-                # Compile LaTeX to PDF
-                pdf_path = self._compile_latex(tex_file)
-
-                # Read PDF and encode to base64
-                pdf_base64 = self._encode_pdf_to_base64(pdf_path)
+                output_profile = (customizations or {}).get('outputProfile', DEFAULT_OUTPUT_PROFILE)
+                engine = get_engine(template.get('engine'))
+                pdf_path, compile_info = self._compile_source(
+                    tex_file, latex_source, template.get('format'), timer, cancellation,
+                    output_profile, engine
+                )
 
                 compilation_time = time.time() - start_time
 
-                # Get PDF metadata
+                # Page count and size come from the pdflatex output; the PDF
+                # is only inspected when the log did not report them
+                log_metadata = compile_info.pop('log')
+                with timer.phase('page_count'):
+                    pages = log_metadata['pages']
+                    if pages is None:
+                        pages = self._count_pdf_pages(pdf_path)
+                    file_size = log_metadata['fileSize']
+                    if file_size is None:
+                        file_size = pdf_path.stat().st_size
+
                 metadata = {
-                    'pages': self._count_pdf_pages(pdf_path),
+                    'pages': pages,
                     'compilationTime': f"{compilation_time:.2f}s",
                     'templateId': template.get('id'),
                     'templateVersion': template.get('version', '1.0'),
-                    'fileSize': pdf_path.stat().st_size
+                    'fileSize': file_size,
+                    'cached': False,
+                    'warnings': log_metadata['warnings'],
+                    'outputProfile': output_profile,
+                    'engine': engine.name,
+                    **compile_info
                 }
 
+                COMPILE_SECONDS.observe(compilation_time)
+                ENGINE_COMPILE_SECONDS.labels(engine.name, template.get('id')).observe(compilation_time)
+                PDF_SIZE_BYTES.observe(file_size)
+                PDF_PAGES.observe(pages)
+
+                pdf_bytes = None
+                if self.result_cache is not None or output_format != OUTPUT_FILE:
+                    pdf_bytes = pdf_path.read_bytes()
+
+                if self.result_cache is not None:
+                    cache_key = self.result_cache.make_key(template, content, customizations)
+                    self.result_cache.put(cache_key, template.get('id'), pdf_bytes, metadata)
+
                 logger.info(f"Successfully compiled resume in {compilation_time:.2f}s")
 
+                if output_format == OUTPUT_FILE:
+                    # Move the PDF out of the work directory so it can be streamed
+                    # after the directory is cleaned up
+                    outbox_path = self.outbox_dir / f"{uuid.uuid4().hex}.pdf"
+                    pdf_path.replace(outbox_path)
+                    metadata['timings'] = timer.as_milliseconds()
+                    return {
+                        'pdf_path': outbox_path,
+                        'metadata': metadata
+                    }
+
+                with timer.phase('encode'):
+                    pdf_base64 = self._encode_pdf_to_base64(pdf_bytes)
+                metadata['timings'] = timer.as_milliseconds()
                 return {
                     'pdf_base64': pdf_base64,
                     'metadata': metadata
                 }
 
+            except CompileSupersededError:
+                raise
+            except LaTeXCompilationError as e:
+                # Keep the LaTeX output so callers can report structured errors
+                logger.error(f"Compilation failed: {str(e)}")
+                record_failure(FAILURE_LATEX)
+                raise
             except Exception as e:
                 logger.error(f"Compilation failed: {str(e)}")
+                record_failure(FAILURE_LATEX)
                 raise LaTeXCompilationError(f"Failed to compile resume: {str(e)}")
 
+    def get_cached_preview(
+        self,
+        template: Dict[str, Any],
+        content: Dict[str, Any],
+        customizations: Dict[str, Any] = None,
+        dpi: int = PREVIEW_DEFAULT_DPI,
+        all_pages: bool = False,
+        timer: Optional[PhaseTimer] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up previously rendered preview images without compiling.
+
+        Returns:
+            Dictionary with 'images' and metadata, or None on a cache miss
+        """
+        if self.result_cache is None:
+            return None
+
+        timer = timer or PhaseTimer()
+        with timer.phase('cache_lookup'):
+            cache_key = self.result_cache.make_key(template, content, customizations)
+            cached = self.result_cache.get_preview(cache_key, _preview_variant(dpi, all_pages))
+        if cached is None:
+            return None
+
+        cached['metadata']['cached'] = True
+        return self._preview_result(cached['images'], cached['metadata'], dpi, timer)
+
+    def compile_preview(
+        self,
+        template: Dict[str, Any],
+        content: Dict[str, Any],
+        customizations: Dict[str, Any] = None,
+        dpi: int = PREVIEW_DEFAULT_DPI,
+        all_pages: bool = False,
+        check_cache: bool = True,
+        timer: Optional[PhaseTimer] = None,
+        cancellation: Optional[CompileCancellation] = None
+    ) -> Dict[str, Any]:
+        """
+        Render a resume to PNG images for live previews.
+
+        The images are cached with the compiled PDF, and a cached PDF is
+        rasterized without compiling it again.
+
+        Args:
+            template: Template configuration and LaTeX source
+            content: Resume content data
+            customizations: Optional customization settings
+            dpi: Output resolution
+            all_pages: Render every page instead of only the first
+            check_cache: Whether to look for cached images first; callers
+                that already checked with get_cached_preview pass False
+            timer: Optional timer to record phases of this request in
+            cancellation: Optional cancellation passed on to compile_resume
+
+        Returns:
+            Dictionary with 'images', PNG bytes in page order, and metadata
+
+        Raises:
+            CompileSupersededError: If the compile was cancelled
+            LaTeXCompilationError: If the resume does not compile
+            RasterizationError: If the PDF cannot be rendered to images
+        """
+        timer = timer or PhaseTimer()
+        if check_cache:
+            cached = self.get_cached_preview(
+                template, content, customizations, dpi, all_pages, timer
+            )
+            if cached is not None:
+                return cached
+
+        result = self.compile_resume(
+            template, content, customizations,
+            output_format=OUTPUT_FILE, timer=timer, cancellation=cancellation
+        )
+
+        # Pages are rendered into a directory of their own so images left in
+        # a reused slot by another request can never be picked up
+        with RASTERIZE_SECONDS.time(), timer.phase('rasterize'), \
+                self.scratch_space.acquire() as temp_path, \
+                tempfile.TemporaryDirectory(dir=temp_path) as pages_dir:
+            pdf_path = result.get('pdf_path')
+            try:
+                if pdf_path is None:
+                    pdf_path = temp_path / 'resume.pdf'
+                    pdf_path.write_bytes(result['pdf_bytes'])
+                pages = rasterize_pdf(
+                    pdf_path, Path(pages_dir), dpi, last_page=None if all_pages else 1
+                )
+                images = [page.read_bytes() for page in pages]
+            finally:
+                pdf_path.unlink(missing_ok=True)
+
+        if self.result_cache is not None:
+            cache_key = self.result_cache.make_key(template, content, customizations)
+            self.result_cache.put_preview(cache_key, _preview_variant(dpi, all_pages), images)
+        return self._preview_result(images, result['metadata'], dpi, timer)
+
+    @staticmethod
+    def _preview_result(
+        images: list,
+        metadata: Dict[str, Any],
+        dpi: int,
+        timer: PhaseTimer
+    ) -> Dict[str, Any]:
+        """Attach preview details and timings to rendered images."""
+        metadata['preview'] = {
+            'format': 'png',
+            'dpi': dpi,
+            'pages': len(images),
+            'bytes': sum(len(image) for image in images)
+        }
+        metadata['timings'] = timer.as_milliseconds()
+        return {'images': images, 'metadata': metadata}
+
     def _generate_latex_source(
         self,
         template: Dict[str, Any],
@@ -122,93 +461,91 @@ class LaTeXCompiler:
         Returns:
             Complete LaTeX source code
         """
-        # Get base template
-        latex_source = template['latex_source']
+        # Templates from TemplateManager carry a pre-parsed renderer
+        renderer = template.get('renderer') or CompiledTemplate(template['latex_source'])
 
-        # Apply customizations
+        values = {}
         if customizations:
-            latex_source = self._apply_customizations(latex_source, customizations)
-
-        # Replace content variables
-        latex_source = self._replace_content_variables(latex_source, content)
+            values.update(self._customization_values(customizations))
+        values.update(self._content_values(content))
 
-        return latex_source
+        return renderer.render(values)
 
-    def _apply_customizations(self, latex_source: str, customizations: Dict[str, Any]) -> str:
-        """Apply customizations to LaTeX source."""
+    def _customization_values(self, customizations: Dict[str, Any]) -> Dict[str, str]:
+        """Build placeholder values for customizations."""
         # This is a placeholder - implement actual customization logic
         # For example, color scheme changes, font changes, etc.
+        values = {}
 
         if 'colorScheme' in customizations:
-            color = customizations['colorScheme']
-            # Replace color definitions in LaTeX source
-            latex_source = latex_source.replace('{{PRIMARY_COLOR}}', color)
+            # Color definitions in LaTeX source
+            values['PRIMARY_COLOR'] = customizations['colorScheme']
 
         if 'fontFamily' in customizations:
-            font = customizations['fontFamily']
-            # Replace font definitions
-            latex_source = latex_source.replace('{{FONT_FAMILY}}', font)
-
-        return latex_source
-
-    def _replace_content_variables(self, latex_source: str, content: Dict[str, Any]) -> str:
-        """Replace content variables in LaTeX source."""
-        # Personal information
-        personal_info = content.get('personalInfo', {})
-        latex_source = latex_source.replace('{{NAME}}',
-                                           sanitize_latex_content(personal_info.get('name', '')))
-        latex_source = latex_source.replace('{{EMAIL}}',
-                                           personal_info.get('email', ''))
-        latex_source = latex_source.replace('{{PHONE}}',
-                                           personal_info.get('phone', ''))
-        latex_source = latex_source.replace('{{LOCATION}}',
-                                           sanitize_latex_content(personal_info.get('location', '')))
-
-        # Summary
-        summary = content.get('summary', '')
-        latex_source = latex_source.replace('{{SUMMARY}}',
-                                           sanitize_latex_content(summary))
-
-        # Experience section
-        experience_latex = self._generate_experience_section(content.get('experience', []))
-        latex_source = latex_source.replace('{{EXPERIENCE_SECTION}}', experience_latex)
-
-        # Education section
-        education_latex = self._generate_education_section(content.get('education', []))
-        latex_source = latex_source.replace('{{EDUCATION_SECTION}}', education_latex)
-
-        # Skills section
-        skills_latex = self._generate_skills_section(content.get('skills', []))
-        latex_source = latex_source.replace('{{SKILLS_SECTION}}', skills_latex)
-
-        # Certifications section
-        certs_latex = self._generate_certifications_section(content.get('certifications', []))
-        latex_source = latex_source.replace('{{CERTIFICATIONS_SECTION}}', certs_latex)
-
-        return latex_source
+            # Font definitions
+            values['FONT_FAMILY'] = customizations['fontFamily']
+
+        return values
+
+    def _content_values(self, content: Dict[str, Any]) -> Dict[str, str]:
+        """Build placeholder values for resume content."""
+        # Personal information is escaped in one walk, except for raw fields
+        # such as email and phone. Section items are escaped by their
+        # renderers, so items served from the fragment cache skip escaping.
+        personal_info = sanitize_content_tree(content.get('personalInfo', {}))
+
+        return {
+            'NAME': personal_info.get('name', ''),
+            'EMAIL': personal_info.get('email', ''),
+            'PHONE': personal_info.get('phone', ''),
+            'LOCATION': personal_info.get('location', ''),
+            'SUMMARY': sanitize_latex_content(content.get('summary', '')),
+            'EXPERIENCE_SECTION': self._generate_experience_section(content.get('experience', [])),
+            'EDUCATION_SECTION': self._generate_education_section(content.get('education', [])),
+            'SKILLS_SECTION': self._generate_skills_section(content.get('skills', [])),
+            'CERTIFICATIONS_SECTION': self._generate_certifications_section(
+                content.get('certifications', [])
+            )
+        }
+
+    def _fragment(self, kind: str, data: Any, render) -> str:
+        """Render a LaTeX fragment through the fragment cache when one is configured."""
+        if self.fragment_cache is None:
+            return render(data)
+        return self.fragment_cache.get_or_render(kind, data, render)
+
+    def _section(self, kind: str, items: list, render_item, join) -> str:
+        """Render a section of items through the fragment cache when one is configured."""
+        if self.fragment_cache is None:
+            return join([render_item(item) for item in items])
+        return self.fragment_cache.get_or_render_section(
+            f"{kind}_section", kind, items, render_item, join
+        )
 
     def _generate_experience_section(self, experiences: list) -> str:
         """Generate LaTeX for experience section."""
         if not experiences:
             return ""
 
-        latex_lines = []
-        for exp in experiences:
-            title = sanitize_latex_content(exp.get('title', ''))
-            company = sanitize_latex_content(exp.get('company', ''))
-            duration = sanitize_latex_content(exp.get('duration', ''))
-            bullets = exp.get('bullets', [])
+        return self._section('experience', experiences, self._render_experience_item, "\n".join)
 
-            latex_lines.append(f"\\experienceitem{{{title}}}{{{company}}}{{{duration}}}")
+    def _render_experience_item(self, exp: Dict[str, Any]) -> str:
+        """Generate LaTeX for one experience entry."""
+        title = sanitize_latex_content(exp.get('title', ''))
+        company = sanitize_latex_content(exp.get('company', ''))
+        duration = sanitize_latex_content(exp.get('duration', ''))
+        bullets = exp.get('bullets', [])
 
-            if bullets:
-                latex_lines.append("\\begin{itemize}")
-                for bullet in bullets:
-                    safe_bullet = sanitize_latex_content(str(bullet))
-                    latex_lines.append(f"    \\item {safe_bullet}")
-                latex_lines.append("\\end{itemize}")
+        latex_lines = [f"\\experienceitem{{{title}}}{{{company}}}{{{duration}}}"]
 
-            latex_lines.append("")  # Empty line between experiences
+        if bullets:
+            latex_lines.append("\\begin{itemize}")
+            for bullet in bullets:
+                safe_bullet = sanitize_latex_content(str(bullet))
+                latex_lines.append(f"    \\item {safe_bullet}")
+            latex_lines.append("\\end{itemize}")
+
+        latex_lines.append("")  # Empty line between experiences
 
         return "\n".join(latex_lines)
 
@@ -217,75 +554,300 @@ class LaTeXCompiler:
         if not education:
             return ""
 
-        latex_lines = []
-        for edu in education:
-            degree = sanitize_latex_content(edu.get('degree', ''))
-            school = sanitize_latex_content(edu.get('school', ''))
-            year = sanitize_latex_content(str(edu.get('year', '')))
+        return self._section('education', education, self._render_education_item, "\n".join)
 
-            latex_lines.append(f"\\educationitem{{{degree}}}{{{school}}}{{{year}}}")
+    def _render_education_item(self, edu: Dict[str, Any]) -> str:
+        """Generate LaTeX for one education entry."""
+        degree = sanitize_latex_content(edu.get('degree', ''))
+        school = sanitize_latex_content(edu.get('school', ''))
+        year = sanitize_latex_content(str(edu.get('year', '')))
 
-        return "\n".join(latex_lines)
+        return f"\\educationitem{{{degree}}}{{{school}}}{{{year}}}"
 
     def _generate_skills_section(self, skills: list) -> str:
         """Generate LaTeX for skills section."""
         if not skills:
             return ""
 
-        safe_skills = [sanitize_latex_content(str(skill)) for skill in skills]
-        return ", ".join(safe_skills)
+        # Individual skills are short and already memoized by sanitize_latex_content
+        return self._fragment('skills_section', skills, lambda items: ", ".join(
+            sanitize_latex_content(str(skill)) for skill in items
+        ))
 
     def _generate_certifications_section(self, certifications: list) -> str:
         """Generate LaTeX for certifications section."""
         if not certifications:
             return ""
 
-        latex_lines = []
-        for cert in certifications:
-            if isinstance(cert, str):
-                latex_lines.append(f"\\item {sanitize_latex_content(cert)}")
-            elif isinstance(cert, dict):
-                name = sanitize_latex_content(cert.get('name', ''))
-                issuer = sanitize_latex_content(cert.get('issuer', ''))
-                date = sanitize_latex_content(cert.get('date', ''))
-                latex_lines.append(f"\\certificationitem{{{name}}}{{{issuer}}}{{{date}}}")
+        return self._section(
+            'certification', certifications, self._render_certification_item,
+            lambda fragments: "\n".join(fragment for fragment in fragments if fragment)
+        )
 
-        return "\n".join(latex_lines)
+    def _render_certification_item(self, cert: Any) -> str:
+        """Generate LaTeX for one certification, or "" if it is not renderable."""
+        if isinstance(cert, str):
+            return f"\\item {sanitize_latex_content(cert)}"
+        elif isinstance(cert, dict):
+            name = sanitize_latex_content(cert.get('name', ''))
+            issuer = sanitize_latex_content(cert.get('issuer', ''))
+            date = sanitize_latex_content(cert.get('date', ''))
+            return f"\\certificationitem{{{name}}}{{{issuer}}}{{{date}}}"
+        return ""
+
+    def _compile_source(
+        self,
+        tex_file: Path,
+        latex_source: str,
+        format_info: Optional[Dict[str, Any]] = None,
+        timer: Optional[PhaseTimer] = None,
+        cancellation: Optional[CompileCancellation] = None,
+        output_profile: str = DEFAULT_OUTPUT_PROFILE,
+        engine: Optional[TexEngine] = None
+    ) -> Tuple[Path, Dict[str, Any]]:
+        """
+        Write LaTeX source and compile it, using a precompiled format if possible.
 
-    def _compile_latex(self, tex_file: Path) -> Path:
-        """Compile LaTeX file to PDF."""
-        logger.info(f"Compiling {tex_file}")
+        Args:
+            tex_file: Path to write the LaTeX source to
+            latex_source: Complete LaTeX source
+            format_info: Format file information from FormatCache
+            timer: Optional timer to record file writes and passes in
+            cancellation: Optional cancellation of the compile
+            output_profile: Output profile for the PDF output settings
+            engine: TeX engine to run; pdflatex if not given
 
-        # Run pdflatex
-        result = subprocess.run(
-            ['pdflatex', '-interaction=nonstopmode', '-output-directory',
-             str(tex_file.parent), str(tex_file)],
-            capture_output=True,
+        Returns:
+            Tuple of (PDF path, compile details: 'usedFormat', 'passes' and
+            'log' with the metadata extracted from the final pass output)
+        """
+        timer = timer or PhaseTimer()
+        engine = engine or get_engine()
+        if format_info and engine.supports_formats:
+            preamble, body = FormatCache.split_preamble(latex_source)
+            fmt_file = Path(format_info['directory']) / f"{format_info['name']}.fmt"
+
+            # The format only matches if the preamble is unchanged since it was dumped
+            if body and fmt_file.exists() and \
+                    FormatCache.preamble_hash(preamble) == format_info['preamble_hash']:
+                with timer.phase('file_write'):
+                    tex_file.write_text(body, encoding='utf-8')
+                try:
+                    pdf_file, details = self._compile_latex(
+                        tex_file, format_info, timer, cancellation, output_profile, engine
+                    )
+                    return pdf_file, {'usedFormat': True, **details}
+                except LaTeXCompilationError as e:
+                    # Errors in the content itself would fail a normal compile too
+                    if not self._is_format_error(e.latex_output or ''):
+                        raise
+                    logger.warning(f"Format {format_info['name']} is unusable, "
+                                   f"compiling without it")
+            else:
+                logger.info(f"Format {format_info['name']} is missing or stale")
+
+        with timer.phase('file_write'):
+            tex_file.write_text(latex_source, encoding='utf-8')
+        pdf_file, details = self._compile_latex(
+            tex_file, timer=timer, cancellation=cancellation,
+            output_profile=output_profile, engine=engine
+        )
+        return pdf_file, {'usedFormat': False, **details}
+
+    @staticmethod
+    def _is_format_error(latex_output: str) -> bool:
+        """Check whether pdflatex failed because the format file could not be used."""
+        output = latex_output.lower()
+        return 'format file' in output or 'was written by' in output
+
+    def _compile_latex(
+        self,
+        tex_file: Path,
+        format_info: Optional[Dict[str, Any]] = None,
+        timer: Optional[PhaseTimer] = None,
+        cancellation: Optional[CompileCancellation] = None,
+        output_profile: str = DEFAULT_OUTPUT_PROFILE,
+        engine: Optional[TexEngine] = None
+    ) -> Tuple[Path, Dict[str, Any]]:
+        """
+        Compile LaTeX file to PDF, rerunning only while auxiliary files change.
+
+        Cross-references, lastpage and hyperref outlines are read from the
+        auxiliary files of the previous pass, so another pass is needed only
+        when a pass wrote different auxiliary data than it read.
+
+        Args:
+            tex_file: LaTeX file to compile
+            format_info: Optional precompiled format to start pdflatex from
+            timer: Optional timer to record each pass in as '<engine>_pass_<n>'
+            cancellation: Optional cancellation of the compile
+            output_profile: Output profile for the PDF output settings
+            engine: TeX engine to run; pdflatex if not given
+
+        Returns:
+            Tuple of (PDF path, details with 'passes' run and 'log' metadata
+            extracted from the final pass output)
+        """
+        timer = timer or PhaseTimer()
+        engine = engine or get_engine()
+        previous_digest = self._auxiliary_digest(tex_file)
+        passes = 0
+
+        while True:
+            passes += 1
+            with timer.phase(f"{engine.name}_pass_{passes}"):
+                pdf_file, log_metadata = self._run_engine(
+                    tex_file, format_info, cancellation, output_profile, engine
+                )
+
+            digest = self._auxiliary_digest(tex_file)
+            if digest == previous_digest:
+                break
+            if passes >= self.max_passes:
+                logger.warning(f"Auxiliary files still changing after {passes} passes")
+                break
+            previous_digest = digest
+
+        return pdf_file, {'passes': passes, 'log': log_metadata}
+
+    @staticmethod
+    def _auxiliary_digest(tex_file: Path) -> str:
+        """Hash the auxiliary files a pdflatex pass reads back on the next pass."""
+        digest = hashlib.sha256()
+        for suffix in AUXILIARY_SUFFIXES:
+            aux_file = tex_file.with_suffix(suffix)
+            digest.update(suffix.encode('ascii'))
+            if not aux_file.exists():
+                continue
+            for line in aux_file.read_bytes().splitlines():
+                # The kernel writes these on every run; on their own they do not
+                # need another pass
+                if line.strip() == b'\\relax' or line.startswith(b'\\gdef \\@abspage@last'):
+                    continue
+                digest.update(line)
+                digest.update(b'\n')
+        return digest.hexdigest()
+
+    def _run_engine(
+        self,
+        tex_file: Path,
+        format_info: Optional[Dict[str, Any]] = None,
+        cancellation: Optional[CompileCancellation] = None,
+        output_profile: str = DEFAULT_OUTPUT_PROFILE,
+        engine: Optional[TexEngine] = None
+    ) -> Tuple[Path, Dict[str, Any]]:
+        """
+        Run a single TeX engine pass over a LaTeX file.
+
+        Output is parsed line by line as the engine produces it, so only the
+        extracted metadata, the first few errors and a short tail of the log
+        are ever held in memory. A run that keeps producing errors after the
+        error limit is reached is stopped early, since it will fail anyway.
+
+        Returns:
+            Tuple of (PDF path, metadata extracted from the output)
+
+        Raises:
+            CompileSupersededError: If the cancellation fired before or
+                while the engine ran
+        """
+        if cancellation is not None:
+            cancellation.raise_if_cancelled()
+
+        engine = engine or get_engine()
+        logger.info(f"Compiling {tex_file} with {engine.name}")
+
+        command, env = engine.command(
+            tex_file, output_profile, format_info if engine.supports_formats else None
+        )
+        metadata = LogMetadataExtractor()
+        errors = LaTeXErrorCollector()
+
+        # Run the engine; stderr is folded into stdout so one reader drains both
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
             text=True,
+            encoding='utf-8',
+            errors='replace',
             cwd=tex_file.parent,
-            timeout=60
+            env=env
         )
+        if cancellation is not None:
+            cancellation.attach_process(process)
+        timed_out = threading.Event()
+
+        def kill_on_timeout():
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(PDFLATEX_TIMEOUT_SECONDS, kill_on_timeout)
+        timer.start()
+        started = time.perf_counter()
+        stopped_early = False
+        try:
+            for line in process.stdout:
+                line = line.rstrip('\n')
+                metadata.feed_line(line)
+                errors.feed_line(line)
+                if errors.full and not stopped_early:
+                    stopped_early = True
+                    process.kill()
+            returncode = process.wait()
+        finally:
+            timer.cancel()
+            if cancellation is not None:
+                cancellation.detach_process()
+            process.stdout.close()
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            COMPILE_PHASE_SECONDS.labels(engine.name).observe(time.perf_counter() - started)
+
+        if cancellation is not None:
+            cancellation.raise_if_cancelled()
 
         pdf_file = tex_file.with_suffix('.pdf')
 
-        if result.returncode != 0 or not pdf_file.exists():
-            error_msg = f"LaTeX compilation failed:\n{result.stdout}\n{result.stderr}"
-            raise LaTeXCompilationError(error_msg, result.stdout)
-
-        return pdf_file
+        if returncode != 0 or not pdf_file.exists():
+            raise LaTeXCompilationError(
+                self._failure_summary(errors, timed_out.is_set()),
+                errors.tail,
+                errors.result()
+            )
 
-    def _encode_pdf_to_base64(self, pdf_path: Path) -> str:
-        """Encode PDF file to base64 string."""
-        with open(pdf_path, 'rb') as pdf_file:
-            pdf_bytes = pdf_file.read()
+        return pdf_file, metadata.result()
+
+    @staticmethod
+    def _failure_summary(errors: LaTeXErrorCollector, timed_out: bool) -> str:
+        """Build a short exception message for a failed pdflatex run."""
+        if timed_out:
+            return f"LaTeX compilation timed out after {PDFLATEX_TIMEOUT_SECONDS}s"
+        if errors.errors:
+            first = errors.errors[0]
+            location = f" (line {first['line_number']})" if first['line_number'] else ''
+            return (f"LaTeX compilation failed with {errors.total_errors} error(s); "
+                    f"first: {first['error']}{location}")
+        return f"LaTeX compilation failed:\n{errors.tail}"
+
+    def _encode_pdf_to_base64(self, pdf_bytes: bytes) -> str:
+        """Encode PDF bytes to base64 string."""
+        with ENCODE_SECONDS.time():
             return base64.b64encode(pdf_bytes).decode('utf-8')
 
     def _count_pdf_pages(self, pdf_path: Path) -> int:
-        """Count pages in PDF file."""
-        # Simple page counting - could be improved with a proper PDF library
-        try:
-            with open(pdf_path, 'rb') as f:
-                content = f.read().decode('latin-1')
-                return content.count('/Type /Page')
-        except:
+        """Count pages in PDF file from its page tree."""
+        pages = read_pdf_page_count(pdf_path)
+        if pages is None:
+            logger.warning(f"Could not determine page count of {pdf_path.name}")
             return 1  # Default to 1 page if counting fails
+        return pages
+
+
+if __name__ == '__main__':
+    # Verify pdflatex once, e.g. during the Docker image build, so service
+    # startup can skip running it
+    logging.basicConfig(level=logging.INFO)
+    print(json.dumps(verify_latex_installation()))
@@ -0,0 +1,114 @@
+"""
+Prometheus metrics for the compile pipeline.
+
+This module defines the process-wide metrics exposed on /metrics. The
+service runs as a single process, so the default registry is used.
+"""
+
+from prometheus_client import Counter, Gauge, Histogram, CONTENT_TYPE_LATEST, generate_latest
+
+# Failure types counted by COMPILE_FAILURES
+FAILURE_VALIDATION = 'validation'
+FAILURE_TEMPLATE_NOT_FOUND = 'TemplateNotFoundError'
+FAILURE_INVALID_TEMPLATE = 'InvalidTemplateError'
+FAILURE_LATEX = 'LaTeXCompilationError'
+
+LATENCY_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+COMPILE_PHASE_SECONDS = Histogram(
+    'latex_compile_phase_seconds',
+    'Time spent in each phase of a resume compile',
+    ['phase'],
+    buckets=LATENCY_BUCKETS
+)
+TEMPLATE_LOAD_SECONDS = COMPILE_PHASE_SECONDS.labels('template_load')
+SOURCE_GENERATION_SECONDS = COMPILE_PHASE_SECONDS.labels('source_generation')
+ENCODE_SECONDS = COMPILE_PHASE_SECONDS.labels('encode')
+RASTERIZE_SECONDS = COMPILE_PHASE_SECONDS.labels('rasterize')
+
+COMPILE_SECONDS = Histogram(
+    'latex_compile_seconds',
+    'End-to-end time of resume compiles that ran a TeX engine',
+    buckets=LATENCY_BUCKETS
+)
+
+# Compares engines per template; templates are a small fixed set
+ENGINE_COMPILE_SECONDS = Histogram(
+    'latex_engine_compile_seconds',
+    'End-to-end time of resume compiles by TeX engine and template',
+    ['engine', 'template'],
+    buckets=LATENCY_BUCKETS
+)
+
+COMPILES_IN_FLIGHT = Gauge(
+    'latex_compiles_in_flight',
+    'Resume compiles currently running'
+)
+
+COMPILES_QUEUED = Gauge(
+    'latex_compiles_queued',
+    'Resume compiles waiting for a compile worker'
+)
+
+COMPILES_REJECTED = Counter(
+    'latex_compiles_rejected_total',
+    'Compile requests shed with 429 because capacity was saturated'
+)
+
+COMPILES_SUPERSEDED = Counter(
+    'latex_compiles_superseded_total',
+    'Compiles cancelled because a newer request for the same session arrived'
+)
+
+COMPILE_FAILURES = Counter(
+    'latex_compile_failures_total',
+    'Failed compile requests by failure type',
+    ['type']
+)
+
+PDF_SIZE_BYTES = Histogram(
+    'latex_pdf_size_bytes',
+    'Size of compiled resume PDFs',
+    buckets=(8e3, 16e3, 32e3, 64e3, 128e3, 256e3, 512e3, 1e6, 2e6, 4e6)
+)
+
+PDF_PAGES = Histogram(
+    'latex_pdf_pages',
+    'Page count of compiled resume PDFs',
+    buckets=(1, 2, 3, 4, 5, 6, 8, 10, 15, 20)
+)
+
+
+RESPONSE_BYTES = Counter(
+    'latex_response_bytes_total',
+    'Bytes of compressed responses before and after compression',
+    ['stage']
+)
+
+STARTUP_SECONDS = Gauge(
+    'latex_service_startup_seconds',
+    'Time from process import to the service being ready to route requests'
+)
+
+FIRST_SUCCESS_SECONDS = Gauge(
+    'latex_service_first_success_seconds',
+    'Time from startup to the first successful response, by endpoint',
+    ['endpoint']
+)
+
+
+def record_failure(failure_type: str):
+    """Count a failed compile request."""
+    COMPILE_FAILURES.labels(failure_type).inc()
+
+
+def render_metrics():
+    """
+    Render all metrics in the Prometheus text exposition format.
+
+    Returns:
+        Tuple of (payload bytes, content type)
+    """
+    return generate_latest(), CONTENT_TYPE_LATEST
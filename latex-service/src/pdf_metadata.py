@@ -0,0 +1,164 @@
+"""
+PDF metadata extraction.
+
+This module reads page count, file size and layout/font warnings from the
+pdflatex output that is already in memory after a compile, with a bounded
+read of the PDF itself as a fallback.
+"""
+
+import re
+import zlib
+from typing import Dict, Any, Iterator, List, Optional
+from pathlib import Path
+
+# "Output written on resume.pdf (2 pages, 48213 bytes)." -- xelatex omits the bytes
+OUTPUT_WRITTEN_PATTERN = re.compile(
+    r'Output written on .*?\((\d+) pages?(?:, (\d+) bytes)?\)\.'
+)
+BOX_WARNING_PATTERN = re.compile(r'^(Overfull|Underfull) \\[hv]box')
+FONT_WARNING_MARKERS = (
+    'LaTeX Font Warning: Font shape',
+    'LaTeX Font Warning: Some font shapes were not available',
+    'Missing character: There is no',
+    'not loadable: Metric (TFM) file not found'
+)
+
+# Keep at most this many individual warning messages per kind
+MAX_WARNING_MESSAGES = 10
+
+# How much of the PDF the fallback page counter reads from each end
+PDF_FALLBACK_READ_BYTES = 64 * 1024
+
+PAGES_COUNT_PATTERN = re.compile(rb'/Type\s*/Pages\b[^>]*?/Count\s+(\d+)')
+PAGE_COUNT_FIRST_PATTERN = re.compile(rb'/Count\s+(\d+)[^>]*?/Type\s*/Pages\b')
+
+# Dictionary and stream start of a PDF 1.5 object stream, which holds the
+# page tree when pdfTeX runs with \pdfobjcompresslevel above 0
+OBJECT_STREAM_PATTERN = re.compile(rb'<<([^<>]*/Type\s*/ObjStm\b[^<>]*)>>\s*stream\r?\n')
+
+
+class LogMetadataExtractor:
+    """Collects PDF metadata from pdflatex output, one line at a time."""
+
+    def __init__(self):
+        self.pages: Optional[int] = None
+        self.file_size: Optional[int] = None
+        self.overfull_boxes = 0
+        self.underfull_boxes = 0
+        self.box_messages: List[str] = []
+        self.missing_fonts: List[str] = []
+        self._output_line: Optional[str] = None
+
+    def feed_line(self, line: str):
+        """
+        Process one line of pdflatex output.
+
+        Args:
+            line: Output line without its trailing newline
+        """
+        # TeX wraps long lines at 79 characters, so the "Output written"
+        # message can span several lines
+        if self._output_line is not None:
+            self._output_line += line
+            self._match_output_line()
+            return
+
+        if line.startswith('Output written on'):
+            self._output_line = line
+            self._match_output_line()
+            return
+
+        box_match = BOX_WARNING_PATTERN.match(line)
+        if box_match:
+            if box_match.group(1) == 'Overfull':
+                self.overfull_boxes += 1
+            else:
+                self.underfull_boxes += 1
+            if len(self.box_messages) < MAX_WARNING_MESSAGES:
+                self.box_messages.append(line.strip())
+            return
+
+        if any(marker in line for marker in FONT_WARNING_MARKERS):
+            message = line.strip()
+            if message not in self.missing_fonts and len(self.missing_fonts) < MAX_WARNING_MESSAGES:
+                self.missing_fonts.append(message)
+
+    def _match_output_line(self):
+        """Parse the accumulated "Output written" message once it is complete."""
+        match = OUTPUT_WRITTEN_PATTERN.search(self._output_line)
+        if match:
+            self.pages = int(match.group(1))
+            if match.group(2):
+                self.file_size = int(match.group(2))
+            self._output_line = None
+        elif len(self._output_line) > 1024:
+            # Not a message we understand; stop accumulating
+            self._output_line = None
+
+    def result(self) -> Dict[str, Any]:
+        """Return the collected metadata."""
+        return {
+            'pages': self.pages,
+            'fileSize': self.file_size,
+            'warnings': {
+                'overfullBoxes': self.overfull_boxes,
+                'underfullBoxes': self.underfull_boxes,
+                'boxMessages': list(self.box_messages),
+                'missingFonts': list(self.missing_fonts)
+            }
+        }
+
+
+def read_pdf_page_count(pdf_path: Path) -> Optional[int]:
+    """
+    Count pages from the PDF page tree using a bounded read.
+
+    Reads at most PDF_FALLBACK_READ_BYTES from the start and the end of the
+    file, where pdfTeX places the page tree root and the trailer, and takes
+    the largest /Count of a /Type /Pages node, including nodes packed into
+    compressed object streams. Individual /Type /Page objects are counted
+    only when no page tree node is readable.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Page count, or None if it cannot be determined without a full parse
+    """
+    try:
+        size = pdf_path.stat().st_size
+        with open(pdf_path, 'rb') as f:
+            if size <= 2 * PDF_FALLBACK_READ_BYTES:
+                data = f.read()
+            else:
+                head = f.read(PDF_FALLBACK_READ_BYTES)
+                f.seek(-PDF_FALLBACK_READ_BYTES, 2)
+                data = head + b'\n' + f.read()
+    except OSError:
+        return None
+
+    counts = []
+    for objects in (data, *_object_stream_contents(data)):
+        counts.extend(int(count) for count in PAGES_COUNT_PATTERN.findall(objects))
+        counts.extend(int(count) for count in PAGE_COUNT_FIRST_PATTERN.findall(objects))
+    if counts:
+        return max(counts)
+
+    if size <= 2 * PDF_FALLBACK_READ_BYTES:
+        pages = len(re.findall(rb'/Type\s*/Page\b(?!s)', data))
+        return pages or None
+
+    return None
+
+
+def _object_stream_contents(data: bytes) -> Iterator[bytes]:
+    """Yield the decompressed objects of each Flate object stream in data."""
+    for match in OBJECT_STREAM_PATTERN.finditer(data):
+        if b'/FlateDecode' not in match.group(1):
+            continue
+        try:
+            # Stops at the end of the compressed data; a stream cut off by
+            # the bounded read yields what could be decompressed
+            yield zlib.decompressobj().decompress(data[match.end():])
+        except zlib.error:
+            continue
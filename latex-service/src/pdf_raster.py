@@ -0,0 +1,84 @@
+"""
+PDF rasterization.
+
+This module renders PDF pages to PNG images with Ghostscript.
+"""
+
+import shutil
+import logging
+import subprocess
+from typing import List, Optional
+from pathlib import Path
+
+from utils.error_handling import RasterizationError
+
+logger = logging.getLogger(__name__)
+
+GHOSTSCRIPT = 'gs'
+
+
+def rasterizer_available() -> bool:
+    """Check whether Ghostscript is installed."""
+    return shutil.which(GHOSTSCRIPT) is not None
+
+
+def rasterize_pdf(
+    pdf_path: Path,
+    output_dir: Path,
+    dpi: int,
+    first_page: int = 1,
+    last_page: Optional[int] = None,
+    prefix: str = 'page'
+) -> List[Path]:
+    """
+    Render PDF pages to PNG files.
+
+    Existing '<prefix>-<n>.png' files in output_dir are deleted first, so
+    the result only ever lists pages of this PDF.
+
+    Args:
+        pdf_path: PDF to render
+        output_dir: Directory to write '<prefix>-<n>.png' files to
+        dpi: Output resolution
+        first_page: First page to render, starting at 1
+        last_page: Last page to render, or None for the last page of the PDF
+        prefix: File name prefix for the rendered pages
+
+    Returns:
+        Paths of the rendered pages, in page order
+
+    Raises:
+        RasterizationError: If Ghostscript is missing or fails
+    """
+    if not rasterizer_available():
+        raise RasterizationError("Ghostscript (gs) is not installed")
+
+    for stale_page in output_dir.glob(f"{prefix}-*.png"):
+        stale_page.unlink(missing_ok=True)
+
+    command = [
+        GHOSTSCRIPT, '-q', '-dSAFER', '-dBATCH', '-dNOPAUSE',
+        '-sDEVICE=png16m', f"-r{dpi}",
+        '-dTextAlphaBits=4', '-dGraphicsAlphaBits=4',
+        f"-dFirstPage={first_page}"
+    ]
+    if last_page is not None:
+        command.append(f"-dLastPage={last_page}")
+    command += [f"-sOutputFile={output_dir / prefix}-%d.png", str(pdf_path)]
+
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, errors='replace', timeout=60)
+    except subprocess.TimeoutExpired:
+        raise RasterizationError(f"Ghostscript timed out rendering {pdf_path.name}")
+
+    if result.returncode != 0:
+        raise RasterizationError(f"Ghostscript failed: {(result.stderr or result.stdout)[-1000:]}")
+
+    # Ghostscript numbers output files from 1 regardless of -dFirstPage
+    pages = sorted(
+        output_dir.glob(f"{prefix}-*.png"),
+        key=lambda path: int(path.stem.rsplit('-', 1)[1])
+    )
+    if not pages:
+        raise RasterizationError(f"Ghostscript produced no images for {pdf_path.name}")
+    return pages
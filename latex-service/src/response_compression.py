@@ -0,0 +1,121 @@
+"""
+HTTP response compression.
+
+This module compresses JSON and text responses with brotli or gzip,
+whichever the client accepts. Compile responses carry the PDF as base64,
+which compresses back to roughly the size of the PDF itself.
+"""
+
+import os
+import gzip
+import logging
+from typing import Optional
+
+from werkzeug.datastructures import Accept, ETags
+from werkzeug.wrappers import Response
+
+from metrics import RESPONSE_BYTES
+
+try:
+    import brotli
+except ImportError:
+    # Optional; responses fall back to gzip without it
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_MIMETYPES = ('application/json', 'text/plain')
+
+# Smaller bodies gain less than the compression headers cost
+MIN_COMPRESS_BYTES = int(os.getenv('RESPONSE_COMPRESSION_MIN_BYTES', 1024))
+GZIP_LEVEL = int(os.getenv('RESPONSE_GZIP_LEVEL', 6))
+BROTLI_QUALITY = int(os.getenv('RESPONSE_BROTLI_QUALITY', 5))
+
+
+def supported_encodings() -> list:
+    """Return the content encodings this process can produce, best first."""
+    return ['br', 'gzip'] if brotli is not None else ['gzip']
+
+
+def _negotiate(accept_encodings: Accept) -> Optional[str]:
+    """Pick the best content encoding the client accepts, if any."""
+    return accept_encodings.best_match(supported_encodings())
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    """Compress a body with the given content encoding."""
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    # A fixed header timestamp keeps the output identical for identical input
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _encoded_etag(etag: str, encoding: str) -> str:
+    """
+    Derive the strong ETag of an encoded representation.
+
+    A strong ETag promises byte-identical bodies, so each content encoding
+    of a resource gets its own tag.
+    """
+    return f"{etag}-{encoding}"
+
+
+def compress_response(
+    response: Response,
+    accept_encodings: Accept,
+    if_none_match: Optional[ETags] = None
+) -> Response:
+    """
+    Compress a buffered JSON or text response for the client.
+
+    Streamed and file responses (PDFs, images) are left alone; they are
+    already compressed formats. Compressed responses report their original
+    size in X-Uncompressed-Content-Length, and a strong ETag is suffixed
+    with the encoding. A revalidation carrying that suffixed tag is answered
+    with 304 Not Modified.
+
+    Args:
+        response: Response about to be sent
+        accept_encodings: The request's parsed Accept-Encoding header
+        if_none_match: The request's parsed If-None-Match header
+
+    Returns:
+        The response, compressed in place if worthwhile
+    """
+    if response.direct_passthrough or response.is_streamed \
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES \
+            or 'Content-Encoding' in response.headers:
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = _negotiate(accept_encodings)
+    if encoding is None or response.status_code != 200:
+        return response
+
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        # Compression is deterministic, so a client holding the encoded tag
+        # already has exactly the bytes this response would be compressed to
+        encoded_etag = _encoded_etag(etag, encoding)
+        if if_none_match is not None and if_none_match.contains_weak(encoded_etag):
+            response.set_etag(encoded_etag)
+            response.status_code = 304
+            return response
+
+    body = response.get_data()
+    if len(body) < MIN_COMPRESS_BYTES:
+        return response
+
+    compressed = _compress(body, encoding)
+    if len(compressed) >= len(body):
+        return response
+
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    if etag and not weak:
+        response.set_etag(encoded_etag)
+    response.headers['X-Uncompressed-Content-Length'] = str(len(body))
+
+    RESPONSE_BYTES.labels('uncompressed').inc(len(body))
+    RESPONSE_BYTES.labels('sent').inc(len(compressed))
+    return response
@@ -0,0 +1,231 @@
+"""
+Compiled PDF result cache.
+
+This module provides a content-addressed, size-bounded LRU cache for
+compiled resumes so identical compile requests skip pdflatex entirely.
+Raster previews of a cached PDF are stored in the same entry and share
+its byte budget and lifetime.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CompileResultCache:
+    """LRU cache of compiled PDFs bounded by total PDF and preview bytes."""
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        if max_bytes is None:
+            max_bytes = int(os.getenv('PDF_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+        self.max_bytes = max_bytes
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._preview_hits = 0
+        self._preview_misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def make_key(
+        template: Dict[str, Any],
+        content: Dict[str, Any],
+        customizations: Dict[str, Any] = None
+    ) -> str:
+        """
+        Build a canonical cache key for a compile request.
+
+        Args:
+            template: Loaded template data including LaTeX source
+            content: Resume content data
+            customizations: Optional customization settings
+
+        Returns:
+            Hex digest identifying the request
+        """
+        digest = hashlib.sha256()
+        digest.update((template.get('id') or '').encode('utf-8'))
+        digest.update(b'\0')
+        digest.update((template.get('latex_source') or '').encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(canonical_json(content or {}))
+        digest.update(b'\0')
+        digest.update(canonical_json(customizations or {}))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result and mark it as recently used.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Dictionary with 'pdf_bytes' and 'metadata', or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return {
+                'pdf_bytes': entry['pdf_bytes'],
+                'metadata': dict(entry['metadata'])
+            }
+
+    def put(self, key: str, template_id: str, pdf_bytes: bytes, metadata: Dict[str, Any]):
+        """
+        Store a compiled result, evicting least recently used entries as needed.
+
+        Args:
+            key: Cache key from make_key
+            template_id: Template the result was compiled from
+            pdf_bytes: Compiled PDF
+            metadata: Compile metadata to return on a hit
+        """
+        size = len(pdf_bytes)
+        if size > self.max_bytes:
+            logger.debug(f"Not caching {size} byte PDF (limit {self.max_bytes})")
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= previous['bytes']
+
+            self._entries[key] = {
+                'template_id': template_id,
+                'pdf_bytes': pdf_bytes,
+                'metadata': dict(metadata),
+                'previews': {},
+                'bytes': size
+            }
+            self._current_bytes += size
+            self._evict_over_budget()
+
+    def get_preview(self, key: str, variant: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up cached preview images of a cached PDF.
+
+        Preview lookups are counted separately from PDF lookups.
+
+        Args:
+            key: Cache key from make_key
+            variant: Preview settings the images were rendered with
+
+        Returns:
+            Dictionary with 'images', PNG bytes in page order, and the
+            compile 'metadata', or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            images = entry['previews'].get(variant) if entry is not None else None
+            if images is None:
+                self._preview_misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._preview_hits += 1
+            return {
+                'images': images,
+                'metadata': dict(entry['metadata'])
+            }
+
+    def put_preview(self, key: str, variant: str, images: List[bytes]):
+        """
+        Store preview images alongside a cached PDF.
+
+        Previews are only kept while their PDF is cached, so they are
+        dropped with it on eviction or template invalidation.
+
+        Args:
+            key: Cache key from make_key
+            variant: Preview settings the images were rendered with
+            images: PNG images in page order
+        """
+        size = sum(len(image) for image in images)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or variant in entry['previews']:
+                return
+            if entry['bytes'] + size > self.max_bytes:
+                logger.debug(f"Not caching {size} bytes of previews (limit {self.max_bytes})")
+                return
+
+            entry['previews'][variant] = images
+            entry['bytes'] += size
+            self._current_bytes += size
+            self._entries.move_to_end(key)
+            self._evict_over_budget()
+
+    def _evict_over_budget(self):
+        """Evict least recently used entries until the cache fits; requires the lock."""
+        while self._current_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._current_bytes -= evicted['bytes']
+            self._evictions += 1
+
+    def invalidate_template(self, template_id: Optional[str] = None):
+        """
+        Drop cached results for a template, or for all templates.
+
+        Args:
+            template_id: Template identifier, or None to clear everything
+        """
+        with self._lock:
+            if template_id is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._current_bytes = 0
+            else:
+                stale_keys = [
+                    key for key, entry in self._entries.items()
+                    if entry['template_id'] == template_id
+                ]
+                for key in stale_keys:
+                    entry = self._entries.pop(key)
+                    self._current_bytes -= entry['bytes']
+                removed = len(stale_keys)
+
+        logger.info(f"Invalidated {removed} cached PDFs for template: {template_id or 'all'}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return PDF and preview hit/miss counters and current occupancy."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            preview_lookups = self._preview_hits + self._preview_misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hitRate': (self._hits / lookups) if lookups else 0.0,
+                'previewHits': self._preview_hits,
+                'previewMisses': self._preview_misses,
+                'previewHitRate': (self._preview_hits / preview_lookups) if preview_lookups else 0.0,
+                'evictions': self._evictions,
+                'entries': len(self._entries),
+                'bytes': self._current_bytes,
+                'maxBytes': self.max_bytes
+            }
+
+
+def canonical_json(value: Any) -> bytes:
+    """Serialize a value to canonical JSON bytes for hashing."""
+    return json.dumps(
+        value,
+        sort_keys=True,
+        separators=(',', ':'),
+        ensure_ascii=False,
+        default=str
+    ).encode('utf-8')
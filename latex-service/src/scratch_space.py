@@ -0,0 +1,209 @@
+"""
+Scratch directory management for LaTeX compilation.
+
+This module keeps one reusable work directory per compile worker slot,
+preferably on a RAM-backed filesystem, and runs a background sweep that
+removes directories and files leaked by timed-out or killed compiles.
+"""
+
+import os
+import time
+import queue
+import shutil
+import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Files a compile leaves in its slot; only these are removed between compiles
+SCRATCH_SUFFIXES = ('.tex', '.aux', '.log', '.pdf', '.out', '.toc', '.png')
+
+RAM_BACKED_ROOT = Path('/dev/shm')
+SLOT_PREFIX = 'slot-'
+
+
+class ScratchSpace:
+    """Hands out reusable per-slot scratch directories and sweeps orphans."""
+
+    def __init__(
+        self,
+        slots: Optional[int] = None,
+        root: Optional[str] = None,
+        stale_seconds: Optional[float] = None,
+        sweep_interval: Optional[float] = None
+    ):
+        if slots is None:
+            slots = int(os.getenv('COMPILE_WORKERS', os.cpu_count() or 1))
+        if stale_seconds is None:
+            stale_seconds = float(os.getenv('SCRATCH_STALE_SECONDS', 900))
+        if sweep_interval is None:
+            sweep_interval = float(os.getenv('SCRATCH_SWEEP_INTERVAL', 300))
+
+        self.root, self.ram_backed = self._choose_root(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.stale_seconds = stale_seconds
+        self.sweep_interval = sweep_interval
+
+        self._slot_dirs = []
+        self._free_slots = queue.SimpleQueue()
+        for index in range(max(1, slots)):
+            slot_dir = self.root / f"{SLOT_PREFIX}{index}"
+            slot_dir.mkdir(exist_ok=True)
+            self._wipe(slot_dir)
+            self._slot_dirs.append(slot_dir)
+            self._free_slots.put(slot_dir)
+
+        self._usage = {'bytes': 0, 'files': 0, 'lastSweep': None, 'removed': 0}
+        self._usage_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sweeper = None
+
+        logger.info(f"Scratch space at {self.root} with {len(self._slot_dirs)} slots "
+                    f"({'RAM-backed' if self.ram_backed else 'disk'})")
+
+    @staticmethod
+    def _choose_root(root: Optional[str]):
+        """Pick the scratch root, preferring a RAM-backed filesystem."""
+        configured = root or os.getenv('LATEX_SCRATCH_DIR')
+        if configured:
+            return Path(configured), str(configured).startswith(str(RAM_BACKED_ROOT))
+
+        if RAM_BACKED_ROOT.is_dir() and os.access(RAM_BACKED_ROOT, os.W_OK):
+            return RAM_BACKED_ROOT / 'latex-work', True
+
+        return Path(os.getenv('LATEX_WORK_DIR', '/tmp/latex-work')), False
+
+    @contextmanager
+    def acquire(self) -> Iterator[Path]:
+        """
+        Borrow a scratch directory for one compile.
+
+        Yields a pre-created slot directory when one is free, otherwise a
+        temporary overflow directory. Slot directories are wiped of compile
+        outputs when returned; overflow directories are deleted.
+        """
+        try:
+            slot_dir = self._free_slots.get_nowait()
+        except queue.Empty:
+            slot_dir = None
+
+        if slot_dir is None:
+            overflow_dir = Path(tempfile.mkdtemp(dir=self.root, prefix='overflow-'))
+            try:
+                yield overflow_dir
+            finally:
+                shutil.rmtree(overflow_dir, ignore_errors=True)
+            return
+
+        try:
+            yield slot_dir
+        finally:
+            try:
+                self._wipe(slot_dir)
+            except OSError as e:
+                logger.warning(f"Recreating scratch slot {slot_dir.name}: {str(e)}")
+                shutil.rmtree(slot_dir, ignore_errors=True)
+                slot_dir.mkdir(exist_ok=True)
+            self._free_slots.put(slot_dir)
+
+    @staticmethod
+    def _wipe(slot_dir: Path):
+        """Remove the known compile outputs from a slot directory."""
+        for suffix in SCRATCH_SUFFIXES:
+            for output in slot_dir.glob(f"*{suffix}"):
+                output.unlink(missing_ok=True)
+
+    def start_sweeper(self):
+        """Start the background thread that removes stale scratch data."""
+        if self._sweeper is not None:
+            return
+        self._sweeper = threading.Thread(target=self._sweep_loop, name='scratch-sweeper', daemon=True)
+        self._sweeper.start()
+
+    def stop_sweeper(self):
+        """Stop the background sweep thread."""
+        self._stop.set()
+
+    def _sweep_loop(self):
+        """Sweep periodically until stopped."""
+        while not self._stop.is_set():
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error(f"Scratch sweep failed: {str(e)}")
+            self._stop.wait(self.sweep_interval)
+
+    def sweep(self) -> Dict[str, Any]:
+        """
+        Delete stale orphaned scratch data and measure the work area.
+
+        Anything under the root other than the slot directories is an
+        orphan once it is older than stale_seconds: overflow and legacy
+        temporary directories left by killed compiles, and streamed PDFs
+        whose responses never completed.
+
+        Returns:
+            Current usage report
+        """
+        cutoff = time.time() - self.stale_seconds
+        slot_dirs = set(self._slot_dirs)
+        removed = 0
+        total_bytes = 0
+        total_files = 0
+
+        for entry in self._iter_orphan_candidates(slot_dirs):
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    if entry.is_dir():
+                        shutil.rmtree(entry, ignore_errors=True)
+                    else:
+                        entry.unlink(missing_ok=True)
+                    removed += 1
+            except FileNotFoundError:
+                continue
+
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                try:
+                    total_bytes += os.lstat(os.path.join(dirpath, filename)).st_size
+                    total_files += 1
+                except FileNotFoundError:
+                    continue
+
+        if removed:
+            logger.info(f"Removed {removed} stale scratch entries from {self.root}")
+
+        with self._usage_lock:
+            self._usage = {
+                'bytes': total_bytes,
+                'files': total_files,
+                'lastSweep': time.time(),
+                'removed': self._usage['removed'] + removed
+            }
+        return self.usage()
+
+    def _iter_orphan_candidates(self, slot_dirs) -> Iterator[Path]:
+        """Yield top-level entries and outbox files that may be orphaned."""
+        for entry in self.root.iterdir():
+            if entry in slot_dirs:
+                continue
+            if entry.is_dir() and entry.name == 'outbox':
+                yield from entry.iterdir()
+                continue
+            yield entry
+
+    def usage(self) -> Dict[str, Any]:
+        """Return the work area size from the most recent sweep."""
+        with self._usage_lock:
+            usage = dict(self._usage)
+        usage.update(
+            root=str(self.root),
+            ramBacked=self.ram_backed,
+            slots=len(self._slot_dirs),
+            freeSlots=self._free_slots.qsize()
+        )
+        return usage
@@ -0,0 +1,123 @@
+"""
+Prebuilt template catalog responses.
+
+This module renders the /templates and /templates/<id> response bodies
+once per template change and keeps them as immutable JSON bytes with a
+strong ETag, so catalog requests neither touch the filesystem nor
+re-serialize anything.
+"""
+
+import json
+import hashlib
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, NamedTuple
+
+from template_manager import TemplateManager
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogResponse(NamedTuple):
+    """A serialized catalog response body and its strong ETag."""
+    body: bytes
+    etag: str
+
+
+def _build_response(payload: dict) -> CatalogResponse:
+    """Serialize a payload and derive its ETag from the bytes."""
+    body = json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return CatalogResponse(body=body, etag=hashlib.sha256(body).hexdigest()[:32])
+
+
+class TemplateCatalog:
+    """Serves template listings and details from prebuilt responses."""
+
+    def __init__(
+        self,
+        template_manager: TemplateManager,
+        preview_available: Optional[Callable[[str], bool]] = None
+    ):
+        """
+        Args:
+            template_manager: Source of template metadata
+            preview_available: Optional check overriding 'preview_available'
+                for templates whose previews are rendered on demand
+        """
+        self.template_manager = template_manager
+        self.preview_available = preview_available
+        self._lock = threading.Lock()
+        self._listing: Optional[CatalogResponse] = None
+        self._details: Dict[str, CatalogResponse] = {}
+        # Bumped on every invalidation so a response built from data that
+        # changed mid-build is not stored
+        self._generation = 0
+
+        template_manager.add_invalidation_listener(self.invalidate)
+
+    def invalidate(self, template_id: Optional[str] = None):
+        """
+        Drop prebuilt responses affected by a template change.
+
+        Args:
+            template_id: Changed template, or None when all templates changed
+        """
+        with self._lock:
+            self._generation += 1
+            self._listing = None
+            if template_id is None:
+                self._details.clear()
+            else:
+                self._details.pop(template_id, None)
+
+    def listing(self) -> CatalogResponse:
+        """Return the prebuilt /templates response."""
+        # Throttled fingerprint checks; changes arrive through invalidate()
+        self.template_manager.refresh_changed()
+
+        listing = self._listing
+        if listing is None:
+            generation = self._generation
+            listing = _build_response({
+                'success': True,
+                'templates': [
+                    self._with_preview(info) for info in self.template_manager.list_templates()
+                ]
+            })
+            with self._lock:
+                if generation == self._generation:
+                    self._listing = listing
+            logger.info("Built template catalog listing")
+        return listing
+
+    def _with_preview(self, template_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply the preview availability check to a template's information."""
+        if self.preview_available is not None and not template_info.get('preview_available'):
+            template_info['preview_available'] = self.preview_available(template_info['id'])
+        return template_info
+
+    def details(self, template_id: str) -> Optional[CatalogResponse]:
+        """
+        Return the prebuilt /templates/<id> response.
+
+        Returns:
+            Prebuilt response, or None if the template does not exist
+        """
+        self.template_manager.refresh_changed(template_id)
+
+        details = self._details.get(template_id)
+        if details is not None:
+            return details
+
+        generation = self._generation
+        template_info = self.template_manager.get_template_info(template_id)
+        details = None
+        if template_info:
+            details = _build_response({'success': True, 'template': self._with_preview(template_info)})
+
+        # Unknown IDs are not remembered, so arbitrary lookups cannot grow the cache
+        if details is not None:
+            with self._lock:
+                if generation == self._generation:
+                    self._details[template_id] = details
+        return details
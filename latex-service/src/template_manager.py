@@ -4,11 +4,20 @@ Template management service.
 This module handles loading, validation, and management of LaTeX templates.
 """
 
+import os
 import json
+import time
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from pathlib import Path
 
+from format_cache import FormatCache
+from metrics import (
+    FAILURE_INVALID_TEMPLATE, FAILURE_TEMPLATE_NOT_FOUND, TEMPLATE_LOAD_SECONDS, record_failure
+)
+from template_renderer import CompiledTemplate
+from tex_engines import DEFAULT_ENGINE, get_engine
 from utils.error_handling import TemplateNotFoundError, InvalidTemplateError
 
 logger = logging.getLogger(__name__)
@@ -17,42 +26,212 @@ logger = logging.getLogger(__name__)
 class TemplateManager:
     """Manages LaTeX resume templates."""
 
-    def __init__(self):
+    def __init__(self, format_cache: Optional[FormatCache] = None):
         self.templates_dir = Path('/app/templates')
-        self._template_cache = {}
-        self._scan_templates()
+        self.format_cache = format_cache
+        # Scanned on first use so startup does not wait on the filesystem
+        self._template_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._scan_lock = threading.Lock()
+        self._scanned_directory_mtime = None
+        self._directory_checked_at = 0.0
+        self._invalidation_listeners = []
+
+        # Seconds between checks of a template's files for changes; 0 checks
+        # on every access and a negative value disables hot reload
+        self.reload_interval = float(os.getenv('TEMPLATE_RELOAD_INTERVAL', 2))
+
+    def add_invalidation_listener(self, listener: Callable[[Optional[str]], None]):
+        """
+        Register a callback for when templates are reloaded.
+
+        Args:
+            listener: Called with the reloaded template ID, or None when
+                all templates were reloaded
+        """
+        self._invalidation_listeners.append(listener)
+
+    def _notify_invalidation(self, template_id: Optional[str] = None):
+        """Tell listeners that derived data for a template is stale."""
+        for listener in self._invalidation_listeners:
+            try:
+                listener(template_id)
+            except Exception as e:
+                logger.error(f"Error invalidating template {template_id or 'all'}: {str(e)}")
 
-    def _scan_templates(self):
-        """Scan the templates directory and cache template metadata."""
+    def _templates(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the template cache, scanning the templates directory on first use.
+
+        Template directories added or removed since the last scan are picked
+        up when the templates directory itself has changed.
+        """
+        templates = self._template_cache
+        if templates is None:
+            with self._scan_lock:
+                if self._template_cache is None:
+                    self._template_cache = self._scan_templates()
+                    self._directory_checked_at = time.monotonic()
+                templates = self._template_cache
+        elif self._check_due(self._directory_checked_at):
+            self._directory_checked_at = time.monotonic()
+            if self._directory_mtime() != self._scanned_directory_mtime:
+                templates = self._rescan_directory()
+        return templates
+
+    def _check_due(self, checked_at: float) -> bool:
+        """Whether enough time has passed since checked_at to look at the filesystem again."""
+        return self.reload_interval >= 0 and time.monotonic() - checked_at >= self.reload_interval
+
+    def _directory_mtime(self) -> Optional[int]:
+        """Return the templates directory modification time, or None if missing."""
+        try:
+            return self.templates_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _scan_templates(self) -> Dict[str, Dict[str, Any]]:
+        """Scan the templates directory and build the template metadata cache."""
         logger.info("Scanning for available templates...")
+        templates = {}
+        self._scanned_directory_mtime = self._directory_mtime()
 
         if not self.templates_dir.exists():
             logger.warning(f"Templates directory {self.templates_dir} does not exist")
-            return
+            return templates
 
         for template_dir in self.templates_dir.iterdir():
             if template_dir.is_dir():
-                try:
-                    metadata_file = template_dir / 'metadata.json'
-                    if metadata_file.exists():
-                        with open(metadata_file, 'r', encoding='utf-8') as f:
-                            metadata = json.load(f)
-
-                        template_id = template_dir.name
-                        self._template_cache[template_id] = {
-                            'id': template_id,
-                            'path': template_dir,
-                            'metadata': metadata,
-                            'loaded': False,
-                            'latex_source': None
-                        }
-                        logger.info(f"Found template: {template_id}")
-                    else:
-                        logger.warning(f"Template {template_dir.name} missing metadata.json")
-                except Exception as e:
-                    logger.error(f"Error scanning template {template_dir.name}: {str(e)}")
-
-        logger.info(f"Scanned {len(self._template_cache)} templates")
+                entry = self._read_template_entry(template_dir)
+                if entry is not None:
+                    templates[entry['id']] = entry
+                    logger.info(f"Found template: {entry['id']}")
+
+        logger.info(f"Scanned {len(templates)} templates")
+        return templates
+
+    def _rescan_directory(self) -> Dict[str, Dict[str, Any]]:
+        """Add new template directories and drop removed ones, keeping the rest."""
+        with self._scan_lock:
+            scanned = self._scan_templates()
+            templates = dict(self._template_cache)
+            removed = set(templates) - set(scanned)
+            for template_id in removed:
+                del templates[template_id]
+            for template_id in set(scanned) - set(templates):
+                templates[template_id] = scanned[template_id]
+            self._template_cache = templates
+
+        for template_id in removed:
+            logger.info(f"Template removed: {template_id}")
+            if self.format_cache is not None:
+                self.format_cache.invalidate_template(template_id)
+            self._notify_invalidation(template_id)
+        return templates
+
+    def _read_template_entry(self, template_dir: Path) -> Optional[Dict[str, Any]]:
+        """
+        Read a template directory's metadata into a new cache entry.
+
+        Returns:
+            Unloaded cache entry, or None if the directory is not a template
+        """
+        try:
+            fingerprint = self._fingerprint(template_dir)
+            metadata_file = template_dir / 'metadata.json'
+            if not metadata_file.exists():
+                logger.warning(f"Template {template_dir.name} missing metadata.json")
+                return None
+
+            with open(metadata_file, 'r', encoding='utf-8') as f:
+                metadata = json.load(f)
+
+            return {
+                'id': template_dir.name,
+                'path': template_dir,
+                'metadata': metadata,
+                'loaded': False,
+                'latex_source': None,
+                'renderer': None,
+                'format': None,
+                'fingerprint': fingerprint,
+                'checked_at': time.monotonic()
+            }
+        except Exception as e:
+            logger.error(f"Error scanning template {template_dir.name}: {str(e)}")
+            return None
+
+    @staticmethod
+    def _fingerprint(template_dir: Path) -> Tuple:
+        """
+        Summarize the files a template is built from by modification time and size.
+
+        Covers template.tex, metadata.json and styles/*.tex; a change to any
+        of them, or a file appearing or disappearing, changes the fingerprint.
+        """
+        files = [template_dir / 'template.tex', template_dir / 'metadata.json']
+        styles_dir = template_dir / 'styles'
+        if styles_dir.is_dir():
+            files.extend(sorted(styles_dir.glob('*.tex')))
+
+        fingerprint = []
+        for path in files:
+            try:
+                stat = path.stat()
+                fingerprint.append((path.name, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                fingerprint.append((path.name, None, None))
+        return tuple(fingerprint)
+
+    def _current_entry(self, template_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a template's cache entry, reloading it first if its files changed.
+
+        Checks are throttled to one per reload_interval per template. A
+        changed template is replaced by a fresh, unloaded entry in a new
+        cache dictionary, so requests holding the previous entry keep a
+        consistent snapshot, and only that template's derived data is
+        invalidated.
+        """
+        entry = self._templates().get(template_id)
+        if entry is None or not self._check_due(entry['checked_at']):
+            return entry
+
+        fingerprint = self._fingerprint(entry['path'])
+        if fingerprint == entry['fingerprint']:
+            entry['checked_at'] = time.monotonic()
+            return entry
+
+        with self._scan_lock:
+            current = self._template_cache.get(template_id)
+            if current is not entry:
+                # Another request already swapped in a newer version
+                return current
+
+            replacement = self._read_template_entry(entry['path'])
+            templates = dict(self._template_cache)
+            if replacement is None:
+                templates.pop(template_id, None)
+            else:
+                templates[template_id] = replacement
+            self._template_cache = templates
+
+        logger.info(f"Template changed on disk, reloading: {template_id}")
+        self._notify_invalidation(template_id)
+        return replacement
+
+    def refresh_changed(self, template_id: Optional[str] = None):
+        """
+        Reload templates whose files changed, notifying invalidation listeners.
+
+        Subject to the same reload_interval throttling as other accesses, so
+        callers serving prebuilt data can call it on every request.
+
+        Args:
+            template_id: Template to check, or None to check all templates
+        """
+        template_ids = [template_id] if template_id else list(self._templates())
+        for checked_id in template_ids:
+            self._current_entry(checked_id)
 
     def list_templates(self) -> List[Dict[str, Any]]:
         """
@@ -63,7 +242,10 @@ class TemplateManager:
         """
         templates = []
 
-        for template_id, template_data in self._template_cache.items():
+        for template_id in list(self._templates()):
+            template_data = self._current_entry(template_id)
+            if template_data is None:
+                continue
             metadata = template_data['metadata']
             template_info = {
                 'id': template_id,
@@ -73,6 +255,7 @@ class TemplateManager:
                 'version': metadata.get('version', '1.0'),
                 'author': metadata.get('author', ''),
                 'tags': metadata.get('tags', []),
+                'engine': metadata.get('engine', DEFAULT_ENGINE),
                 'preview_available': (template_data['path'] / 'preview.png').exists()
             }
             templates.append(template_info)
@@ -89,10 +272,10 @@ class TemplateManager:
         Returns:
             Template information dictionary or None if not found
         """
-        if template_id not in self._template_cache:
+        template_data = self._current_entry(template_id)
+        if template_data is None:
             return None
 
-        template_data = self._template_cache[template_id]
         metadata = template_data['metadata']
 
         # Get additional details
@@ -113,6 +296,7 @@ class TemplateManager:
             'tags': metadata.get('tags', []),
             'variables': metadata.get('variables', []),
             'customizations': metadata.get('customizations', {}),
+            'engine': metadata.get('engine', DEFAULT_ENGINE),
             'available_styles': available_styles,
             'preview_available': (template_path / 'preview.png').exists(),
             'last_modified': template_path.stat().st_mtime
@@ -132,15 +316,30 @@ class TemplateManager:
             TemplateNotFoundError: If template doesn't exist
             InvalidTemplateError: If template is malformed
         """
-        if template_id not in self._template_cache:
-            raise TemplateNotFoundError(f"Template '{template_id}' not found")
+        with TEMPLATE_LOAD_SECONDS.time():
+            try:
+                return self._load_template(template_id)
+            except TemplateNotFoundError:
+                record_failure(FAILURE_TEMPLATE_NOT_FOUND)
+                raise
+            except InvalidTemplateError:
+                record_failure(FAILURE_INVALID_TEMPLATE)
+                raise
 
-        template_data = self._template_cache[template_id]
+    def _load_template(self, template_id: str) -> Dict[str, Any]:
+        """Load a template, reading and validating its source on first use."""
+        template_data = self._current_entry(template_id)
+        if template_data is None:
+            raise TemplateNotFoundError(f"Template '{template_id}' not found")
 
         # Return cached version if already loaded
         if template_data['loaded'] and template_data['latex_source']:
             return template_data.copy()
 
+        # Fingerprint before reading so an edit made during the load is
+        # picked up by the next check
+        fingerprint = self._fingerprint(template_data['path'])
+
         try:
             # Load LaTeX source
             template_path = template_data['path']
@@ -158,13 +357,39 @@ class TemplateManager:
             # Validate template
             self._validate_template(latex_source, template_data['metadata'])
 
-            # Cache the loaded template
-            template_data['latex_source'] = latex_source
-            template_data['loaded'] = True
+            # Parse placeholders once so renders are a single pass
+            renderer = self._compile_renderer(template_id, latex_source, template_data['metadata'])
+
+            engine = get_engine(template_data['metadata'].get('engine'))
+
+            # Precompile the preamble so compiles can skip it; this also
+            # removes formats dumped from older versions of the preamble.
+            # Formats are dumped with pdflatex, so other engines skip them.
+            format_info = None
+            if self.format_cache is not None and engine.supports_formats:
+                format_info = self.format_cache.ensure_format(template_id, latex_source)
+
+            # Swap in the loaded template rather than mutating the entry
+            # other requests may be reading
+            loaded = dict(
+                template_data,
+                latex_source=latex_source,
+                renderer=renderer,
+                engine=engine.name,
+                format=format_info,
+                loaded=True,
+                fingerprint=fingerprint,
+                checked_at=time.monotonic()
+            )
+            with self._scan_lock:
+                if self._template_cache.get(template_id) is template_data:
+                    templates = dict(self._template_cache)
+                    templates[template_id] = loaded
+                    self._template_cache = templates
 
             logger.info(f"Loaded template: {template_id}")
 
-            return template_data.copy()
+            return loaded.copy()
 
         except Exception as e:
             if isinstance(e, (TemplateNotFoundError, InvalidTemplateError)):
@@ -236,12 +461,13 @@ class TemplateManager:
             if element not in latex_source:
                 raise InvalidTemplateError(f"Template missing required element: {element}")
 
-        # Validate that declared variables exist in template
-        declared_variables = metadata.get('variables', [])
-        for var in declared_variables:
-            var_pattern = f"{{{{{var}}}}}"
-            if var_pattern not in latex_source:
-                logger.warning(f"Declared variable {var} not found in template")
+        # Check the engine is one the compiler can run
+        try:
+            engine = get_engine(metadata.get('engine'))
+        except ValueError as e:
+            raise InvalidTemplateError(str(e))
+        if not engine.available():
+            raise InvalidTemplateError(f"TeX engine {engine.name} is not installed")
 
         # Check for common LaTeX syntax issues
         open_braces = latex_source.count('{')
@@ -251,11 +477,46 @@ class TemplateManager:
 
         logger.debug("Template validation passed")
 
+    def _compile_renderer(
+        self,
+        template_id: str,
+        latex_source: str,
+        metadata: Dict[str, Any]
+    ) -> CompiledTemplate:
+        """
+        Parse a template into a renderer and check its placeholders.
+
+        Args:
+            template_id: Template identifier
+            latex_source: LaTeX source code
+            metadata: Template metadata declaring the 'variables' list
+
+        Returns:
+            Compiled renderer for the template
+
+        Raises:
+            InvalidTemplateError: If the template uses undeclared placeholders
+        """
+        renderer = CompiledTemplate(latex_source, metadata.get('variables', []))
+
+        if renderer.unknown_placeholders:
+            raise InvalidTemplateError(
+                f"Template '{template_id}' uses undeclared placeholders: "
+                f"{', '.join(sorted(renderer.unknown_placeholders))}"
+            )
+
+        for var in sorted(renderer.missing_placeholders):
+            logger.warning(f"Declared variable {var} not found in template {template_id}")
+
+        return renderer
+
     def reload_templates(self):
         """Reload all templates from disk."""
         logger.info("Reloading templates...")
-        self._template_cache.clear()
-        self._scan_templates()
+        with self._scan_lock:
+            self._template_cache = self._scan_templates()
+            self._directory_checked_at = time.monotonic()
+        self._notify_invalidation()
 
     def get_template_preview(self, template_id: str) -> Optional[bytes]:
         """
@@ -267,13 +528,9 @@ class TemplateManager:
         Returns:
             Preview image bytes or None if not available
         """
-        if template_id not in self._template_cache:
-            return None
+        preview_file = self.get_template_preview_path(template_id)
 
-        template_path = self._template_cache[template_id]['path']
-        preview_file = template_path / 'preview.png'
-
-        if preview_file.exists():
+        if preview_file is not None:
             try:
                 with open(preview_file, 'rb') as f:
                     return f.read()
@@ -281,3 +538,20 @@ class TemplateManager:
                 logger.error(f"Error reading preview image: {str(e)}")
 
         return None
+
+    def get_template_preview_path(self, template_id: str) -> Optional[Path]:
+        """
+        Get the path of a template's shipped preview image.
+
+        Args:
+            template_id: Template identifier
+
+        Returns:
+            Path to preview.png, or None if the template has none
+        """
+        template_data = self._current_entry(template_id)
+        if template_data is None:
+            return None
+
+        preview_file = template_data['path'] / 'preview.png'
+        return preview_file if preview_file.exists() else None
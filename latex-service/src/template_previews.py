@@ -0,0 +1,195 @@
+"""
+Template preview images.
+
+This module serves a template's shipped preview.png, or renders one from
+built-in sample content the first time it is requested and keeps it on
+disk, keyed by the template source, so later requests are a file send.
+"""
+
+import os
+import hashlib
+import logging
+import tempfile
+import threading
+from typing import Dict, Any, Optional
+from pathlib import Path
+
+from latex_compiler import LaTeXCompiler, OUTPUT_FILE
+from pdf_raster import rasterize_pdf, rasterizer_available
+from result_cache import canonical_json
+from template_manager import TemplateManager
+from utils.error_handling import RasterizationError
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_CONTENT = {
+    'personalInfo': {
+        'name': 'Alex Morgan',
+        'email': 'alex.morgan@example.com',
+        'phone': '(555) 123-4567',
+        'location': 'San Francisco, CA'
+    },
+    'summary': 'Software engineer with 8 years of experience building reliable, '
+               'high-traffic web platforms and leading small product teams.',
+    'experience': [
+        {
+            'title': 'Senior Software Engineer',
+            'company': 'Northwind Labs',
+            'duration': '2020 - Present',
+            'bullets': [
+                'Led the migration of the billing platform to event-driven services',
+                'Cut p99 API latency by 40% through caching and query tuning',
+                'Mentored five engineers and introduced design reviews'
+            ]
+        },
+        {
+            'title': 'Software Engineer',
+            'company': 'Contoso Analytics',
+            'duration': '2016 - 2020',
+            'bullets': [
+                'Built the customer reporting pipeline processing 2M events per day',
+                'Automated deployments, reducing release time from days to hours'
+            ]
+        }
+    ],
+    'education': [
+        {'degree': 'B.S. Computer Science', 'school': 'State University', 'year': '2016'}
+    ],
+    'skills': ['Python', 'TypeScript', 'React', 'PostgreSQL', 'Docker', 'Kubernetes', 'AWS'],
+    'certifications': [
+        {'name': 'AWS Certified Solutions Architect', 'issuer': 'Amazon Web Services', 'date': '2022'}
+    ]
+}
+
+
+class TemplatePreviewCache:
+    """Locates shipped template previews and renders missing ones on demand."""
+
+    def __init__(
+        self,
+        template_manager: TemplateManager,
+        latex_compiler: LaTeXCompiler,
+        preview_dir: Optional[str] = None,
+        dpi: Optional[int] = None
+    ):
+        self.template_manager = template_manager
+        self.latex_compiler = latex_compiler
+        self.preview_dir = Path(preview_dir or os.getenv('TEMPLATE_PREVIEW_DIR', '/tmp/latex-previews'))
+        self.preview_dir.mkdir(parents=True, exist_ok=True)
+        self.dpi = dpi or int(os.getenv('TEMPLATE_PREVIEW_DPI', 96))
+
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+        template_manager.add_invalidation_listener(self.invalidate_template)
+
+    def available(self, template_id: str) -> bool:
+        """Whether a preview exists or can be rendered for a template."""
+        return self.template_manager.get_template_preview_path(template_id) is not None \
+            or rasterizer_available()
+
+    def find(self, template_id: str) -> Optional[Path]:
+        """
+        Return an existing preview without rendering.
+
+        Args:
+            template_id: Template identifier
+
+        Returns:
+            Path of the shipped or previously rendered preview, or None
+
+        Raises:
+            TemplateNotFoundError: If the template does not exist
+        """
+        shipped = self.template_manager.get_template_preview_path(template_id)
+        if shipped is not None:
+            return shipped
+
+        template = self.template_manager.load_template(template_id)
+        rendered = self._rendered_path(template)
+        return rendered if rendered.exists() else None
+
+    def render(self, template_id: str) -> Path:
+        """
+        Return the template's preview, rendering it from sample content if needed.
+
+        Concurrent requests for the same template wait for a single render.
+
+        Raises:
+            TemplateNotFoundError: If the template does not exist
+            LaTeXCompilationError: If the sample resume does not compile
+            RasterizationError: If the PDF cannot be rendered to an image
+        """
+        with self._lock_for(template_id):
+            existing = self.find(template_id)
+            if existing is not None:
+                return existing
+
+            # Checked before compiling the sample resume the image is rendered from
+            if not rasterizer_available():
+                raise RasterizationError("Ghostscript (gs) is not installed")
+
+            template = self.template_manager.load_template(template_id)
+            rendered = self._rendered_path(template)
+
+            result = self.latex_compiler.compile_resume(
+                template=template,
+                content=template['metadata'].get('sampleContent') or SAMPLE_CONTENT,
+                check_cache=False,
+                output_format=OUTPUT_FILE
+            )
+            pdf_path = result['pdf_path']
+            try:
+                with tempfile.TemporaryDirectory(dir=self.preview_dir) as temp_dir:
+                    page, = rasterize_pdf(pdf_path, Path(temp_dir), self.dpi, last_page=1)
+                    # Rename into place so readers never see a partial image
+                    page.replace(rendered)
+            finally:
+                pdf_path.unlink(missing_ok=True)
+
+            self._remove_stale_previews(template_id, rendered)
+            logger.info(f"Rendered preview for template: {template_id}")
+            return rendered
+
+    def invalidate_template(self, template_id: Optional[str] = None):
+        """
+        Delete rendered previews for a template, or for all templates.
+
+        Args:
+            template_id: Template identifier, or None to remove every preview
+        """
+        pattern = f"{template_id}__*.png" if template_id else '*.png'
+        for preview in self.preview_dir.glob(pattern):
+            preview.unlink(missing_ok=True)
+
+    def _rendered_path(self, template: Dict[str, Any]) -> Path:
+        """Path of the rendered preview for the template's current source."""
+        digest = hashlib.sha256()
+        digest.update((template.get('latex_source') or '').encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(canonical_json(template['metadata'].get('sampleContent') or SAMPLE_CONTENT))
+        digest.update(f"\0{self.dpi}".encode('ascii'))
+        return self.preview_dir / f"{template['id']}__{digest.hexdigest()[:16]}.png"
+
+    def _remove_stale_previews(self, template_id: str, current: Path):
+        """Remove previews rendered from older versions of a template."""
+        for preview in self.preview_dir.glob(f"{template_id}__*.png"):
+            if preview != current:
+                preview.unlink(missing_ok=True)
+
+    def _lock_for(self, template_id: str) -> threading.Lock:
+        """Return the render lock for a template."""
+        with self._locks_lock:
+            return self._locks.setdefault(template_id, threading.Lock())
+
+
+if __name__ == '__main__':
+    # Render previews for every template without one, e.g. during the Docker
+    # image build, so the first visitor does not wait for a compile
+    from format_cache import FormatCache
+
+    logging.basicConfig(level=logging.INFO)
+    manager = TemplateManager(format_cache=FormatCache())
+    previews = TemplatePreviewCache(manager, LaTeXCompiler())
+    for template_info in manager.list_templates():
+        previews.render(template_info['id'])
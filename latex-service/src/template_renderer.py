@@ -0,0 +1,56 @@
+"""
+Compiled template rendering.
+
+This module parses a template's LaTeX source once into literal text and
+{{PLACEHOLDER}} segments so each render is a single join rather than one
+full-string replace per placeholder.
+"""
+
+import re
+from typing import Dict, List, Optional, Set, Iterable
+
+PLACEHOLDER_PATTERN = re.compile(r'\{\{([A-Za-z0-9_]+)\}\}')
+
+
+class CompiledTemplate:
+    """A template pre-split into literal and placeholder segments."""
+
+    def __init__(self, latex_source: str, variables: Optional[Iterable[str]] = None):
+        """
+        Parse LaTeX source into segments.
+
+        Args:
+            latex_source: Template LaTeX source with {{NAME}} placeholders
+            variables: Declared placeholder names from the template metadata,
+                or None to accept every placeholder found in the source
+        """
+        # re.split with a capture group alternates literal, name, literal, ...
+        parts = PLACEHOLDER_PATTERN.split(latex_source)
+        self._literals: List[str] = parts[0::2]
+        self._names: List[str] = parts[1::2]
+
+        self.placeholders: Set[str] = set(self._names)
+        declared = set(variables) if variables is not None else set(self.placeholders)
+        self.unknown_placeholders: Set[str] = self.placeholders - declared
+        self.missing_placeholders: Set[str] = declared - self.placeholders
+
+    def render(self, values: Dict[str, str]) -> str:
+        """
+        Render the template in a single pass.
+
+        Substituted values are never rescanned, so content that itself
+        contains {{...}} is emitted literally.
+
+        Args:
+            values: Replacement text for each placeholder; missing
+                placeholders render as empty strings
+
+        Returns:
+            Rendered LaTeX source
+        """
+        literals = self._literals
+        pieces = [literals[0]]
+        for index, name in enumerate(self._names, start=1):
+            pieces.append(values.get(name, ''))
+            pieces.append(literals[index])
+        return ''.join(pieces)
@@ -0,0 +1,199 @@
+"""
+TeX engines.
+
+This module describes the TeX engines the compiler can run. Templates pick
+one with "engine" in metadata.json: pdflatex (the default) is the fastest
+and the only one that can start from a precompiled preamble format, while
+xelatex and lualatex load system fonts through fontspec, which font
+customizations such as Arial or Georgia need.
+"""
+
+import os
+import shutil
+import logging
+import subprocess
+from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENGINE = 'pdflatex'
+
+# Output profile when customizations.outputProfile is not set
+DEFAULT_OUTPUT_PROFILE = os.getenv('PDF_OUTPUT_PROFILE', 'balanced')
+
+
+class TexEngine:
+    """A TeX engine binary and the options the compiler runs it with."""
+
+    name = None
+
+    # Whether compiles can start from a FormatCache format file
+    supports_formats = False
+
+    # TeX code run ahead of the document, per output profile
+    output_profiles: Dict[str, str] = {}
+
+    def available(self) -> bool:
+        """Check whether the engine is installed."""
+        return shutil.which(self.name) is not None
+
+    def command(
+        self,
+        tex_file: Path,
+        output_profile: str = DEFAULT_OUTPUT_PROFILE,
+        format_info: Optional[Dict[str, str]] = None
+    ) -> Tuple[List[str], Optional[Dict[str, str]]]:
+        """
+        Build the command line for one pass over a LaTeX file.
+
+        The output settings run as TeX code ahead of the file, after the
+        format is loaded, so they apply with and without a precompiled format.
+
+        Args:
+            tex_file: LaTeX file to compile; output goes next to it
+            output_profile: Output profile name
+            format_info: Optional precompiled format to start from
+
+        Returns:
+            Tuple of (arguments, environment or None to inherit it)
+        """
+        settings = self.output_profiles.get(output_profile) \
+            or self.output_profiles.get(DEFAULT_OUTPUT_PROFILE, '')
+        command = [self.name, '-interaction=nonstopmode', f"-jobname={tex_file.stem}"]
+        command += self._extra_arguments(output_profile)
+        source = f"{settings} \\input{{{tex_file.name}}}" if settings else f"\\input{{{tex_file.name}}}"
+        command += ['-output-directory', str(tex_file.parent), source]
+        return command, None
+
+    def _extra_arguments(self, output_profile: str) -> List[str]:
+        """Engine-specific command line options for an output profile."""
+        return []
+
+    def warm_cache_commands(self) -> List[List[str]]:
+        """Commands that build the caches the engine reads on its first run."""
+        return []
+
+
+class PdfLaTeXEngine(TexEngine):
+    """pdfTeX with 8-bit fonts; fast, and supports precompiled formats."""
+
+    name = 'pdflatex'
+    supports_formats = True
+
+    # Object streams (PDF 1.5) pack the many small font and page objects
+    # into compressed streams; Type 1 fonts are already embedded as subsets
+    # by the pdftex.map defaults, so 'size' additionally drops the optional
+    # per-font CharSet strings and the producer and date entries
+    output_profiles = {
+        'size': (
+            '\\pdfminorversion=5 \\pdfcompresslevel=9 \\pdfobjcompresslevel=2 '
+            '\\ifdefined\\pdfomitcharset\\pdfomitcharset=1 \\fi'
+            '\\pdfsuppressptexinfo=-1 \\pdfinfoomitdate=1 \\pdftrailerid{}'
+        ),
+        'balanced': '\\pdfminorversion=5 \\pdfcompresslevel=6 \\pdfobjcompresslevel=2',
+        'speed': '\\pdfcompresslevel=1 \\pdfobjcompresslevel=0'
+    }
+
+    def command(
+        self,
+        tex_file: Path,
+        output_profile: str = DEFAULT_OUTPUT_PROFILE,
+        format_info: Optional[Dict[str, str]] = None
+    ) -> Tuple[List[str], Optional[Dict[str, str]]]:
+        command, env = super().command(tex_file, output_profile)
+        if format_info:
+            # Start from the precompiled preamble instead of the stock format
+            command.insert(1, f"-fmt={format_info['name']}")
+            env = dict(os.environ)
+            env['TEXFORMATS'] = f"{format_info['directory']}{os.pathsep}"
+        return command, env
+
+
+class XeLaTeXEngine(TexEngine):
+    """XeTeX with system fonts through fontspec; PDF written by xdvipdfmx."""
+
+    name = 'xelatex'
+
+    # xdvipdfmx compression levels; -q -E are xelatex's default driver flags
+    driver_compression = {'size': 9, 'balanced': 6, 'speed': 1}
+
+    def _extra_arguments(self, output_profile: str) -> List[str]:
+        level = self.driver_compression.get(output_profile)
+        if level is None:
+            return []
+        return [f"-output-driver=xdvipdfmx -q -E -z {level}"]
+
+    def warm_cache_commands(self) -> List[List[str]]:
+        return [['fc-cache']]
+
+
+class LuaLaTeXEngine(TexEngine):
+    """LuaTeX with system fonts through luaotfload."""
+
+    name = 'lualatex'
+
+    output_profiles = {
+        'size': '\\pdfvariable compresslevel=9 \\pdfvariable objcompresslevel=2 ',
+        'balanced': '\\pdfvariable compresslevel=6 \\pdfvariable objcompresslevel=2 ',
+        'speed': '\\pdfvariable compresslevel=1 \\pdfvariable objcompresslevel=0 '
+    }
+
+    def warm_cache_commands(self) -> List[List[str]]:
+        # luaotfload otherwise builds its font name database on the first
+        # compile, which takes tens of seconds
+        return [['fc-cache'], ['luaotfload-tool', '--update']]
+
+
+ENGINES: Dict[str, TexEngine] = {
+    engine.name: engine for engine in (PdfLaTeXEngine(), XeLaTeXEngine(), LuaLaTeXEngine())
+}
+
+
+def get_engine(name: Optional[str] = None) -> TexEngine:
+    """
+    Look up an engine by name.
+
+    Args:
+        name: Engine name, or None for the default engine
+
+    Raises:
+        ValueError: If the engine is not supported
+    """
+    engine = ENGINES.get(name or DEFAULT_ENGINE)
+    if engine is None:
+        raise ValueError(f"Unsupported TeX engine '{name}'; expected one of: {', '.join(ENGINES)}")
+    return engine
+
+
+def warm_engine_caches(engines: Optional[List[TexEngine]] = None):
+    """
+    Build the font caches installed engines read on their first run.
+
+    Args:
+        engines: Engines to warm, or None for every installed engine
+    """
+    commands = []
+    for engine in engines if engines is not None else ENGINES.values():
+        if not engine.available():
+            continue
+        for command in engine.warm_cache_commands():
+            if command not in commands:
+                commands.append(command)
+
+    for command in commands:
+        if shutil.which(command[0]) is None:
+            logger.warning(f"Cannot warm caches: {command[0]} not found")
+            continue
+        result = subprocess.run(command, capture_output=True, text=True, errors='replace', timeout=600)
+        if result.returncode != 0:
+            logger.warning(f"{' '.join(command)} failed: {(result.stderr or result.stdout)[-1000:]}")
+        else:
+            logger.info(f"Warmed caches with {' '.join(command)}")
+
+
+if __name__ == '__main__':
+    # Build font caches once, e.g. during the Docker image build, so the
+    # first xelatex or lualatex compile does not pay for them
+    logging.basicConfig(level=logging.INFO)
+    warm_engine_caches()
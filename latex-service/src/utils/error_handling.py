@@ -2,8 +2,10 @@
 Error handling utilities for LaTeX service.
 """
 
+import re
 import logging
-from typing import Any
+from collections import deque
+from typing import Any, Dict, List, Optional
 from flask import jsonify
 
 logger = logging.getLogger(__name__)
@@ -27,6 +29,16 @@ def handle_error(exception: Exception, context: str = None) -> tuple:
     else:
         full_message = error_message
 
+    # Errors in the submitted content are the client's to fix
+    if isinstance(exception, LaTeXCompilationError) and \
+            exception.error_details and exception.error_details.get('details'):
+        logger.warning(full_message)
+        return jsonify({
+            'success': False,
+            'error': 'LaTeX compilation failed',
+            'details': exception.error_details
+        }), 422
+
     logger.error(full_message, exc_info=True)
 
     # Don't expose internal error details in production
@@ -40,6 +52,103 @@ def handle_error(exception: Exception, context: str = None) -> tuple:
     }), 500
 
 
+# Bounds on what is kept from a LaTeX log, however long the log is
+MAX_LATEX_ERRORS = 10
+LATEX_ERROR_CONTEXT_LINES = 3
+LATEX_LOG_TAIL_LINES = 20
+MAX_LOG_LINE_LENGTH = 500
+
+# pdflatex reports the input line of an error as "l.<number> <source text>"
+SOURCE_LINE_PATTERN = re.compile(r'^l\.(\d+)\s?(.*)$')
+
+# Lines after a "!" error to search for its "l.<number>" location
+ERROR_LOCATION_WINDOW = 8
+
+
+class LaTeXErrorCollector:
+    """
+    Collects structured errors from pdflatex output, one line at a time.
+
+    Memory use is bounded regardless of log size: only the first
+    MAX_LATEX_ERRORS errors are kept, each with a few lines of preceding
+    context, and a ring buffer holds the last lines of output.
+    """
+
+    def __init__(self, max_errors: int = MAX_LATEX_ERRORS):
+        self.max_errors = max_errors
+        self.errors: List[Dict[str, Any]] = []
+        self.total_errors = 0
+        self._recent = deque(maxlen=LATEX_ERROR_CONTEXT_LINES)
+        self._tail = deque(maxlen=LATEX_LOG_TAIL_LINES)
+        self._open_error: Optional[Dict[str, Any]] = None
+        self._lines_since_error = 0
+
+    @property
+    def full(self) -> bool:
+        """Whether more errors arrived than are being kept."""
+        return self.total_errors > self.max_errors
+
+    def feed_line(self, line: str):
+        """
+        Process one line of pdflatex output.
+
+        Args:
+            line: Output line without its trailing newline
+        """
+        line = line[:MAX_LOG_LINE_LENGTH]
+        self._tail.append(line)
+        stripped = line.strip()
+
+        if self._open_error is not None:
+            self._lines_since_error += 1
+            location = SOURCE_LINE_PATTERN.match(stripped)
+            if location:
+                self._open_error['line_number'] = int(location.group(1))
+                self._open_error['source'] = location.group(2)
+                self._open_error = None
+            elif self._lines_since_error >= ERROR_LOCATION_WINDOW:
+                self._open_error = None
+
+        if stripped.startswith('!'):
+            self._add_error(stripped[1:].strip(), track_location=True)
+        elif 'Error:' in stripped:
+            self._add_error(stripped, track_location=False)
+
+        self._recent.append(line)
+
+    def _add_error(self, message: str, track_location: bool):
+        """Record an error if there is still room for it."""
+        self.total_errors += 1
+        if len(self.errors) >= self.max_errors:
+            return
+
+        error_detail = {
+            'line_number': None,
+            'error': message,
+            'source': None,
+            'context': list(self._recent)
+        }
+        self.errors.append(error_detail)
+
+        if track_location:
+            self._open_error = error_detail
+            self._lines_since_error = 0
+
+    @property
+    def tail(self) -> str:
+        """The last lines of output seen."""
+        return '\n'.join(self._tail)
+
+    def result(self) -> dict:
+        """Return the structured error information."""
+        return {
+            'type': 'compilation_error',
+            'message': 'LaTeX compilation failed',
+            'details': list(self.errors),
+            'totalErrors': self.total_errors
+        }
+
+
 def handle_latex_error(latex_output: str) -> dict:
     """
     Parse LaTeX compilation errors and return structured error information.
@@ -50,54 +159,28 @@ def handle_latex_error(latex_output: str) -> dict:
     Returns:
         Dictionary with error details
     """
-    error_info = {
-        'type': 'compilation_error',
-        'message': 'LaTeX compilation failed',
-        'details': []
-    }
-
-    lines = latex_output.split('\n')
-
-    for i, line in enumerate(lines):
-        line = line.strip()
-
-        # Look for common LaTeX error patterns
-        if line.startswith('!'):
-            # LaTeX error line
-            error_detail = {
-                'line_number': i + 1,
-                'error': line[1:].strip(),
-                'context': []
-            }
-
-            # Get surrounding context
-            context_start = max(0, i - 2)
-            context_end = min(len(lines), i + 3)
-            for j in range(context_start, context_end):
-                if j != i:
-                    error_detail['context'].append(lines[j])
-
-            error_info['details'].append(error_detail)
-
-        elif 'Error:' in line:
-            error_info['details'].append({
-                'line_number': i + 1,
-                'error': line,
-                'context': []
-            })
-
-    return error_info
+    collector = LaTeXErrorCollector()
+    for line in latex_output.splitlines():
+        collector.feed_line(line)
+    return collector.result()
 
 
 class LaTeXCompilationError(Exception):
     """Custom exception for LaTeX compilation errors."""
 
-    def __init__(self, message: str, latex_output: str = None):
+    def __init__(self, message: str, latex_output: str = None, error_details: dict = None):
+        """
+        Args:
+            message: Short error summary
+            latex_output: Bounded excerpt of the LaTeX output, used only when
+                error_details is not given
+            error_details: Structured errors from a LaTeXErrorCollector
+        """
         super().__init__(message)
         self.latex_output = latex_output
-        self.error_details = None
+        self.error_details = error_details
 
-        if latex_output:
+        if error_details is None and latex_output:
             self.error_details = handle_latex_error(latex_output)
 
 
@@ -109,3 +192,21 @@ class TemplateNotFoundError(Exception):
 class InvalidTemplateError(Exception):
     """Custom exception for invalid template structure."""
     pass
+
+
+class CompileQueueFullError(Exception):
+    """Custom exception for when the compile queue cannot accept more work."""
+
+    def __init__(self, message: str, retry_after: int = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RasterizationError(Exception):
+    """Custom exception for failures rendering PDF pages to images."""
+    pass
+
+
+class CompileSupersededError(Exception):
+    """Custom exception for compiles cancelled by a newer request for the same session."""
+    pass
@@ -0,0 +1,43 @@
+"""
+Per-phase request timing.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+class PhaseTimer:
+    """Accumulates wall-clock time per named phase of a request."""
+
+    def __init__(self):
+        self._phases: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as the named phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float):
+        """
+        Add time to a phase.
+
+        Args:
+            name: Phase name; repeated phases accumulate
+            seconds: Elapsed time in seconds
+        """
+        self._phases[name] = self._phases.get(name, 0.0) + seconds
+
+    def as_milliseconds(self) -> Dict[str, float]:
+        """Return phase durations in milliseconds, in the order first recorded."""
+        return {name: round(seconds * 1000, 3) for name, seconds in self._phases.items()}
+
+    def server_timing(self) -> str:
+        """Format the phases as a Server-Timing header value."""
+        return ', '.join(
+            f"{name};dur={milliseconds}" for name, milliseconds in self.as_milliseconds().items()
+        )
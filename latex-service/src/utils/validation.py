@@ -2,9 +2,14 @@
 Input validation utilities for LaTeX service.
 """
 
+import re
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 
 
+MAX_SESSION_KEY_LENGTH = 200
+
+
 def validate_compile_request(data: Dict[str, Any]) -> List[str]:
     """
     Validate compile request data.
@@ -43,6 +48,120 @@ def validate_compile_request(data: Dict[str, Any]) -> List[str]:
             custom_errors = validate_customizations(data['customizations'])
             errors.extend(custom_errors)
 
+    if 'sessionKey' in data:
+        session_key = data['sessionKey']
+        if not isinstance(session_key, str) or not session_key.strip() \
+                or len(session_key) > MAX_SESSION_KEY_LENGTH:
+            errors.append(
+                f"sessionKey must be a non-empty string of at most {MAX_SESSION_KEY_LENGTH} characters"
+            )
+
+    # Validate preview options if present
+    if 'preview' in data:
+        if not isinstance(data['preview'], dict):
+            errors.append("preview must be an object")
+        else:
+            errors.extend(validate_preview_options(data['preview']))
+
+    return errors
+
+
+PREVIEW_MIN_DPI = 24
+PREVIEW_MAX_DPI = 300
+PREVIEW_PAGES = ('first', 'all')
+
+
+def validate_preview_options(preview: Dict[str, Any]) -> List[str]:
+    """
+    Validate raster preview options of a compile request.
+
+    Args:
+        preview: Preview options with optional 'dpi' and 'pages'
+
+    Returns:
+        List of validation error messages
+    """
+    errors = []
+
+    if 'dpi' in preview:
+        dpi = preview['dpi']
+        if not isinstance(dpi, int) or isinstance(dpi, bool) \
+                or not PREVIEW_MIN_DPI <= dpi <= PREVIEW_MAX_DPI:
+            errors.append(f"preview.dpi must be an integer from {PREVIEW_MIN_DPI} to {PREVIEW_MAX_DPI}")
+
+    if 'pages' in preview and preview['pages'] not in PREVIEW_PAGES:
+        errors.append(f"preview.pages must be one of: {', '.join(PREVIEW_PAGES)}")
+
+    return errors
+
+
+MAX_BATCH_VARIANTS = 50
+
+
+def validate_batch_request(data: Dict[str, Any]) -> List[str]:
+    """
+    Validate the shared fields of a batch compile request.
+
+    Individual variants are validated separately so one bad variant does
+    not reject the whole batch.
+
+    Args:
+        data: Request data dictionary
+
+    Returns:
+        List of validation error messages (empty if valid)
+    """
+    errors = []
+
+    if 'templateId' not in data:
+        errors.append("Missing required field: templateId")
+    elif not isinstance(data['templateId'], str) or not data['templateId'].strip():
+        errors.append("templateId must be a non-empty string")
+
+    if 'variants' not in data:
+        errors.append("Missing required field: variants")
+    elif not isinstance(data['variants'], list) or not data['variants']:
+        errors.append("variants must be a non-empty array")
+    elif len(data['variants']) > MAX_BATCH_VARIANTS:
+        errors.append(f"variants cannot contain more than {MAX_BATCH_VARIANTS} items")
+
+    if 'customizations' in data:
+        if not isinstance(data['customizations'], dict):
+            errors.append("customizations must be an object")
+        else:
+            errors.extend(validate_customizations(data['customizations']))
+
+    return errors
+
+
+def validate_batch_variant(variant: Any) -> List[str]:
+    """
+    Validate one variant of a batch compile request.
+
+    Args:
+        variant: Variant with 'content' and optional 'id' and 'customizations'
+
+    Returns:
+        List of validation error messages (empty if valid)
+    """
+    if not isinstance(variant, dict):
+        return ["variant must be an object"]
+
+    errors = []
+
+    if 'content' not in variant:
+        errors.append("Missing required field: content")
+    elif not isinstance(variant['content'], dict):
+        errors.append("content must be an object")
+    else:
+        errors.extend(validate_content_structure(variant['content']))
+
+    if 'customizations' in variant:
+        if not isinstance(variant['customizations'], dict):
+            errors.append("customizations must be an object")
+        else:
+            errors.extend(validate_customizations(variant['customizations']))
+
     return errors
 
 
@@ -135,6 +254,12 @@ def validate_customizations(customizations: Dict[str, Any]) -> List[str]:
         if customizations['fontFamily'] not in valid_fonts:
             errors.append(f"fontFamily must be one of: {', '.join(valid_fonts)}")
 
+    # Validate PDF output profile
+    if 'outputProfile' in customizations:
+        valid_profiles = ['size', 'balanced', 'speed']
+        if customizations['outputProfile'] not in valid_profiles:
+            errors.append(f"outputProfile must be one of: {', '.join(valid_profiles)}")
+
     # Validate sections array
     if 'sections' in customizations:
         if not isinstance(customizations['sections'], list):
@@ -151,6 +276,55 @@ def validate_customizations(customizations: Dict[str, Any]) -> List[str]:
     return errors
 
 
+# Replacement for every character TeX treats specially. Angle brackets and the
+# vertical bar are included because the default OT1 font encoding prints
+# them as other glyphs.
+LATEX_ESCAPES = {
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '^': r'\textasciicircum{}',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '\\': r'\textbackslash{}',
+    '<': r'\textless{}',
+    '>': r'\textgreater{}',
+    '|': r'\textbar{}'
+}
+
+# Splitting on a capturing group leaves every special at an odd index, so one
+# regex pass finds them all and the replacements are never re-escaped
+_LATEX_SPECIALS_PATTERN = re.compile('([' + re.escape(''.join(LATEX_ESCAPES)) + '])')
+
+
+def _escape(content: str) -> str:
+    """
+    Escape TeX specials in a single pass over the string.
+
+    The specials are swapped for their escapes with map() rather than a
+    Python callback per match, which is what makes re.sub slow on text
+    with many specials.
+    """
+    parts = _LATEX_SPECIALS_PATTERN.split(content)
+    if len(parts) == 1:
+        return content
+    parts[1::2] = map(LATEX_ESCAPES.__getitem__, parts[1::2])
+    return ''.join(parts)
+
+
+# Strings at or below this length are memoized; longer ones are rarely repeated
+_MEMO_MAX_LENGTH = 64
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_short(content: str) -> str:
+    """Escape a short, frequently repeated string such as a skill."""
+    return _escape(content)
+
+
 def sanitize_latex_content(content: str) -> str:
     """
     Sanitize content for LaTeX compilation by escaping special characters.
@@ -161,22 +335,34 @@ def sanitize_latex_content(content: str) -> str:
     Returns:
         LaTeX-safe content string
     """
-    # LaTeX special characters that need escaping
-    special_chars = {
-        '&': r'\&',
-        '%': r'\%',
-        '$': r'\$',
-        '#': r'\#',
-        '^': r'\textasciicircum{}',
-        '_': r'\_',
-        '{': r'\{',
-        '}': r'\}',
-        '~': r'\textasciitilde{}',
-        '\\': r'\textbackslash{}'
-    }
-
-    result = content
-    for char, escaped in special_chars.items():
-        result = result.replace(char, escaped)
-
-    return result
+    if len(content) <= _MEMO_MAX_LENGTH:
+        return _sanitize_short(content)
+    return _escape(content)
+
+
+# Content fields inserted into templates as they are, without escaping
+RAW_CONTENT_FIELDS = frozenset({'email', 'phone'})
+
+
+def sanitize_content_tree(content: Any, raw_fields: frozenset = RAW_CONTENT_FIELDS) -> Any:
+    """
+    Escape every string in a content tree in one walk.
+
+    Args:
+        content: Nested dicts, lists and scalars, e.g. a resume content object
+        raw_fields: Dict keys whose values are copied without escaping
+
+    Returns:
+        A copy of the tree with all strings LaTeX-escaped; dict keys,
+        non-string scalars and the values of raw fields are left unchanged
+    """
+    if isinstance(content, str):
+        return sanitize_latex_content(content)
+    if isinstance(content, dict):
+        return {
+            key: value if key in raw_fields else sanitize_content_tree(value, raw_fields)
+            for key, value in content.items()
+        }
+    if isinstance(content, (list, tuple)):
+        return [sanitize_content_tree(item, raw_fields) for item in content]
+    return content
@@ -0,0 +1,109 @@
+"""
+Shared fixtures for the LaTeX service tests.
+
+The tests run without TeX Live or Ghostscript: the pdflatex stub from
+benchmarks/fake-texlive and the gs stub in tests/fakebin are put first on
+the PATH, and every work directory points into a temporary directory.
+"""
+
+import os
+import sys
+import copy
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+SERVICE_DIR = Path(__file__).resolve().parent.parent
+TEMPLATES_DIR = SERVICE_DIR / 'templates'
+FAKE_BIN_DIRS = [
+    SERVICE_DIR / 'tests' / 'fakebin',
+    SERVICE_DIR / 'benchmarks' / 'fake-texlive'
+]
+
+# Configure the environment before any service module reads it at import
+_work_root = Path(tempfile.mkdtemp(prefix='latex-service-tests-'))
+os.environ['PATH'] = os.pathsep.join([str(path) for path in FAKE_BIN_DIRS] + [os.environ.get('PATH', '')])
+os.environ['LATEX_SCRATCH_DIR'] = str(_work_root / 'scratch')
+os.environ['LATEX_FORMAT_DIR'] = str(_work_root / 'formats')
+os.environ['TEMPLATE_PREVIEW_DIR'] = str(_work_root / 'previews')
+os.environ['LATEX_INSTALL_MARKER'] = str(_work_root / 'latex-installation.json')
+os.environ.setdefault('COMPILE_WORKERS', '2')
+os.environ.setdefault('COMPILE_QUEUE_SIZE', '2')
+sys.path.insert(0, str(SERVICE_DIR / 'src'))
+
+from fragment_cache import FragmentCache  # noqa: E402
+from latex_compiler import LaTeXCompiler  # noqa: E402
+from result_cache import CompileResultCache  # noqa: E402
+from scratch_space import ScratchSpace  # noqa: E402
+from template_manager import TemplateManager  # noqa: E402
+
+SAMPLE_DATA = json.loads((SERVICE_DIR / 'tests' / 'fixtures' / 'sample_data.json').read_text())
+TEMPLATE_ID = SAMPLE_DATA['templateId']
+
+
+@pytest.fixture
+def content():
+    """A resume content tree tests may modify."""
+    return copy.deepcopy(SAMPLE_DATA['content'])
+
+
+@pytest.fixture
+def template_manager():
+    """A template manager reading the templates shipped with the service."""
+    manager = TemplateManager()
+    manager.templates_dir = TEMPLATES_DIR
+    return manager
+
+
+@pytest.fixture
+def editable_manager(tmp_path):
+    """A template manager over a copy of the templates, checking for changes on every access."""
+    templates_dir = tmp_path / 'templates'
+    shutil.copytree(TEMPLATES_DIR, templates_dir)
+    manager = TemplateManager()
+    manager.templates_dir = templates_dir
+    manager.reload_interval = 0
+    return manager
+
+
+@pytest.fixture
+def template(template_manager):
+    """The loaded default test template."""
+    return template_manager.load_template(TEMPLATE_ID)
+
+
+@pytest.fixture
+def scratch_space(tmp_path):
+    """A scratch space with a single reusable slot."""
+    return ScratchSpace(slots=1, root=str(tmp_path / 'scratch'))
+
+
+@pytest.fixture
+def compiler(scratch_space):
+    """A compiler with its own result and fragment caches."""
+    return LaTeXCompiler(
+        result_cache=CompileResultCache(),
+        fragment_cache=FragmentCache(),
+        scratch_space=scratch_space
+    )
+
+
+@pytest.fixture(scope='session')
+def service():
+    """The Flask app module, reading the templates shipped with the service."""
+    import app as service_module
+    service_module.template_manager.templates_dir = TEMPLATES_DIR
+    service_module.template_manager.reload_templates()
+    return service_module
+
+
+@pytest.fixture
+def client(service):
+    """A test client for the service with empty caches."""
+    service.result_cache.invalidate_template()
+    service.fragment_cache.clear()
+    service.app.config['TESTING'] = True
+    return service.app.test_client()
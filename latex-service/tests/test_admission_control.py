@@ -0,0 +1,80 @@
+"""Tests for admission control and load shedding."""
+
+import time
+import threading
+
+import pytest
+
+from admission_control import AdmissionController
+from conftest import TEMPLATE_ID
+from utils.error_handling import CompileQueueFullError
+
+
+def test_admission_rejects_after_waiting_for_a_slot():
+    admission = AdmissionController(max_in_flight=1, max_queue_wait=0.05)
+
+    with admission.admit() as waited:
+        assert waited < 0.05
+        with pytest.raises(CompileQueueFullError) as rejection:
+            with admission.admit():
+                pass
+
+    assert rejection.value.retry_after >= 1
+    stats = admission.stats()
+    assert (stats['inFlight'], stats['rejected']) == (0, 1)
+
+
+def test_compile_is_shed_with_retry_after(service, client, content, monkeypatch):
+    admission = AdmissionController(max_in_flight=1, max_queue_wait=0)
+    monkeypatch.setattr(service, 'admission', admission)
+
+    with admission.admit():
+        response = client.post('/compile', json={'templateId': TEMPLATE_ID, 'content': content})
+        ready = client.get('/ready')
+
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == str(response.get_json()['retryAfter'])
+    assert ready.status_code == 503
+    assert client.get('/ready').status_code == 200
+
+
+def _batch(content, count):
+    return {
+        'templateId': TEMPLATE_ID,
+        'variants': [{'content': dict(content, summary=f"Variant {number}")} for number in range(count)]
+    }
+
+
+def test_batch_is_shed_when_other_compiles_hold_every_slot(service, client, content, monkeypatch):
+    admission = AdmissionController(max_in_flight=1, max_queue_wait=0)
+    monkeypatch.setattr(service, 'admission', admission)
+
+    with admission.admit():
+        response = client.post('/compile/batch', json=_batch(content, 3))
+
+    results = response.get_json()['results']
+    assert [item['success'] for item in results] == [False, False, False]
+    assert 'saturated' in results[0]['error']
+    assert admission.stats()['rejected'] == 1
+
+
+def test_ready_reports_saturation_while_a_batch_compiles(service, client, content, monkeypatch):
+    admission = AdmissionController(max_in_flight=service.compile_executor.max_workers, max_queue_wait=5)
+    monkeypatch.setattr(service, 'admission', admission)
+    monkeypatch.setenv('FAKE_PDFLATEX_DELAY_MS', '200')
+    responses = []
+    batch = threading.Thread(target=lambda: responses.append(
+        service.app.test_client().post('/compile/batch', json=_batch(content, 4))
+    ))
+
+    batch.start()
+    statuses = []
+    while batch.is_alive():
+        statuses.append(client.get('/ready').status_code)
+        time.sleep(0.02)
+    batch.join()
+
+    assert responses[0].get_json()['summary']['succeeded'] == 4
+    assert 503 in statuses
+    assert admission.stats()['inFlight'] == 0
+    assert client.get('/ready').status_code == 200
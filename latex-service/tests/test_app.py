@@ -0,0 +1,28 @@
+"""Endpoint tests for the Flask app."""
+
+import base64
+
+from conftest import TEMPLATE_ID
+
+
+def test_health(client):
+    response = client.get('/health')
+    assert response.status_code == 200
+    assert response.get_json()['status'] == 'healthy'
+
+
+def test_compile_returns_pdf_and_serves_repeats_from_cache(client, content):
+    body = {'templateId': TEMPLATE_ID, 'content': content}
+
+    first = client.post('/compile', json=body)
+    second = client.post('/compile', json=body)
+
+    assert first.status_code == 200
+    assert base64.b64decode(first.get_json()['pdfBase64']).startswith(b'%PDF')
+    assert first.get_json()['metadata']['cached'] is False
+    assert second.get_json()['metadata']['cached'] is True
+
+
+def test_compile_rejects_missing_content(client):
+    response = client.post('/compile', json={'templateId': TEMPLATE_ID})
+    assert response.status_code == 400
@@ -0,0 +1,52 @@
+"""Tests for the batch compile endpoint."""
+
+from conftest import TEMPLATE_ID
+
+
+def _variants(content, count):
+    variants = []
+    for number in range(count):
+        variant = dict(content, summary=f"Variant {number}")
+        variants.append({'id': f"v{number}", 'content': variant})
+    return variants
+
+
+def test_batch_larger_than_workers_and_queue_compiles_every_variant(
+    service, client, content, monkeypatch
+):
+    executor = service.compile_executor
+    count = 3 * (executor.max_workers + executor.max_queue)
+    monkeypatch.setenv('FAKE_PDFLATEX_DELAY_MS', '30')
+
+    response = client.post('/compile/batch', json={
+        'templateId': TEMPLATE_ID,
+        'variants': _variants(content, count)
+    })
+
+    body = response.get_json()
+    assert response.status_code == 200
+    assert (body['summary']['succeeded'], body['summary']['failed']) == (count, 0)
+    assert [item['id'] for item in body['results']] == [f"v{number}" for number in range(count)]
+
+
+def test_batch_reports_invalid_variants_without_failing_others(client, content):
+    response = client.post('/compile/batch', json={
+        'templateId': TEMPLATE_ID,
+        'variants': [{'content': content}, {'content': 'not an object'}]
+    })
+
+    results = response.get_json()['results']
+    assert results[0]['success'] is True
+    assert results[1]['success'] is False
+    assert results[1]['error'] == 'Validation failed'
+
+
+def test_batch_serves_cached_variants_without_compiling(client, content):
+    client.post('/compile', json={'templateId': TEMPLATE_ID, 'content': content})
+
+    response = client.post('/compile/batch', json={
+        'templateId': TEMPLATE_ID,
+        'variants': [{'content': content}]
+    })
+
+    assert response.get_json()['results'][0]['metadata']['cached'] is True
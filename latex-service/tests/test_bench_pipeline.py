@@ -0,0 +1,24 @@
+"""Smoke test for the pipeline benchmark with the pdflatex stub."""
+
+import sys
+import json
+import subprocess
+
+from conftest import SERVICE_DIR
+
+
+def test_pipeline_benchmark_reports_every_stage(tmp_path):
+    output = tmp_path / 'results.json'
+
+    subprocess.run(
+        [sys.executable, str(SERVICE_DIR / 'benchmarks' / 'bench_pipeline.py'),
+         '--fake-pdflatex', '--sizes', 'xs', '--iterations', '2', '--compile-iterations', '1',
+         '--output', str(output)],
+        cwd=SERVICE_DIR, check=True, capture_output=True, timeout=120
+    )
+
+    results = json.loads(output.read_text())
+    assert results['environment']['pdflatex'] == 'stub'
+    stages = {result['stage'] for result in results['results'] if result['size'] == 'xs'}
+    assert 'validate_compile_request' in stages
+    assert len(stages) > 1
@@ -0,0 +1,38 @@
+"""Tests for the bounded compile executor."""
+
+import threading
+
+import pytest
+
+from compile_executor import CompileExecutor
+from utils.error_handling import CompileQueueFullError
+
+
+def test_executor_rejects_work_beyond_workers_and_queue():
+    executor = CompileExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+    try:
+        running = executor.submit(release.wait)
+        queued = executor.submit(lambda: 'done')
+
+        with pytest.raises(CompileQueueFullError):
+            executor.submit(lambda: 'rejected')
+
+        release.set()
+        assert queued.result(timeout=5) == 'done'
+        assert running.queue_wait is not None
+        # Slots are released as jobs finish
+        assert executor.submit(lambda: 'accepted').result(timeout=5) == 'accepted'
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+def test_executor_propagates_exceptions():
+    executor = CompileExecutor(max_workers=1, max_queue=0)
+    try:
+        future = executor.submit(lambda: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            future.result(timeout=5)
+    finally:
+        executor.shutdown()
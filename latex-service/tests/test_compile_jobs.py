@@ -0,0 +1,26 @@
+"""Tests for the asynchronous compile jobs API."""
+
+import time
+
+from conftest import TEMPLATE_ID
+
+
+def test_compile_job_can_be_polled_and_fetched(client, content):
+    submitted = client.post('/compile/jobs', json={'templateId': TEMPLATE_ID, 'content': content})
+    job_id = submitted.get_json()['job']['jobId']
+
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        job = client.get(f"/compile/jobs/{job_id}").get_json()['job']
+        if job['status'] not in ('queued', 'running'):
+            break
+        time.sleep(0.02)
+    pdf = client.get(f"/compile/jobs/{job_id}/pdf", headers={'Accept': 'application/pdf'})
+
+    assert submitted.status_code == 202
+    assert job['status'] == 'succeeded'
+    assert pdf.get_data().startswith(b'%PDF')
+
+
+def test_unknown_compile_job_is_404(client):
+    assert client.get('/compile/jobs/missing').status_code == 404
@@ -0,0 +1,79 @@
+"""Tests for cancelling compiles superseded by newer requests."""
+
+import time
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from compile_sessions import CompileSessions
+from conftest import TEMPLATE_ID
+from utils.error_handling import CompileSupersededError
+
+
+def test_newer_request_cancels_previous_one():
+    sessions = CompileSessions()
+    first = sessions.start('doc-1')
+    second = sessions.start('doc-1')
+    other = sessions.start('doc-2')
+
+    with pytest.raises(CompileSupersededError):
+        first.raise_if_cancelled()
+    second.raise_if_cancelled()
+    other.raise_if_cancelled()
+    assert sessions.stats() == {'activeSessions': 2, 'cancelled': 1}
+
+
+def test_cancel_drops_queued_future():
+    sessions = CompileSessions()
+    cancellation = sessions.start('doc-1')
+    future = Future()
+    cancellation.attach_future(future)
+
+    sessions.start('doc-1')
+
+    assert future.cancelled()
+
+
+def test_finish_of_superseded_request_keeps_newer_one():
+    sessions = CompileSessions()
+    first = sessions.start('doc-1')
+    sessions.start('doc-1')
+
+    sessions.finish(first)
+
+    assert sessions.stats()['activeSessions'] == 1
+
+
+def test_superseded_compile_gets_409(client, content, monkeypatch):
+    monkeypatch.setenv('FAKE_PDFLATEX_DELAY_MS', '500')
+    responses = {}
+
+    def post(name, summary):
+        body = {'templateId': TEMPLATE_ID, 'content': dict(content, summary=summary), 'sessionKey': 'doc-1'}
+        responses[name] = client.post('/compile', json=body)
+
+    first = threading.Thread(target=post, args=('first', 'Draft one'))
+    first.start()
+    time.sleep(0.2)
+    post('second', 'Draft two')
+    first.join()
+
+    assert responses['first'].status_code == 409
+    assert responses['first'].get_json()['status'] == 'superseded'
+    assert responses['second'].status_code == 200
+
+
+def test_compile_dropped_from_queue_without_session_is_shed(service, client, content, monkeypatch):
+    class ShutDownExecutor:
+        def submit(self, fn, *args, **kwargs):
+            future = Future()
+            future.cancel()
+            return future
+
+    monkeypatch.setattr(service, 'compile_executor', ShutDownExecutor())
+
+    response = client.post('/compile', json={'templateId': TEMPLATE_ID, 'content': content})
+
+    assert response.status_code == 429
+    assert 'dropped from the queue' in response.get_json()['error']
@@ -0,0 +1,21 @@
+"""Tests for the streaming LaTeX log error parser."""
+
+from utils.error_handling import LaTeXErrorCollector
+
+
+def test_error_collector_keeps_location_and_bounds_errors():
+    collector = LaTeXErrorCollector(max_errors=2)
+    for line in [
+        '! Undefined control sequence.',
+        'l.42 \\badcommand',
+        '! Missing $ inserted.',
+        '! Emergency stop.'
+    ]:
+        collector.feed_line(line)
+
+    result = collector.result()
+    assert result['totalErrors'] == 3
+    assert len(result['details']) == 2
+    assert result['details'][0]['line_number'] == 42
+    assert result['details'][0]['source'] == '\\badcommand'
+    assert collector.full
@@ -0,0 +1,41 @@
+"""Tests for precompiled per-template format files."""
+
+from format_cache import FormatCache
+
+
+def test_format_cache_builds_and_reuses_format(tmp_path, template):
+    cache = FormatCache(str(tmp_path))
+
+    first = cache.ensure_format(template['id'], template['latex_source'])
+    second = cache.ensure_format(template['id'], template['latex_source'])
+
+    assert first == second
+    assert (tmp_path / f"{first['name']}.fmt").exists()
+
+
+def test_format_cache_replaces_stale_formats(tmp_path, template):
+    cache = FormatCache(str(tmp_path))
+    old = cache.ensure_format(template['id'], template['latex_source'])
+
+    source = template['latex_source'].replace('\\begin{document}', '% changed\n\\begin{document}', 1)
+    new = cache.ensure_format(template['id'], source)
+
+    assert new['name'] != old['name']
+    assert [path.stem for path in tmp_path.glob('*.fmt')] == [new['name']]
+
+
+def test_format_cache_skips_preambles_with_placeholders(tmp_path):
+    cache = FormatCache(str(tmp_path))
+    source = '\\documentclass{article}\n\\title{{{NAME}}}\n\\begin{document}\n\\end{document}\n'
+    assert cache.ensure_format('t', source) is None
+
+
+def test_compile_starts_from_precompiled_format(compiler, template, content, tmp_path):
+    template = dict(template, format=FormatCache(str(tmp_path)).ensure_format(
+        template['id'], template['latex_source']
+    ))
+
+    metadata = compiler.compile_resume(template, content)['metadata']
+
+    assert metadata['usedFormat'] is True
+    assert metadata['engine'] == 'pdflatex'
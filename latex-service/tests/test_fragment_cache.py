@@ -0,0 +1,98 @@
+"""Tests for the LaTeX fragment cache."""
+
+from conftest import TEMPLATE_ID
+from fragment_cache import FragmentCache
+
+
+def test_renders_once_per_distinct_data():
+    cache = FragmentCache()
+    calls = []
+
+    def render(data):
+        calls.append(data)
+        return f"\\item {data['name']}"
+
+    first = cache.get_or_render('item', {'name': 'A'}, render)
+    second = cache.get_or_render('item', {'name': 'A'}, render)
+    cache.get_or_render('item', {'name': 'B'}, render)
+
+    assert first == second == '\\item A'
+    assert len(calls) == 2
+    assert cache.stats()['kinds']['item'] == {'hits': 1, 'misses': 2, 'hitRate': 1 / 3}
+
+
+def test_caches_empty_fragments():
+    cache = FragmentCache()
+    calls = []
+
+    def render(data):
+        calls.append(data)
+        return ''
+
+    cache.get_or_render('item', 1, render)
+    cache.get_or_render('item', 1, render)
+
+    assert len(calls) == 1
+    assert cache.stats()['hits'] == 1
+
+
+def test_evicts_least_recently_used():
+    cache = FragmentCache(max_entries=2)
+    cache.get_or_render('item', 1, str)
+    cache.get_or_render('item', 2, str)
+    cache.get_or_render('item', 1, str)
+    cache.get_or_render('item', 3, str)
+
+    cache.get_or_render('item', 1, str)
+    cache.get_or_render('item', 2, str)
+
+    assert cache.stats()['kinds']['item']['hits'] == 2
+
+
+def test_skipped_certifications_are_cached_and_left_out(compiler):
+    certifications = ['AWS', 42, {'name': 'CKA', 'issuer': 'CNCF', 'date': '2024'}]
+
+    first = compiler._generate_certifications_section(certifications)
+    compiler.fragment_cache.clear()
+    compiler._generate_certifications_section(certifications)
+    second = compiler._generate_certifications_section(certifications + ['GCP'])
+
+    assert first == '\\item AWS\n\\certificationitem{CKA}{CNCF}{2024}'
+    assert second == first + '\n\\item GCP'
+    assert compiler.fragment_cache.stats()['kinds']['certification']['hits'] == 3
+
+
+def test_cache_stats_report_pdf_and_fragment_caches(client, content):
+    client.post('/compile', json={'templateId': TEMPLATE_ID, 'content': content})
+
+    stats = client.get('/cache/stats').get_json()
+
+    assert stats['pdfCache']['entries'] == 1
+    assert stats['fragmentCache']['misses'] > 0
+
+
+def test_keys_tell_apart_data_python_considers_equal():
+    cache = FragmentCache()
+
+    fragments = [cache.get_or_render('item', data, repr) for data in (1, 1.0, True, {'a': 'b'}, [['a', 'b']])]
+
+    assert fragments == ['1', '1.0', 'True', "{'a': 'b'}", "[['a', 'b']]"]
+
+
+def test_section_edit_renders_only_the_edited_item():
+    cache = FragmentCache()
+    rendered = []
+
+    def render_item(item):
+        rendered.append(item)
+        return item['title']
+
+    items = [{'title': 'A'}, {'title': 'B'}, {'title': 'C'}]
+    cache.get_or_render_section('item_section', 'item', items, render_item, ', '.join)
+    items[1] = {'title': 'B2'}
+    section = cache.get_or_render_section('item_section', 'item', items, render_item, ', '.join)
+    repeat = cache.get_or_render_section('item_section', 'item', items, render_item, ', '.join)
+
+    assert section == repeat == 'A, B2, C'
+    assert rendered == [{'title': 'A'}, {'title': 'B'}, {'title': 'C'}, {'title': 'B2'}]
+    assert cache.stats()['kinds']['item_section'] == {'hits': 1, 'misses': 2, 'hitRate': 1 / 3}
@@ -0,0 +1,16 @@
+"""Tests for the cached LaTeX installation check."""
+
+import json
+
+import latex_compiler
+
+
+def test_installation_marker_skips_pdflatex_check(compiler, monkeypatch):
+    marker = json.loads(open(latex_compiler.LATEX_INSTALL_MARKER).read())
+    assert marker['pdflatex'].endswith('pdflatex')
+
+    def fail(*args, **kwargs):
+        raise AssertionError('pdflatex --version should not run')
+
+    monkeypatch.setattr(latex_compiler, 'verify_latex_installation', fail)
+    compiler._verify_latex_installation()
@@ -0,0 +1,14 @@
+"""Tests for the Prometheus /metrics endpoint."""
+
+from conftest import TEMPLATE_ID
+
+
+def test_metrics_expose_compile_pipeline(client, content):
+    client.post('/compile', json={'templateId': TEMPLATE_ID, 'content': content})
+
+    response = client.get('/metrics')
+
+    text = response.get_data(as_text=True)
+    assert response.status_code == 200
+    assert 'latex_compile_seconds' in text
+    assert 'latex_compiles_queued' in text
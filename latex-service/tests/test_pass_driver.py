@@ -0,0 +1,21 @@
+"""Tests for rerunning pdflatex only while auxiliary files change."""
+
+from latex_compiler import LaTeXCompiler
+
+
+def test_auxiliary_digest_ignores_lines_written_on_every_run(tmp_path):
+    tex_file = tmp_path / 'resume.tex'
+    empty = LaTeXCompiler._auxiliary_digest(tex_file)
+
+    tex_file.with_suffix('.aux').write_text('\\relax \n')
+    relax_only = LaTeXCompiler._auxiliary_digest(tex_file)
+    tex_file.with_suffix('.aux').write_text('\\relax \n\\newlabel{LastPage}{{2}{2}}\n')
+    with_label = LaTeXCompiler._auxiliary_digest(tex_file)
+
+    assert relax_only == empty
+    assert with_label != empty
+
+
+def test_stable_auxiliary_files_need_one_pass(compiler, template, content):
+    metadata = compiler.compile_resume(template, content)['metadata']
+    assert metadata['passes'] == 1
@@ -0,0 +1,81 @@
+"""Tests for page count, size and warnings from pdflatex output and PDFs."""
+
+import zlib
+
+from pdf_metadata import LogMetadataExtractor, PDF_FALLBACK_READ_BYTES, read_pdf_page_count
+
+
+def _feed(lines):
+    extractor = LogMetadataExtractor()
+    for line in lines:
+        extractor.feed_line(line)
+    return extractor.result()
+
+
+def _object_stream_pdf(pages: int, padding: int = 0) -> bytes:
+    """Build a PDF whose page tree lives in a Flate object stream, as pdfTeX writes it."""
+    kids = ' '.join(f"{3 + index} 0 R" for index in range(pages))
+    objects = f"<</Type/Catalog/Pages 2 0 R>> <</Type/Pages/Count {pages}/Kids[{kids}]>>".encode()
+    header = b'1 0 2 30 '
+    stream = zlib.compress(header + objects)
+    return (
+        b'%PDF-1.5\n'
+        + b'%' + b'x' * padding + b'\n'
+        + b'7 0 obj\n<</Type/ObjStm/N 2/First ' + str(len(header)).encode()
+        + b'/Length ' + str(len(stream)).encode() + b'/Filter/FlateDecode>>\nstream\n'
+        + stream + b'\nendstream\nendobj\n'
+        + b'startxref\n0\n%%EOF\n'
+    )
+
+
+def test_reads_pages_and_size_from_output_line():
+    result = _feed(['Output written on resume.pdf (2 pages, 48213 bytes).'])
+    assert (result['pages'], result['fileSize']) == (2, 48213)
+
+
+def test_reads_output_line_wrapped_by_tex():
+    result = _feed([
+        'Output written on /dev/shm/latex-work/slot-0/resume.pdf (3 pages, 5',
+        '1234 bytes).'
+    ])
+    assert (result['pages'], result['fileSize']) == (3, 51234)
+
+
+def test_xelatex_output_line_without_bytes():
+    result = _feed(['Output written on resume.pdf (1 page).'])
+    assert (result['pages'], result['fileSize']) == (1, None)
+
+
+def test_counts_box_and_font_warnings():
+    result = _feed([
+        'Overfull \\hbox (12.0pt too wide) in paragraph at lines 10--12',
+        'Underfull \\vbox (badness 10000) has occurred while \\output is active',
+        'LaTeX Font Warning: Font shape `OT1/cmr/bx/sc\' undefined',
+    ])
+    warnings = result['warnings']
+    assert (warnings['overfullBoxes'], warnings['underfullBoxes']) == (1, 1)
+    assert len(warnings['missingFonts']) == 1
+
+
+def test_page_count_from_uncompressed_page_tree(tmp_path):
+    pdf_path = tmp_path / 'resume.pdf'
+    pdf_path.write_bytes(b'%PDF-1.4\n2 0 obj\n<< /Type /Pages /Kids [3 0 R 4 0 R] /Count 2 >>\nendobj\n')
+    assert read_pdf_page_count(pdf_path) == 2
+
+
+def test_page_count_from_object_stream(tmp_path):
+    pdf_path = tmp_path / 'resume.pdf'
+    pdf_path.write_bytes(_object_stream_pdf(4))
+    assert read_pdf_page_count(pdf_path) == 4
+
+
+def test_page_count_from_object_stream_at_end_of_large_pdf(tmp_path):
+    pdf_path = tmp_path / 'resume.pdf'
+    pdf_path.write_bytes(_object_stream_pdf(5, padding=3 * PDF_FALLBACK_READ_BYTES))
+    assert read_pdf_page_count(pdf_path) == 5
+
+
+def test_compile_reports_pages_from_pdflatex_output(compiler, template, content):
+    metadata = compiler.compile_resume(template, content)['metadata']
+    assert metadata['pages'] == 1
+    assert metadata['fileSize'] > 0
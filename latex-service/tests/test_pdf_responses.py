@@ -0,0 +1,57 @@
+"""Tests for binary PDF responses."""
+
+from conftest import TEMPLATE_ID
+from latex_compiler import OUTPUT_FILE
+
+
+def test_compile_streams_binary_pdf_with_metadata_headers(client, content):
+    response = client.post(
+        '/compile',
+        json={'templateId': TEMPLATE_ID, 'content': content},
+        headers={'Accept': 'application/pdf'}
+    )
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/pdf'
+    assert response.get_data().startswith(b'%PDF')
+    assert response.headers['X-Resume-Pages'] == '1'
+    assert 'pdflatex_pass_1;dur=' in response.headers['Server-Timing']
+
+
+def test_file_output_is_moved_to_outbox(compiler, template, content):
+    result = compiler.compile_resume(template, content, output_format=OUTPUT_FILE)
+
+    pdf_path = result['pdf_path']
+    assert pdf_path.parent == compiler.outbox_dir
+    assert pdf_path.read_bytes().startswith(b'%PDF')
+    pdf_path.unlink()
+
+
+def test_metadata_headers_carry_only_scalars_and_warning_counts(service, client, content, monkeypatch):
+    compile_resume = service.latex_compiler.compile_resume
+
+    def with_warnings(*args, **kwargs):
+        result = compile_resume(*args, **kwargs)
+        result['metadata']['warnings'] = {
+            'overfullBoxes': 12,
+            'underfullBoxes': 0,
+            'boxMessages': ['Overfull \\hbox (15.0pt too wide) in paragraph at lines 1--2'] * 10,
+            'missingFonts': ['OT1/cmr/m/n']
+        }
+        return result
+
+    monkeypatch.setattr(service.latex_compiler, 'compile_resume', with_warnings)
+
+    response = client.post(
+        '/compile',
+        json={'templateId': TEMPLATE_ID, 'content': content},
+        headers={'Accept': 'application/pdf'}
+    )
+
+    assert response.status_code == 200
+    assert response.headers['X-Resume-Overfull-Boxes'] == '12'
+    assert response.headers['X-Resume-Underfull-Boxes'] == '0'
+    assert response.headers['X-Resume-Missing-Fonts'] == '1'
+    assert response.headers['X-Resume-Cached'] == 'false'
+    assert 'X-Resume-Warnings' not in response.headers
+    assert 'X-Resume-Timings' not in response.headers
@@ -0,0 +1,83 @@
+"""Tests for raster previews of compiled resumes."""
+
+import base64
+import hashlib
+
+from conftest import TEMPLATE_ID
+from pdf_raster import rasterize_pdf
+
+
+def _rendered_from(image: bytes) -> str:
+    """Return the SHA-256 of the PDF the stub Ghostscript rendered an image from."""
+    return image.split(b' ')[1].decode('ascii')
+
+
+def test_preview_renders_first_page_only_by_default(compiler, template, content, monkeypatch):
+    monkeypatch.setenv('FAKE_GS_PAGES', '3')
+
+    result = compiler.compile_preview(template, content)
+
+    assert len(result['images']) == 1
+
+
+def test_preview_slot_reuse_returns_only_this_requests_pages(
+    compiler, scratch_space, template, content, monkeypatch
+):
+    # Both previews go through the one scratch slot; the second PDF has
+    # fewer pages, so pages of the first must not be picked up with it
+    monkeypatch.setenv('FAKE_GS_PAGES', '3')
+    first = compiler.compile_preview(template, content, all_pages=True)
+
+    monkeypatch.setenv('FAKE_GS_PAGES', '1')
+    content['summary'] = 'A different resume'
+    second = compiler.compile_preview(template, content, all_pages=True)
+
+    assert len(first['images']) == 3
+    assert len(second['images']) == 1
+    slot_dir, = scratch_space._slot_dirs
+    assert list(slot_dir.iterdir()) == []
+
+
+def test_rasterize_pdf_ignores_pages_already_in_output_dir(tmp_path, monkeypatch):
+    pdf_path = tmp_path / 'resume.pdf'
+    pdf_path.write_bytes(b'%PDF-1.5 new')
+    (tmp_path / 'page-1.png').write_bytes(b'stale')
+    (tmp_path / 'page-2.png').write_bytes(b'stale')
+    monkeypatch.setenv('FAKE_GS_PAGES', '1')
+
+    pages = rasterize_pdf(pdf_path, tmp_path, 72)
+
+    assert [page.name for page in pages] == ['page-1.png']
+    assert _rendered_from(pages[0].read_bytes()) == hashlib.sha256(pdf_path.read_bytes()).hexdigest()
+
+
+def test_preview_is_cached_with_pdf(compiler, template, content):
+    first = compiler.compile_preview(template, content)
+    second = compiler.compile_preview(template, content)
+
+    assert first['metadata']['cached'] is False
+    assert second['metadata']['cached'] is True
+    assert second['images'] == first['images']
+
+
+def test_preview_lookups_do_not_count_as_pdf_lookups(compiler, template, content):
+    compiler.compile_preview(template, content)
+    compiler.compile_preview(template, content)
+
+    stats = compiler.result_cache.stats()
+    assert (stats['previewHits'], stats['previewMisses']) == (1, 1)
+    # Only compile_resume's own lookup on the first preview is a PDF lookup
+    assert (stats['hits'], stats['misses']) == (0, 1)
+
+
+def test_compile_preview_returns_png(client, content):
+    body = {'templateId': TEMPLATE_ID, 'content': content, 'preview': {'dpi': 50}}
+
+    as_json = client.post('/compile', json=body)
+    as_png = client.post('/compile', json=body, headers={'Accept': 'image/png'})
+
+    previews = as_json.get_json()['previews']
+    assert len(previews) == 1
+    assert base64.b64decode(previews[0]['pngBase64']).startswith(b'\x89PNG')
+    assert as_png.mimetype == 'image/png'
+    assert as_png.get_data().startswith(b'\x89PNG')
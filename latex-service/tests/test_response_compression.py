@@ -0,0 +1,110 @@
+"""Tests for gzip/brotli response compression."""
+
+import gzip
+import json
+
+import pytest
+from werkzeug.http import parse_accept_header, parse_etags
+from werkzeug.wrappers import Response
+
+import response_compression
+from response_compression import compress_response
+
+BODY = json.dumps({'items': ['resume'] * 500}).encode('utf-8')
+
+
+def _accept(header):
+    return parse_accept_header(header)
+
+
+def _json_response(body=BODY, etag=None, weak=False):
+    response = Response(body, mimetype='application/json')
+    if etag:
+        response.set_etag(etag, weak=weak)
+    return response
+
+
+@pytest.fixture
+def gzip_only(monkeypatch):
+    monkeypatch.setattr(response_compression, 'brotli', None)
+
+
+def test_compresses_large_json_with_gzip(gzip_only):
+    response = compress_response(_json_response(), _accept('gzip'))
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(response.get_data()) == BODY
+    assert response.headers['X-Uncompressed-Content-Length'] == str(len(BODY))
+    assert 'Accept-Encoding' in response.vary
+
+
+def test_compression_is_deterministic(gzip_only):
+    first = compress_response(_json_response(), _accept('gzip'))
+    second = compress_response(_json_response(), _accept('gzip'))
+    assert first.get_data() == second.get_data()
+
+
+def test_leaves_small_bodies_and_their_strong_etag_alone(gzip_only):
+    response = compress_response(_json_response(b'{}', etag='abc'), _accept('gzip'))
+
+    assert 'Content-Encoding' not in response.headers
+    assert response.get_etag() == ('abc', False)
+
+
+def test_leaves_strong_etag_alone_without_accept_encoding(gzip_only):
+    response = compress_response(_json_response(etag='abc'), _accept(''))
+
+    assert 'Content-Encoding' not in response.headers
+    assert response.get_etag() == ('abc', False)
+
+
+def test_suffixes_strong_etag_of_compressed_body(gzip_only):
+    response = compress_response(_json_response(etag='abc'), _accept('gzip'))
+    assert response.get_etag() == ('abc-gzip', False)
+
+
+def test_keeps_weak_etag_of_compressed_body(gzip_only):
+    response = compress_response(_json_response(etag='abc', weak=True), _accept('gzip'))
+    assert response.get_etag() == ('abc', True)
+
+
+def test_revalidation_with_encoded_etag_gets_304(gzip_only):
+    response = compress_response(
+        _json_response(etag='abc'), _accept('gzip'), parse_etags('"abc-gzip"')
+    )
+
+    assert response.status_code == 304
+    assert response.get_etag() == ('abc-gzip', False)
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_revalidation_with_other_encoding_gets_full_response(gzip_only):
+    response = compress_response(
+        _json_response(etag='abc'), _accept('gzip'), parse_etags('"abc-br"')
+    )
+
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+
+
+def test_leaves_pdf_responses_alone(gzip_only):
+    response = Response(BODY, mimetype='application/pdf')
+    response = compress_response(response, _accept('gzip'))
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_catalog_revalidates_with_encoded_etag(client, monkeypatch, gzip_only):
+    monkeypatch.setattr(response_compression, 'MIN_COMPRESS_BYTES', 0)
+
+    first = client.get('/templates', headers={'Accept-Encoding': 'gzip'})
+    etag, weak = first.get_etag()
+    revalidated = client.get('/templates', headers={
+        'Accept-Encoding': 'gzip',
+        'If-None-Match': f'"{etag}"'
+    })
+    identity = client.get('/templates', headers={'If-None-Match': f'"{etag}"'})
+
+    assert first.headers['Content-Encoding'] == 'gzip'
+    assert etag.endswith('-gzip') and not weak
+    assert revalidated.status_code == 304
+    assert identity.status_code == 200
@@ -0,0 +1,79 @@
+"""Tests for the compiled PDF result cache."""
+
+from result_cache import CompileResultCache
+
+
+def test_make_key_ignores_dict_order():
+    template = {'id': 't', 'latex_source': 'x'}
+    first = CompileResultCache.make_key(template, {'a': 1, 'b': [1, 2]}, {'font': 'Arial'})
+    second = CompileResultCache.make_key(template, {'b': [1, 2], 'a': 1}, {'font': 'Arial'})
+    assert first == second
+
+
+def test_make_key_changes_with_template_source():
+    content = {'a': 1}
+    first = CompileResultCache.make_key({'id': 't', 'latex_source': 'x'}, content)
+    second = CompileResultCache.make_key({'id': 't', 'latex_source': 'y'}, content)
+    assert first != second
+
+
+def test_get_returns_copy_of_metadata():
+    cache = CompileResultCache(max_bytes=1024)
+    cache.put('k', 't', b'%PDF', {'pages': 1})
+
+    cached = cache.get('k')
+    cached['metadata']['cached'] = True
+
+    assert cache.get('k')['metadata'] == {'pages': 1}
+    assert cache.stats()['hits'] == 2
+
+
+def test_evicts_least_recently_used_over_budget():
+    cache = CompileResultCache(max_bytes=10)
+    cache.put('a', 't', b'12345', {})
+    cache.put('b', 't', b'12345', {})
+    cache.get('a')
+    cache.put('c', 't', b'12345', {})
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+    assert cache.get('c') is not None
+    assert cache.stats()['evictions'] == 1
+
+
+def test_skips_results_larger_than_budget():
+    cache = CompileResultCache(max_bytes=4)
+    cache.put('k', 't', b'12345', {})
+    assert cache.get('k') is None
+    assert cache.stats()['bytes'] == 0
+
+
+def test_invalidate_template_drops_only_that_template():
+    cache = CompileResultCache(max_bytes=1024)
+    cache.put('a', 'one', b'pdf', {})
+    cache.put('b', 'two', b'pdf', {})
+
+    cache.invalidate_template('one')
+
+    assert cache.get('a') is None
+    assert cache.get('b') is not None
+    assert cache.stats()['bytes'] == 3
+
+
+def test_compile_resume_serves_repeat_requests_from_cache(compiler, template, content):
+    first = compiler.compile_resume(template, content)
+    second = compiler.compile_resume(template, content)
+
+    assert first['metadata']['cached'] is False
+    assert second['metadata']['cached'] is True
+    assert second['pdf_base64'] == first['pdf_base64']
+    assert compiler.result_cache.stats()['hits'] == 1
+
+
+def test_compile_resume_misses_after_content_change(compiler, template, content):
+    compiler.compile_resume(template, content)
+    content['summary'] = 'Changed'
+
+    result = compiler.compile_resume(template, content)
+
+    assert result['metadata']['cached'] is False
@@ -0,0 +1,40 @@
+"""Tests for the reusable scratch directories."""
+
+import os
+import time
+
+from scratch_space import ScratchSpace
+
+
+def test_scratch_slot_is_wiped_after_compile(compiler, scratch_space, template, content):
+    compiler.compile_resume(template, content)
+
+    slot_dir, = scratch_space._slot_dirs
+    assert list(slot_dir.iterdir()) == []
+    assert scratch_space.usage()['freeSlots'] == 1
+
+
+def test_scratch_space_overflows_into_temporary_directories(tmp_path):
+    scratch = ScratchSpace(slots=1, root=str(tmp_path))
+
+    with scratch.acquire() as slot_dir, scratch.acquire() as overflow_dir:
+        assert slot_dir.name == 'slot-0'
+        assert overflow_dir.name.startswith('overflow-')
+        (overflow_dir / 'resume.tex').write_text('x')
+
+    assert not overflow_dir.exists()
+
+
+def test_scratch_sweep_removes_only_stale_orphans(tmp_path):
+    scratch = ScratchSpace(slots=1, root=str(tmp_path), stale_seconds=60)
+    (tmp_path / 'tmpabc').mkdir()
+    (tmp_path / 'tmpnew').mkdir()
+    os.utime(tmp_path / 'tmpabc', (time.time() - 120, time.time() - 120))
+    (tmp_path / 'slot-0' / 'resume.aux').write_text('kept')
+
+    usage = scratch.sweep()
+
+    assert not (tmp_path / 'tmpabc').exists()
+    assert (tmp_path / 'tmpnew').exists()
+    assert (tmp_path / 'slot-0' / 'resume.aux').exists()
+    assert usage['removed'] == 1
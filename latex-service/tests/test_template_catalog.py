@@ -0,0 +1,32 @@
+"""Tests for the template catalog."""
+
+import json
+
+from conftest import TEMPLATE_ID
+from template_catalog import TemplateCatalog
+
+
+def test_catalog_etag_changes_when_metadata_changes(editable_manager):
+    catalog = TemplateCatalog(editable_manager)
+    before = catalog.details(TEMPLATE_ID)
+
+    metadata_file = editable_manager.templates_dir / TEMPLATE_ID / 'metadata.json'
+    metadata = json.loads(metadata_file.read_text(encoding='utf-8'))
+    metadata['description'] = 'Edited description'
+    metadata_file.write_text(json.dumps(metadata), encoding='utf-8')
+    after = catalog.details(TEMPLATE_ID)
+
+    assert after.etag != before.etag
+    assert b'Edited description' in after.body
+
+
+def test_template_catalog_revalidates_with_etag(client):
+    first = client.get('/templates')
+    etag, _ = first.get_etag()
+    revalidated = client.get('/templates', headers={'If-None-Match': f'"{etag}"'})
+
+    assert first.status_code == 200
+    assert TEMPLATE_ID in first.get_data(as_text=True)
+    assert revalidated.status_code == 304
+    assert client.get(f"/templates/{TEMPLATE_ID}").status_code == 200
+    assert client.get('/templates/no-such-template').status_code == 404
@@ -0,0 +1,54 @@
+"""Tests for template preview images."""
+
+import pytest
+
+import template_previews
+from admission_control import AdmissionController
+from conftest import TEMPLATE_ID
+from utils.error_handling import RasterizationError
+
+
+def test_preview_is_rendered_once_and_then_served_from_disk(service, client):
+    service.template_previews.invalidate_template(TEMPLATE_ID)
+
+    first = client.get(f"/templates/{TEMPLATE_ID}/preview")
+    second = client.get(f"/templates/{TEMPLATE_ID}/preview")
+
+    assert first.status_code == 200
+    assert first.mimetype == 'image/png'
+    assert second.get_data() == first.get_data()
+    assert second.headers['ETag'] == first.headers['ETag']
+
+
+def test_preview_of_unknown_template_is_404(client):
+    assert client.get('/templates/no-such-template/preview').status_code == 404
+
+
+def test_preview_render_is_shed_when_compiles_saturate(service, client, monkeypatch):
+    service.template_previews.invalidate_template(TEMPLATE_ID)
+    admission = AdmissionController(max_in_flight=1, max_queue_wait=0)
+    monkeypatch.setattr(service, 'admission', admission)
+
+    with admission.admit():
+        response = client.get(f"/templates/{TEMPLATE_ID}/preview")
+
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) >= 1
+    assert service.template_previews.find(TEMPLATE_ID) is None
+
+
+def test_preview_without_ghostscript_is_404_without_compiling(service, client, monkeypatch):
+    service.template_previews.invalidate_template(TEMPLATE_ID)
+    monkeypatch.setattr(template_previews, 'rasterizer_available', lambda: False)
+
+    def fail(*args, **kwargs):
+        raise AssertionError('the sample resume should not be compiled')
+
+    monkeypatch.setattr(service.compile_executor, 'submit', fail)
+    monkeypatch.setattr(service.latex_compiler, 'compile_resume', fail)
+
+    response = client.get(f"/templates/{TEMPLATE_ID}/preview")
+
+    assert response.status_code == 404
+    with pytest.raises(RasterizationError):
+        service.template_previews.render(TEMPLATE_ID)
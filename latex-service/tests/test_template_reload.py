@@ -0,0 +1,23 @@
+"""Tests for mtime-based template hot reload."""
+
+from conftest import TEMPLATE_ID
+
+
+def _touch_template(manager, text):
+    template_file = manager.templates_dir / TEMPLATE_ID / 'template.tex'
+    source = template_file.read_text(encoding='utf-8')
+    template_file.write_text(source.replace('\\begin{document}', f"{text}\n\\begin{{document}}", 1),
+                             encoding='utf-8')
+
+
+def test_changed_template_is_reloaded_and_invalidated(editable_manager):
+    invalidated = []
+    editable_manager.add_invalidation_listener(invalidated.append)
+    before = editable_manager.load_template(TEMPLATE_ID)
+
+    _touch_template(editable_manager, '% edited')
+    after = editable_manager.load_template(TEMPLATE_ID)
+
+    assert '% edited' in after['latex_source']
+    assert '% edited' not in before['latex_source']
+    assert invalidated == [TEMPLATE_ID]
@@ -0,0 +1,30 @@
+"""Tests for the single-pass template renderer."""
+
+import pytest
+
+from conftest import TEMPLATE_ID
+from template_renderer import CompiledTemplate
+from utils.error_handling import TemplateNotFoundError
+
+
+def test_compiled_template_renders_in_one_pass():
+    renderer = CompiledTemplate('\\name{{{NAME}}} {{SUMMARY}}{{EXTRA}}', variables=['NAME', 'SUMMARY', 'UNUSED'])
+
+    rendered = renderer.render({'NAME': 'Jane', 'SUMMARY': 'Uses {{NAME}} literally'})
+
+    assert rendered == '\\name{Jane} Uses {{NAME}} literally'
+    assert renderer.unknown_placeholders == {'EXTRA'}
+    assert renderer.missing_placeholders == {'UNUSED'}
+
+
+def test_load_template_parses_source_once(template_manager):
+    first = template_manager.load_template(TEMPLATE_ID)
+    second = template_manager.load_template(TEMPLATE_ID)
+
+    assert first['renderer'] is second['renderer']
+    assert '{{NAME}}' in first['latex_source']
+
+
+def test_unknown_template_raises(template_manager):
+    with pytest.raises(TemplateNotFoundError):
+        template_manager.load_template('no-such-template')
@@ -0,0 +1,35 @@
+"""Tests for the pluggable TeX engines."""
+
+import pytest
+
+from tex_engines import get_engine
+
+
+@pytest.mark.parametrize('name', ['pdflatex', 'xelatex', 'lualatex'])
+def test_engine_command_inputs_file_after_output_settings(name, tmp_path):
+    command, _ = get_engine(name).command(tmp_path / 'resume.tex', 'size')
+
+    assert command[0] == name
+    assert '-jobname=resume' in command
+    assert command[-1].endswith('\\input{resume.tex}')
+
+
+def test_pdflatex_command_uses_format_directory(tmp_path):
+    format_info = {'name': 'resume__abc', 'directory': str(tmp_path)}
+    command, env = get_engine('pdflatex').command(tmp_path / 'resume.tex', format_info=format_info)
+
+    assert command[1] == '-fmt=resume__abc'
+    assert env['TEXFORMATS'].startswith(str(tmp_path))
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError):
+        get_engine('context')
+
+
+def test_compile_with_template_engine(compiler, template, content):
+    metadata = compiler.compile_resume(dict(template, engine='xelatex'), content)['metadata']
+
+    assert metadata['engine'] == 'xelatex'
+    assert metadata['usedFormat'] is False
+    assert 'xelatex_pass_1' in metadata['timings']
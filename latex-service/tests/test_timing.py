@@ -0,0 +1,18 @@
+"""Tests for per-phase compile timings."""
+
+from utils.timing import PhaseTimer
+
+
+def test_phase_timer_accumulates_and_formats_server_timing():
+    timer = PhaseTimer()
+    timer.record('pdflatex_pass_1', 0.25)
+    timer.record('pdflatex_pass_1', 0.25)
+    timer.record('encode', 0.001)
+
+    assert timer.as_milliseconds() == {'pdflatex_pass_1': 500.0, 'encode': 1.0}
+    assert timer.server_timing() == 'pdflatex_pass_1;dur=500.0, encode;dur=1.0'
+
+
+def test_compile_metadata_includes_phase_timings(compiler, template, content):
+    timings = compiler.compile_resume(template, content)['metadata']['timings']
+    assert {'source_generation', 'file_write', 'pdflatex_pass_1', 'encode'} <= set(timings)
@@ -0,0 +1,64 @@
+"""Tests for request validation and LaTeX escaping."""
+
+import pytest
+
+from utils.validation import (
+    LATEX_ESCAPES, sanitize_content_tree, sanitize_latex_content, validate_compile_request
+)
+
+
+@pytest.mark.parametrize('raw, escaped', [
+    ('R&D', r'R\&D'),
+    ('100%', r'100\%'),
+    ('a_b', r'a\_b'),
+    ('{x}', r'\{x\}'),
+    ('2^10', r'2\textasciicircum{}10'),
+    ('~/bin', r'\textasciitilde{}/bin'),
+    ('C:\\dir', r'C:\textbackslash{}dir'),
+    ('\\{}', r'\textbackslash{}\{\}'),
+    ('a<b>c|d', r'a\textless{}b\textgreater{}c\textbar{}d'),
+    ('plain text', 'plain text')
+])
+def test_escapes_each_special_once(raw, escaped):
+    assert sanitize_latex_content(raw) == escaped
+
+
+def test_long_strings_match_per_character_reference():
+    specials = ''.join(LATEX_ESCAPES) + '\0'
+    text = ' '.join(f"word{index}{specials[index % len(specials)]}" for index in range(500))
+
+    expected = ''.join(LATEX_ESCAPES.get(char, char) for char in text)
+    assert sanitize_latex_content(text) == expected
+
+
+def test_content_tree_is_escaped_except_raw_fields(content):
+    content['personalInfo']['email'] = 'first_last@example.com'
+    content['skills'] = ['C#', 42]
+
+    escaped = sanitize_content_tree(content)
+
+    assert escaped['personalInfo']['email'] == 'first_last@example.com'
+    assert escaped['skills'] == ['C\\#', 42]
+    assert escaped['experience'][0]['bullets'] == [
+        sanitize_latex_content(bullet) for bullet in content['experience'][0]['bullets']
+    ]
+    assert content['skills'] == ['C#', 42]
+
+
+def test_valid_compile_request(content):
+    assert validate_compile_request({'templateId': 'resume', 'content': content}) == []
+
+
+def test_compile_request_requires_content():
+    errors = validate_compile_request({'templateId': 'resume'})
+    assert errors
+
+
+def test_generated_source_escapes_content(compiler, template, content):
+    content['summary'] = '100% & more_than_$5'
+
+    source = compiler._generate_latex_source(template, content, {})
+
+    assert '100\\% \\& more\\_than\\_\\$5' in source
+    assert 'jane_doe@example.com' in source
+    assert '{{' not in source